@@ -1,13 +1,16 @@
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Optional
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException, status
-from fastapi.responses import JSONResponse
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi.responses import JSONResponse, ORJSONResponse
 
 from app.controllers import AddressController
-from app.models import Address, User
+from app.models import Address
+from app.schemas.extras.current_user import UserSnapshot
 from app.schemas.requests.address import (AddressPartialUpdateRequest,
                                           AddressRequest, AddressUpdateRequest)
+from app.schemas.responses.address import AddressResponse, address_serializer
+from app.schemas.responses.pagination import CursorPage
 from core.exceptions import UnauthorizedException
 from core.factory import Factory
 from core.fastapi.dependencies import AuthenticationRequired, get_current_user
@@ -19,18 +22,48 @@ address_router: APIRouter = APIRouter(
 
 @address_router.get(
     "/",
+    response_model=List[AddressResponse],
+    response_class=ORJSONResponse,
 )
 async def get_address(
     skip: int = 0,
     limit: int = 20,
     address_controller: AddressController = Depends(Factory().get_address_controller),
-    current_user: User = Depends(get_current_user),
+    current_user: UserSnapshot = Depends(get_current_user),
 ):
-    return await address_controller.get_by_user_address(current_user.id, skip, limit)
+    addresses = await address_controller.get_by_user_address(
+        current_user.id, skip, limit
+    )
+    return ORJSONResponse(address_serializer.dump_many(addresses))
+
+
+@address_router.get(
+    "/page",
+    response_model=CursorPage[AddressResponse],
+    response_class=ORJSONResponse,
+)
+async def get_address_page(
+    cursor: Optional[str] = None,
+    limit: int = Query(20, ge=1, le=100),
+    address_controller: AddressController = Depends(Factory().get_address_controller),
+    current_user: UserSnapshot = Depends(get_current_user),
+):
+    """
+    List saved addresses with cursor pagination, pass `next_cursor` back as
+    `cursor` to get the following page
+    """
+    addresses, next_cursor = await address_controller.get_by_user_address_page(
+        current_user.id, limit=limit, cursor=cursor
+    )
+    return ORJSONResponse(
+        {"items": address_serializer.dump_many(addresses), "next_cursor": next_cursor}
+    )
 
 
 @address_router.get(
     "/{address_uuid}",
+    response_model=Optional[AddressResponse],
+    response_class=ORJSONResponse,
 )
 async def get_address_detail(
     address_uuid: UUID,
@@ -40,7 +73,7 @@ async def get_address_detail(
     Retrieve the details of a saved address
     """
     address: Address = await address_controller.get_by_uuid(address_uuid)
-    return address
+    return ORJSONResponse(address_serializer.dump(address) if address else None)
 
 
 @address_router.post(
@@ -49,7 +82,7 @@ async def get_address_detail(
 async def add_address(
     address_data: AddressRequest,
     address_controller: AddressController = Depends(Factory().get_address_controller),
-    current_user: User = Depends(get_current_user),
+    current_user: UserSnapshot = Depends(get_current_user),
 ):
     return await address_controller.add_user_address(current_user.id, address_data)
 
@@ -1,11 +1,19 @@
+from typing import Optional
+
 from fastapi import APIRouter, Depends, status
+from fastapi.responses import JSONResponse
+from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
 
 from app.controllers import AuthController
 from app.models import User
 from app.schemas.extras.token import Token
-from app.schemas.requests.users import LoginUserRequest, RegisterUserRequest
+from app.schemas.requests.users import (LoginUserRequest, LogoutRequest,
+                                       RefreshTokenRequest, RegisterUserRequest)
 from app.schemas.responses.users import UserResponse
+from core.config import config
 from core.factory import Factory
+from core.fastapi.dependencies import login_rate_limit
+from core.security import JWTHandler
 
 auth_router: APIRouter = APIRouter()
 
@@ -22,7 +30,7 @@ async def register_user(
     )
 
 
-@auth_router.post("/login")
+@auth_router.post("/login", dependencies=[Depends(login_rate_limit)])
 async def login_user(
     login_user_request: LoginUserRequest,
     auth_controller: AuthController = Depends(Factory().get_auth_controller),
@@ -32,35 +40,57 @@ async def login_user(
     )
 
 
+@auth_router.get("/.well-known/jwks.json")
+async def jwks() -> JSONResponse:
+    """
+    Public keys that verify our access tokens, peers can cache them for
+    `JWKS_MAX_AGE` seconds.
+
+    - **response**: JSON Web Key Set, keys are matched by the token's `kid`.
+    """
+    return JSONResponse(
+        JWTHandler.jwks(),
+        headers={"Cache-Control": f"public, max-age={config.JWKS_MAX_AGE}"},
+    )
+
+
 @auth_router.post("/logout")
-async def logout_user():
+async def logout_user(
+    logout_request: Optional[LogoutRequest] = None,
+    credentials: HTTPAuthorizationCredentials = Depends(HTTPBearer()),
+    auth_controller: AuthController = Depends(Factory().get_auth_controller),
+):
     """
     Log out the user.
 
+    - **refresh_token**: Optional, revoked together with the access token.
     - **response**: Confirms the user has been logged out.
     """
-    # Completion Steps:
-    # 1. Invalidate the access and refresh tokens in the database or cache.
-    # 2. Add logic to ensure the user cannot use the same tokens again.
+    await auth_controller.logout(
+        credentials.credentials,
+        refresh_token=logout_request.refresh_token if logout_request else None,
+    )
     return {
         "message": "You have been logged out.",
     }
 
 
 @auth_router.post("/refresh-token")
-async def refresh_token():
+async def refresh_token(
+    refresh_token_request: RefreshTokenRequest,
+    auth_controller: AuthController = Depends(Factory().get_auth_controller),
+) -> Token:
     """
     Refresh the access token using a valid refresh token.
 
-    - **response**: Returns a new access token.
+    - **access_token**: The current access token, it may have expired.
+    - **refresh_token**: The refresh token issued with it, usable once.
+    - **response**: Returns a new access and refresh token.
     """
-    # Completion Steps:
-    # 1. Extract the refresh token from the request.
-    # 2. Verify its validity and ensure it hasn't been revoked.
-    # 3. Issue a new access token for the user.
-    return {
-        "message": "You have been refreshed.",
-    }
+    return await auth_controller.refresh_token(
+        access_token=refresh_token_request.access_token,
+        refresh_token=refresh_token_request.refresh_token,
+    )
 
 
 @auth_router.get("/forgot-password")
@@ -1,8 +1,14 @@
 from fastapi import APIRouter
 
+from .database import database_router
 from .health import health_router
+from .metrics import metrics_router
 
 monitoring_router = APIRouter()
 monitoring_router.include_router(health_router, prefix="/health", tags=["Health"])
+monitoring_router.include_router(
+    database_router, prefix="/database", tags=["Health"]
+)
+monitoring_router.include_router(metrics_router, prefix="/metrics", tags=["Health"])
 
 __all__ = ["monitoring_router"]
@@ -0,0 +1,22 @@
+from fastapi import APIRouter
+
+from app.schemas.extras.database import DatabaseStatus, PoolStatus
+from core.database.pool import pool_stats
+from core.database.session import engines, readers
+
+database_router: APIRouter = APIRouter()
+
+
+@database_router.get("/")
+async def database() -> DatabaseStatus:
+    return DatabaseStatus(
+        writer=PoolStatus(name="writer", **pool_stats(engines["writer"])),
+        readers=[
+            PoolStatus(
+                name=f"reader-{index}",
+                **pool_stats(engine),
+                healthy=engine in readers.healthy,
+            )
+            for index, engine in enumerate(readers.engines)
+        ],
+    )
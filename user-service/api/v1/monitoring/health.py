@@ -1,6 +1,9 @@
-from fastapi import APIRouter
+from fastapi import APIRouter, Response, status
 
-from app.schemas.extras.health import Health
+from app.schemas.extras.health import Health, Readiness
+from core.config import config
+from core.database.pool import ping
+from core.database.session import engines
 
 health_router: APIRouter = APIRouter()
 
@@ -8,3 +11,18 @@ health_router: APIRouter = APIRouter()
 @health_router.get("/")
 async def health() -> Health:
     return Health(version="1.0.0", status="Health")
+
+
+@health_router.get(
+    "/ready", responses={status.HTTP_503_SERVICE_UNAVAILABLE: {"model": Readiness}}
+)
+async def ready(response: Response) -> Readiness:
+    """
+    Readiness probe: the worker only takes traffic when the primary database
+    answers. Replicas are left out, reads fall back to the primary without them.
+    """
+    error = await ping(engines["writer"], config.READINESS_TIMEOUT)
+    if error is not None:
+        response.status_code = status.HTTP_503_SERVICE_UNAVAILABLE
+        return Readiness(status="unavailable", checks={"database": error})
+    return Readiness(status="ready", checks={"database": "ok"})
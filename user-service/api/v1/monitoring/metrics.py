@@ -0,0 +1,11 @@
+from fastapi import APIRouter, Response
+
+from core.metrics import Metrics
+
+metrics_router: APIRouter = APIRouter()
+
+
+@metrics_router.get("/", response_class=Response)
+async def metrics() -> Response:
+    content, media_type = Metrics.render()
+    return Response(content=content, media_type=media_type)
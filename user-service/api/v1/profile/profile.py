@@ -1,24 +1,30 @@
 from fastapi import APIRouter, Depends
+from fastapi.responses import ORJSONResponse
 
-from app.models import User
-from app.schemas.responses.users import UserResponse, UserResponseDetail
+from app.schemas.extras.current_user import UserSnapshot
+from app.schemas.responses.users import UserResponseDetail, user_detail_serializer
 from core.fastapi.dependencies import AuthenticationRequired, get_current_user
 
 profile_router: APIRouter = APIRouter()
 
 
-@profile_router.get("/", dependencies=[Depends(AuthenticationRequired)])
-def get_user(
-    user: User = Depends(get_current_user),
-) -> UserResponseDetail:
-    return user
+@profile_router.get(
+    "/",
+    dependencies=[Depends(AuthenticationRequired)],
+    response_model=UserResponseDetail,
+    response_class=ORJSONResponse,
+)
+async def get_user(
+    user: UserSnapshot = Depends(get_current_user),
+):
+    return ORJSONResponse(user_detail_serializer.dump(user))
 
 
 @profile_router.put("/")
-async def update_profile(user: User = Depends(get_current_user)):
+async def update_profile(user: UserSnapshot = Depends(get_current_user)):
     return {"message": "User updated", "user": user}
 
 
 @profile_router.put("/password")
-async def update_password(user: User = Depends(get_current_user)):
+async def update_password(user: UserSnapshot = Depends(get_current_user)):
     return {"message": "User password updated", "user": user}
@@ -1,6 +1,6 @@
 from fastapi import APIRouter, Depends
 
-from app.models import User
+from app.schemas.extras.current_user import UserSnapshot
 from core.fastapi.dependencies import get_current_user
 
 user_router: APIRouter = APIRouter()
@@ -23,7 +23,7 @@ async def get_user_detail(user_id: str):
 
 
 @user_router.delete("/")
-async def delete_user(user: User = Depends(get_current_user)):
+async def delete_user(user: UserSnapshot = Depends(get_current_user)):
     return {
         "message": "Deleting user account by the admin",
         "task": "Deleting user account",
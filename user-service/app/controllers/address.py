@@ -1,4 +1,4 @@
-from typing import Any, Dict, Optional, Sequence
+from typing import Any, Dict, Optional, Sequence, Tuple
 from uuid import UUID
 
 from fastapi import status
@@ -9,6 +9,7 @@ from app.repositories import AddressRepository
 from app.schemas.requests.address import (AddressPartialUpdateRequest,
                                           AddressRequest, AddressUpdateRequest)
 from core.controller import BaseController
+from core.database import Propagation, Transactional
 from core.exceptions import BadRequestException, NotFoundException
 
 
@@ -18,6 +19,7 @@ class AddressController(BaseController[Address]):
 
         self.address_repository = address_repository
 
+    @Transactional(propagation=Propagation.READ_ONLY)
     async def get_by_user_address(
         self, user_id: int, skip: int = 0, limit: int = 20
     ) -> Sequence[Address]:
@@ -28,6 +30,17 @@ class AddressController(BaseController[Address]):
         except Exception as e:
             raise BadRequestException(f"Error getting address. {e}")
 
+    @Transactional(propagation=Propagation.READ_ONLY)
+    async def get_by_user_address_page(
+        self, user_id: int, limit: int = 20, cursor: Optional[str] = None
+    ) -> Tuple[Sequence[Address], Optional[str]]:
+        try:
+            return await self.address_repository.get_by_user_address_page(
+                user_id, limit=limit, cursor=cursor
+            )
+        except ValueError:
+            raise BadRequestException("Invalid cursor")
+
     async def add_user_address(self, user_id: int, address: AddressRequest) -> Address:
         data: Dict[str, Any] = address.model_dump()
         data.update(
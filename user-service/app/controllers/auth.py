@@ -1,4 +1,7 @@
+from typing import Any, Dict, Optional
+
 from pydantic import EmailStr
+from sqlalchemy.exc import IntegrityError
 
 from app.models import User
 from app.repositories import UserRepository
@@ -6,7 +9,7 @@ from app.schemas.extras.token import Token
 from core.controller import BaseController
 from core.database import Propagation, Transactional
 from core.exceptions import BadRequestException, UnauthorizedException
-from core.security import JWTHandler, PasswordHandler
+from core.security import JWTHandler, PasswordHandler, Revocations
 
 
 class AuthController(BaseController[User]):
@@ -16,49 +19,103 @@ class AuthController(BaseController[User]):
 
     @Transactional(propagation=Propagation.REQUIRED)
     async def register(self, email: EmailStr, password: str, username: str) -> User:
-        # Check if user exists with email
-        user = await self.user_repository.get_by_email(email)
-
-        if user:
-            raise BadRequestException("User already exists with this email")
+        # Hash before touching the database, the unique constraints on email and
+        # username do the existence checks as part of the insert
+        password = await PasswordHandler.hash_async(password)
 
-        # Check if user exists with username
-        user = await self.user_repository.get_by_username(username)
+        try:
+            return await self.user_repository.create(
+                {
+                    "email": email,
+                    "password": password,
+                    "username": username,
+                },
+                flush=True,
+            )
+        except IntegrityError as exception:
+            raise BadRequestException(
+                self._unique_violation_message(exception)
+            ) from exception
 
-        if user:
-            raise BadRequestException("User already exists with this username")
+    @staticmethod
+    def _unique_violation_message(exception: IntegrityError) -> str:
+        # asyncpg reports the violated constraint (e.g. "users_email_key") on the
+        # driver error that the DBAPI error wraps
+        constraint = ""
+        for error in (exception.orig, getattr(exception.orig, "__cause__", None)):
+            constraint = getattr(error, "constraint_name", None) or constraint
+        detail = constraint or str(exception.orig)
 
-        password = PasswordHandler.hash(password)
-
-        return await self.user_repository.create(
-            {
-                "email": email,
-                "password": password,
-                "username": username,
-            }
-        )
+        if "email" in detail:
+            return "User already exists with this email"
+        if "username" in detail:
+            return "User already exists with this username"
+        return "User already exists"
 
     async def login(self, email: EmailStr, password: str) -> Token:
-        user = await self.user_repository.get_by_email(email)
+        # Cached users carry no password hash, read this one from the database
+        user = await self.user_repository.get_by_email(email, cached=False)
 
         if not user:
             raise BadRequestException("Invalid credentials")
 
-        if not PasswordHandler.verify(user.password, password):
+        verified, new_hash = await PasswordHandler.verify_and_update_async(
+            user.password, password
+        )
+        if not verified:
             raise BadRequestException("Invalid credentials")
 
-        return Token(
-            access_token=JWTHandler.encode(payload={"user_id": user.id}),
-            refresh_token=JWTHandler.encode(payload={"sub": "refresh_token"}),
-        )
+        # The cost factor changed since this hash was stored, upgrade it in place
+        if new_hash:
+            await self.update_model(user, {"password": new_hash})
+
+        return self._issue_tokens(user.id)
 
     async def refresh_token(self, access_token: str, refresh_token: str) -> Token:
-        token = JWTHandler.decode(access_token)
+        # The access token may already have expired, that is what refreshing is for
+        token = JWTHandler.decode_expire(access_token)
         refresh_token = JWTHandler.decode(refresh_token)
-        if refresh_token.get("sub") != "refresh_token":
+        if token.get("sub") == "refresh_token":
+            raise UnauthorizedException("Invalid access token")
+        if refresh_token.get("sub") != "refresh_token" or not refresh_token.get("jti"):
+            raise UnauthorizedException("Invalid refresh token")
+        if refresh_token.get("user_id", token.get("user_id")) != token.get("user_id"):
             raise UnauthorizedException("Invalid refresh token")
 
+        # Asked of the store, this worker's filter may not have caught up yet
+        # with a logout handled by another worker
+        if token.get("jti") and await Revocations.is_revoked(
+            token["jti"], use_filter=False
+        ):
+            raise UnauthorizedException("Access token revoked")
+
+        # Refresh tokens are single use. Claiming one is atomic, so of two
+        # concurrent refreshes with the same token only one gets new tokens
+        if not await Revocations.claim(refresh_token["jti"], refresh_token["exp"]):
+            raise UnauthorizedException("Refresh token revoked")
+
+        await self._revoke(token)
+        return self._issue_tokens(token.get("user_id"))
+
+    async def logout(
+        self, access_token: str, refresh_token: Optional[str] = None
+    ) -> None:
+        claims = [JWTHandler.decode_expire(access_token)]
+        if refresh_token:
+            claims.append(JWTHandler.decode_expire(refresh_token))
+        await self._revoke(*claims)
+
+    @staticmethod
+    async def _revoke(*claims: Dict[str, Any]) -> None:
+        for claim in claims:
+            if claim.get("jti") and claim.get("exp"):
+                await Revocations.revoke(claim["jti"], claim["exp"])
+
+    @staticmethod
+    def _issue_tokens(user_id: int) -> Token:
         return Token(
-            access_token=JWTHandler.encode(payload={"user_id": token.get("user_id")}),
-            refresh_token=JWTHandler.encode(payload={"sub": "refresh_token"}),
+            access_token=JWTHandler.encode(payload={"user_id": user_id}),
+            refresh_token=JWTHandler.encode(
+                payload={"sub": "refresh_token", "user_id": user_id}
+            ),
         )
@@ -1,13 +1,13 @@
 from enum import StrEnum
 from typing import Optional
-from uuid import uuid4
 
-from sqlalchemy import BigInteger, Enum, ForeignKey, Unicode
+from sqlalchemy import BigInteger, Enum, ForeignKey, Index, Unicode
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from core.database import Base
 from core.database.mixins import TimestampMixin, UserAuditMixin
+from core.utils import generate_uuid
 
 
 class AddressType(StrEnum):
@@ -17,10 +17,15 @@ class AddressType(StrEnum):
 
 class Address(Base, TimestampMixin, UserAuditMixin):
     __tablename__ = "address"
+    __table_args__ = (
+        # Serves the per-user listing and its keyset pagination on id
+        Index("ix_address_user_id_id", "user_id", "id"),
+        *UserAuditMixin.audit_indexes("address"),
+    )
 
     id: Mapped[int] = mapped_column(BigInteger, primary_key=True, autoincrement=True)
     uuid: Mapped[UUID] = mapped_column(
-        UUID(as_uuid=True), default=uuid4, unique=True, nullable=False
+        UUID(as_uuid=True), default=generate_uuid, unique=True, nullable=False
     )
     street_address: Mapped[str] = mapped_column(Unicode(255), nullable=False)
     apartment: Mapped[Optional[str]] = mapped_column(Unicode(255), nullable=True)
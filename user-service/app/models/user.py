@@ -1,11 +1,10 @@
-from uuid import uuid4
-
 from sqlalchemy import BigInteger, Boolean, Unicode
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from core.database import Base
 from core.database.mixins import TimestampMixin, UserAuditMixin
+from core.utils import generate_uuid
 
 
 class User(Base, TimestampMixin, UserAuditMixin):
@@ -13,7 +12,7 @@ class User(Base, TimestampMixin, UserAuditMixin):
 
     id: Mapped[int] = mapped_column(BigInteger, primary_key=True, autoincrement=True)
     uuid: Mapped[UUID] = mapped_column(
-        UUID(as_uuid=True), default=uuid4, unique=True, nullable=False
+        UUID(as_uuid=True), default=generate_uuid, unique=True, nullable=False
     )
     email: Mapped[str] = mapped_column(Unicode(255), unique=True, nullable=False)
     password: Mapped[str] = mapped_column(Unicode(255), nullable=False)
@@ -1,4 +1,4 @@
-from typing import Sequence
+from typing import Optional, Sequence, Tuple
 
 from app.models import Address
 from core.repository import BaseRepository
@@ -13,3 +13,8 @@ class AddressRepository(BaseRepository[Address]):
         self, user_id: int, skip: int = 0, limit: int = 20
     ) -> Sequence[Address]:
         return await self.get_all(skip, limit, filters={"user_id": user_id})
+
+    async def get_by_user_address_page(
+        self, user_id: int, limit: int = 20, cursor: Optional[str] = None
+    ) -> Tuple[Sequence[Address], Optional[str]]:
+        return await self.get_page(limit, cursor, filters={"user_id": user_id})
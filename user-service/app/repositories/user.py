@@ -7,8 +7,12 @@ class UserRepository(BaseRepository[User]):
     User repository provides all the database operations for the User model.
     """
 
+    cache_fields = ("id", "uuid", "email", "username")
+    # Password hashes never leave the database
+    cache_exclude = ("password",)
+
     async def get_by_username(self, username: str) -> User | None:
         return await self.get_by(field="username", value=username)
 
-    async def get_by_email(self, email: str) -> User | None:
-        return await self.get_by(field="email", value=email)
+    async def get_by_email(self, email: str, cached: bool = True) -> User | None:
+        return await self.get_by(field="email", value=email, cached=cached)
@@ -1,4 +1,6 @@
-from typing import Optional
+from dataclasses import dataclass, fields
+from typing import Any, Optional
+from uuid import UUID
 
 from pydantic import BaseModel, Field
 
@@ -8,3 +10,25 @@ class CurrentUser(BaseModel):
 
     class Config:
         validate_assignment = True
+
+
+@dataclass(frozen=True, slots=True)
+class UserSnapshot:
+    """
+    Read-only view of the authenticated user's row, cheap to keep in memory.
+    Deliberately leaves out the password hash and the audit columns.
+    """
+
+    id: int
+    uuid: UUID
+    email: str
+    username: str
+    is_admin: bool
+    is_active: bool
+    email_verified: bool
+    profile_image_url: Optional[str] = None
+    phone_number: Optional[str] = None
+
+    @classmethod
+    def from_model(cls, user: Any) -> "UserSnapshot":
+        return cls(**{field.name: getattr(user, field.name) for field in fields(cls)})
@@ -0,0 +1,23 @@
+from typing import List, Optional
+
+from pydantic import BaseModel, Field
+
+
+class PoolStatus(BaseModel):
+    # Engines are labelled as in the metrics, the endpoint is public and
+    # connection URLs would reveal hosts, users and database names
+    name: str = Field(..., examples=["writer", "reader-0"])
+    size: int = Field(..., examples=[10])
+    checked_in: int = Field(..., examples=[8])
+    checked_out: int = Field(..., examples=[2])
+    overflow: int = Field(..., examples=[0])
+    waits: Optional[int] = Field(None, examples=[1024])
+    wait_time_avg: Optional[float] = Field(None, examples=[0.0004])
+    wait_time_max: Optional[float] = Field(None, examples=[0.12])
+    timeouts: Optional[int] = Field(None, examples=[0])
+    healthy: bool = Field(True, examples=[True])
+
+
+class DatabaseStatus(BaseModel):
+    writer: PoolStatus
+    readers: List[PoolStatus] = Field(default_factory=list)
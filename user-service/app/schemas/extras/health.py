@@ -1,6 +1,15 @@
+from typing import Dict
+
 from pydantic import BaseModel, Field
 
 
 class Health(BaseModel):
     version: str = Field(..., examples=["1.0.1"])
     status: str = Field(..., examples=["online", "offline"])
+
+
+class Readiness(BaseModel):
+    status: str = Field(..., examples=["ready", "unavailable"])
+    checks: Dict[str, str] = Field(
+        ..., examples=[{"database": "ok"}, {"database": "no answer within 2.0s"}]
+    )
@@ -1,12 +1,29 @@
 from typing import Optional
 
-import pycountry
 from pydantic import BaseModel, Field, field_validator
 
 from app.models import AddressType
+from core.utils import normalize_country
 
 
-class AddressRequest(BaseModel):
+class AddressLocationMixin:
+    """
+    Rejects unknown countries and stores ``country`` as sent, "UK" stays "UK".
+
+    ``state`` is free text: ISO 3166-2 lists administrative names ("Bayern",
+    council areas) rather than the ones people write ("Bavaria", "Greater
+    London"), so it is not checked.
+    """
+
+    @field_validator("country", check_fields=False)
+    @classmethod
+    def validate_country(cls, value: Optional[str]) -> Optional[str]:
+        if value is not None:
+            normalize_country(value)
+        return value
+
+
+class AddressRequest(AddressLocationMixin, BaseModel):
     street_address: str = Field(..., examples=["123-A Main Street"])
     apartment: Optional[str] = Field(None, examples=["Apt 128"])
     city: str = Field(..., examples=["Karachi"])
@@ -18,7 +35,7 @@ class AddressRequest(BaseModel):
     )
 
 
-class AddressUpdateRequest(BaseModel):
+class AddressUpdateRequest(AddressLocationMixin, BaseModel):
     street_address: str = Field(..., examples=["123-A Main Street"])
     apartment: str = Field(..., examples=["Apt 128"])
     city: str = Field(..., examples=["Karachi"])
@@ -30,7 +47,7 @@ class AddressUpdateRequest(BaseModel):
     )
 
 
-class AddressPartialUpdateRequest(BaseModel):
+class AddressPartialUpdateRequest(AddressLocationMixin, BaseModel):
     street_address: Optional[str] = Field(None, examples=["123-A Main Street"])
     apartment: Optional[str] = Field(None, examples=["Apt 128"])
     city: Optional[str] = Field(None, examples=["Karachi"])
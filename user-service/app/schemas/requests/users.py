@@ -12,3 +12,12 @@ class RegisterUserRequest(BaseModel):
 class LoginUserRequest(BaseModel):
     email: EmailStr = Field(...)
     password: str = Field(..., min_length=8, max_length=64)
+
+
+class RefreshTokenRequest(BaseModel):
+    access_token: str = Field(...)
+    refresh_token: str = Field(...)
+
+
+class LogoutRequest(BaseModel):
+    refresh_token: str | None = Field(None)
@@ -0,0 +1,24 @@
+from typing import Optional
+from uuid import UUID
+
+from pydantic import BaseModel, Field
+
+from app.models import AddressType
+from core.fastapi.serializers import Serializer
+
+
+class AddressResponse(BaseModel):
+    uuid: UUID = Field(..., examples=["a3b8f042-1e16-4f0a-a8f0-421e16df0a2f"])
+    street_address: str = Field(..., examples=["123-A Main Street"])
+    apartment: Optional[str] = Field(None, examples=["Apt 128"])
+    city: str = Field(..., examples=["Karachi"])
+    state: Optional[str] = Field(None, examples=["Sindh"])
+    country: str = Field(..., examples=["Pakistan"])
+    postal_code: Optional[str] = Field(None, examples=["7400"])
+    address_type: AddressType = Field(..., examples=[AddressType.SHIPPING])
+
+    class Config:
+        from_attributes = True
+
+
+address_serializer = Serializer(AddressResponse)
@@ -0,0 +1,12 @@
+from typing import Generic, List, Optional, TypeVar
+
+from pydantic import BaseModel, Field
+
+ItemType = TypeVar("ItemType")
+
+
+class CursorPage(BaseModel, Generic[ItemType]):
+    items: List[ItemType]
+    next_cursor: Optional[str] = Field(
+        None, description="Pass as `cursor` to fetch the next page, null on the last page"
+    )
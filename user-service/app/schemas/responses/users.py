@@ -1,10 +1,14 @@
-from pydantic import UUID4, BaseModel, EmailStr, Field
+from uuid import UUID
+
+from pydantic import BaseModel, EmailStr, Field
+
+from core.fastapi.serializers import Serializer
 
 
 class UserResponse(BaseModel):
     email: EmailStr = Field(..., examples=["john.doe@example.com"])
     username: str = Field(..., examples=["john.doe"])
-    uuid: UUID4 = Field(..., examples=["a3b8f042-1e16-4f0a-a8f0-421e16df0a2f"])
+    uuid: UUID = Field(..., examples=["a3b8f042-1e16-4f0a-a8f0-421e16df0a2f"])
 
     class Config:
         form_attributes = True
@@ -15,3 +19,7 @@ class UserResponseDetail(UserResponse):
     is_admin: bool = Field(False, examples=["true", "false"])
     email_verified: bool
     profile_image_url: str | None = None
+
+
+user_serializer = Serializer(UserResponse)
+user_detail_serializer = Serializer(UserResponseDetail)
@@ -0,0 +1,55 @@
+"""Helpers for the benchmarks that drive an ASGI stack without a server."""
+
+import argparse
+import time
+from typing import Any, Callable, Dict, Iterable, Optional, Tuple
+
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+
+def parse_args(doc: str) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=doc.splitlines()[1])
+    parser.add_argument("--requests", type=int, default=20_000)
+    return parser.parse_args()
+
+
+def endpoint(before: Optional[Callable[[Scope], Any]] = None) -> ASGIApp:
+    """An empty 200 response, after calling ``before`` with the scope."""
+
+    async def app(scope: Scope, receive: Receive, send: Send) -> None:
+        if before is not None:
+            before(scope)
+        await send({"type": "http.response.start", "status": 200, "headers": []})
+        await send({"type": "http.response.body", "body": b""})
+
+    return app
+
+
+def make_scope(
+    path: str = "/", headers: Iterable[Tuple[bytes, bytes]] = ()
+) -> Dict[str, Any]:
+    return {"type": "http", "method": "GET", "path": path, "headers": list(headers)}
+
+
+async def receive() -> Dict[str, Any]:
+    return {"type": "http.request", "body": b""}
+
+
+async def send(message: Dict[str, Any]) -> None:
+    pass
+
+
+async def run(
+    name: str,
+    app: ASGIApp,
+    requests: int,
+    path: str = "/",
+    headers: Iterable[Tuple[bytes, bytes]] = (),
+    width: int = 24,
+) -> None:
+    headers = list(headers)
+    started = time.perf_counter()
+    for _ in range(requests):
+        await app(make_scope(path, headers), receive, send)
+    elapsed = (time.perf_counter() - started) / requests * 1_000_000
+    print(f"{name:>{width}}: {elapsed:,.1f} µs/request")
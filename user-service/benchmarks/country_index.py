@@ -0,0 +1,74 @@
+"""
+Import time and memory of address validation with pycountry vs the pickled
+country index.
+
+Each variant runs in a fresh interpreter that already imported the service's
+config, loads the lookup data and validates one country and state, then
+reports the wall time it took and how much the resident set grew (read from
+/proc, so Linux only), i.e. what every worker pays.
+
+    python -m benchmarks.country_index
+"""
+
+import argparse
+import json
+import subprocess
+import sys
+
+MEASURE = """
+import json, os, time
+def rss():
+    with open("/proc/self/statm") as statm:
+        return int(statm.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+{prelude}
+before = rss()
+started = time.perf_counter()
+{setup}
+elapsed = time.perf_counter() - started
+print(json.dumps({{"ms": elapsed * 1000, "rss": rss() - before}}))
+"""
+
+# The service loads its config and modules either way, only the lookup data
+# is timed
+PRELUDE = "import core.utils.countries"
+
+VARIANTS = {
+    "pycountry": """
+import pycountry
+country = pycountry.countries.lookup("pak")
+[s for s in pycountry.subdivisions.get(country_code=country.alpha_2) if s.name == "Sindh"]
+""",
+    "country index": """
+from core.utils import normalize_country, normalize_subdivision
+normalize_subdivision(normalize_country("pak"), "sindh")
+""",
+}
+
+
+def measure(setup: str) -> dict:
+    output = subprocess.run(
+        [sys.executable, "-c", MEASURE.format(prelude=PRELUDE, setup=setup)],
+        check=True,
+        capture_output=True,
+        text=True,
+    ).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--runs", type=int, default=5)
+    args = parser.parse_args()
+
+    # Builds the pickle if it is missing, so the runs below only load it
+    measure(VARIANTS["country index"])
+
+    for name, setup in VARIANTS.items():
+        runs = [measure(setup) for _ in range(args.runs)]
+        best = min(run["ms"] for run in runs)
+        rss = min(run["rss"] for run in runs)
+        print(f"{name:>14}: {best:,.1f} ms, +{rss / 1024 / 1024:,.1f} MiB RSS")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,52 @@
+"""
+Per-call overhead of building the ``get_by`` statement fresh vs reusing it.
+
+Runs without a database: each iteration does what ``Session.execute`` does
+before reaching the driver, building the statement and generating its cache
+key, then compiling it for asyncpg the first time that key is seen. The fresh
+variant is the old ``select(model).where(column == value)`` path; the cached
+variant is ``lookup_statement``.
+
+    python -m benchmarks.get_by_statement --calls 100000
+"""
+
+import argparse
+import time
+from typing import Any, Callable, Dict
+
+from sqlalchemy import select
+from sqlalchemy.dialects.postgresql.asyncpg import dialect as asyncpg_dialect
+
+from app.models import User
+from core.repository.statements import lookup_statement
+
+
+def run(name: str, build: Callable[[int], Any], calls: int) -> float:
+    dialect = asyncpg_dialect()
+    compiled: Dict[Any, Any] = {}
+
+    started = time.perf_counter()
+    for value in range(calls):
+        statement = build(value)
+        key = statement._generate_cache_key().key
+        if key not in compiled:
+            compiled[key] = statement.compile(dialect=dialect)
+    elapsed = time.perf_counter() - started
+
+    per_call = elapsed / calls * 1_000_000
+    print(f"{name}: {per_call:,.1f} µs/call, {len(compiled)} compilation(s)")
+    return per_call
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--calls", type=int, default=50_000)
+    args = parser.parse_args()
+
+    fresh = run("fresh", lambda value: select(User).where(User.id == value), args.calls)
+    cached = run("cached", lambda value: lookup_statement(User, "id"), args.calls)
+    print(f"speedup: {fresh / cached:,.1f}x")
+
+
+if __name__ == "__main__":
+    main()
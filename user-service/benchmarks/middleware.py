@@ -0,0 +1,66 @@
+"""
+Per-request overhead of the authentication and session middleware.
+
+Drives the ASGI stack directly, without a server or a database, with a bare
+endpoint at the bottom. Compares the previous Starlette
+``AuthenticationMiddleware`` + ``SQLAlchemyMiddleware`` stack against
+``RequestContextMiddleware`` for a health probe, an authenticated request that
+reads ``request.user`` and one that never does.
+
+    python -m benchmarks.middleware --requests 50000
+"""
+
+import asyncio
+from typing import List, Tuple
+
+from starlette.middleware.authentication import AuthenticationMiddleware
+from starlette.requests import Request
+from starlette.types import ASGIApp, Scope
+
+from core.config import config
+from core.fastapi.middlewares import (AuthBackend, RequestContextMiddleware,
+                                      SQLAlchemyMiddleware)
+from core.security import JWTHandler
+
+from ._asgi import endpoint, parse_args, run
+
+
+def read_user(scope: Scope) -> None:
+    Request(scope).user.id
+
+
+def stacks(reads_user: bool) -> List[Tuple[str, ASGIApp]]:
+    inner = endpoint(read_user if reads_user else None)
+    return [
+        (
+            "auth + sqlalchemy",
+            AuthenticationMiddleware(SQLAlchemyMiddleware(inner), backend=AuthBackend()),
+        ),
+        (
+            "request context",
+            RequestContextMiddleware(
+                inner, backend=AuthBackend(), public_paths=config.PUBLIC_PATHS
+            ),
+        ),
+    ]
+
+
+async def main() -> None:
+    args = parse_args(__doc__)
+
+    token = JWTHandler.encode({"user_id": 1})
+    cases = [
+        ("health probe", "/v1/monitoring/health/", False),
+        ("reads request.user", "/v1/profile/", True),
+        ("never reads request.user", "/v1/profile/", False),
+    ]
+    headers = [(b"authorization", f"Bearer {token}".encode())]
+    for case, path, reads_user in cases:
+        for name, app in stacks(reads_user):
+            await run(
+                f"{case} / {name}", app, args.requests, path, headers, width=44
+            )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,80 @@
+"""
+Encoding cost of an address list through FastAPI's default path vs the
+precompiled serializer and orjson.
+
+The default path validates every object into ``AddressResponse`` and encodes
+it with ``jsonable_encoder`` and the stdlib encoder, as a route with a response
+model does. The fast path dumps with ``address_serializer`` and ``orjson``.
+
+    python -m benchmarks.serialization --items 1000 --rounds 200
+"""
+
+import argparse
+import json
+import time
+from typing import Any, Callable, List
+
+import orjson
+from fastapi.encoders import jsonable_encoder
+from pydantic import TypeAdapter
+
+from app.models import Address, AddressType
+from app.schemas.responses.address import AddressResponse, address_serializer
+from core.utils import generate_uuid
+
+
+def addresses(count: int) -> List[Address]:
+    return [
+        Address(
+            id=index,
+            uuid=generate_uuid(),
+            street_address=f"{index} Main Street",
+            apartment=None,
+            city="Karachi",
+            state="Sindh",
+            country="Pakistan",
+            postal_code="74000",
+            address_type=AddressType.SHIPPING,
+            user_id=1,
+        )
+        for index in range(count)
+    ]
+
+
+def run(name: str, encode: Callable[[List[Any]], bytes], items, rounds: int) -> float:
+    started = time.perf_counter()
+    for _ in range(rounds):
+        encode(items)
+    elapsed = (time.perf_counter() - started) / rounds * 1000
+    print(f"{name}: {elapsed:,.2f} ms per {len(items)} items")
+    return elapsed
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--items", type=int, default=1_000)
+    parser.add_argument("--rounds", type=int, default=100)
+    args = parser.parse_args()
+
+    items = addresses(args.items)
+    adapter = TypeAdapter(List[AddressResponse])
+
+    default = run(
+        "pydantic + json",
+        lambda objs: json.dumps(
+            jsonable_encoder(adapter.validate_python(objs, from_attributes=True))
+        ).encode(),
+        items,
+        args.rounds,
+    )
+    fast = run(
+        "serializer + orjson",
+        lambda objs: orjson.dumps(address_serializer.dump_many(objs)),
+        items,
+        args.rounds,
+    )
+    print(f"speedup: {default / fast:,.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,64 @@
+"""
+Per-request cost of the session scope on a route that never touches the
+database.
+
+Runs ``SQLAlchemyMiddleware`` around a bare endpoint, without a server or a
+database, and compares it with the previous eager scope, which generated a
+``uuid4`` id and removed the session on every request. A route that does use
+the session is included for reference, it only builds the session object and
+never connects.
+
+    python -m benchmarks.session_scope --requests 50000
+"""
+
+import asyncio
+from uuid import uuid4
+
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+from core.database import (SessionScope, reset_session_context, session,
+                           set_session_context)
+from core.fastapi.middlewares import SQLAlchemyMiddleware
+
+from ._asgi import endpoint, parse_args, run
+
+
+class EagerSessionScope(SessionScope):
+    __slots__ = ()
+
+    def __init__(self) -> None:
+        self._id = str(uuid4())
+
+
+class EagerSQLAlchemyMiddleware:
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        context = set_session_context(EagerSessionScope())
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            await session.remove()
+            reset_session_context(context=context)
+
+
+def use_session(scope: Scope) -> None:
+    session.info
+
+
+async def main() -> None:
+    args = parse_args(__doc__)
+
+    cases = [
+        ("db-free / eager", EagerSQLAlchemyMiddleware(endpoint())),
+        ("db-free / lazy", SQLAlchemyMiddleware(endpoint())),
+        ("uses session / eager", EagerSQLAlchemyMiddleware(endpoint(use_session))),
+        ("uses session / lazy", SQLAlchemyMiddleware(endpoint(use_session))),
+    ]
+    for name, app in cases:
+        await run(name, app, args.requests)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,71 @@
+"""
+Insert throughput and index size of random (v4) vs time-ordered (v7) UUID keys.
+
+Creates two scratch tables shaped like ``users`` (bigint primary key plus a
+unique uuid column) in the test database, fills them in batches and reports
+rows per second and the size of the uuid index. The tables are dropped again
+at the end.
+
+    python -m benchmarks.uuid_insert --rows 500000 --batch 5000
+"""
+
+import argparse
+import asyncio
+import time
+from typing import Callable
+from uuid import UUID, uuid4
+
+import asyncpg
+
+from core.config import config
+from core.utils import uuid7
+
+
+async def run(
+    connection: asyncpg.Connection,
+    name: str,
+    generator: Callable[[], UUID],
+    rows: int,
+    batch: int,
+) -> None:
+    table = f"bench_uuid_{name}"
+    await connection.execute(f"DROP TABLE IF EXISTS {table}")
+    await connection.execute(
+        f"CREATE TABLE {table} (id BIGSERIAL PRIMARY KEY, uuid UUID NOT NULL UNIQUE)"
+    )
+
+    started = time.perf_counter()
+    for _ in range(0, rows, batch):
+        await connection.executemany(
+            f"INSERT INTO {table} (uuid) VALUES ($1)",
+            [(generator(),) for _ in range(batch)],
+        )
+    elapsed = time.perf_counter() - started
+
+    index_size = await connection.fetchval(
+        f"SELECT pg_relation_size('{table}_uuid_key')"
+    )
+    print(
+        f"{name}: {rows / elapsed:,.0f} rows/s, "
+        f"uuid index {index_size / 1024 / 1024:,.1f} MiB"
+    )
+    await connection.execute(f"DROP TABLE {table}")
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--rows", type=int, default=200_000)
+    parser.add_argument("--batch", type=int, default=5_000)
+    parser.add_argument("--dsn", default=config.TEST_POSTGRES_URL)
+    args = parser.parse_args()
+
+    connection = await asyncpg.connect(args.dsn)
+    try:
+        await run(connection, "v4", uuid4, args.rows, args.batch)
+        await run(connection, "v7", uuid7, args.rows, args.batch)
+    finally:
+        await connection.close()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
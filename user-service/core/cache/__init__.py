@@ -0,0 +1,14 @@
+from .base import BaseBackend
+from .cache_manager import Cache, CacheManager
+from .lru import LRUCache
+from .memory_backend import InMemoryBackend
+from .redis_backend import RedisBackend
+
+__all__ = [
+    "BaseBackend",
+    "Cache",
+    "CacheManager",
+    "InMemoryBackend",
+    "LRUCache",
+    "RedisBackend",
+]
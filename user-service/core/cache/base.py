@@ -0,0 +1,18 @@
+from abc import ABC, abstractmethod
+from typing import Iterable, Optional
+
+
+class BaseBackend(ABC):
+    """Interface every cache backend has to implement."""
+
+    @abstractmethod
+    async def get(self, key: str) -> Optional[bytes]: ...
+
+    @abstractmethod
+    async def set(self, key: str, value: bytes, ttl: Optional[int] = None) -> None: ...
+
+    @abstractmethod
+    async def delete(self, keys: Iterable[str]) -> None: ...
+
+    @abstractmethod
+    async def close(self) -> None: ...
@@ -0,0 +1,213 @@
+import logging
+from datetime import date, datetime, time
+from functools import lru_cache, wraps
+from typing import (Any, Callable, Dict, Iterable, List, Optional, Set, Tuple,
+                    Type)
+from uuid import UUID
+
+import orjson
+from sqlalchemy import inspect
+from sqlalchemy.orm import make_transient_to_detached
+
+from .base import BaseBackend
+
+logger = logging.getLogger(__name__)
+
+PENDING_INVALIDATIONS = "cache_pending_invalidations"
+# Set in session.info by the routing session when a read went to a replica
+REPLICA_READ = "replica_read"
+
+# Types orjson writes as strings, rebuilt from the column's Python type on a hit
+PARSERS: Dict[type, Callable[[str], Any]] = {
+    datetime: datetime.fromisoformat,
+    date: date.fromisoformat,
+    time: time.fromisoformat,
+    UUID: UUID,
+}
+
+
+@lru_cache(maxsize=None)
+def column_parsers(model: Type[Any]) -> Dict[str, Callable[[str], Any]]:
+    parsers = {}
+    for attribute in inspect(model).column_attrs:
+        try:
+            python_type = attribute.columns[0].type.python_type
+        except NotImplementedError:
+            continue
+        if python_type in PARSERS:
+            parsers[attribute.key] = PARSERS[python_type]
+    return parsers
+
+
+class CacheManager:
+    """
+    Read-through cache for repository lookups.
+
+    Entries are namespaced per model and lookup field, i.e.
+    ``<prefix>:<tablename>:<field>:<value>``. Only column values are stored, as
+    JSON, so nothing read back from the backend is ever executed. The ORM
+    instance is rebuilt on a hit and merged into the caller's session without
+    emitting a SELECT.
+
+    Every backend error is logged and treated as a miss, the database stays the
+    source of truth.
+    """
+
+    def __init__(self) -> None:
+        self.backend: Optional[BaseBackend] = None
+        self.prefix: str = "cache"
+        self.ttl: int = 60
+        self.listeners: List[Callable[[Set[str]], None]] = []
+
+    def init(self, backend: BaseBackend, prefix: str = "cache", ttl: int = 60) -> None:
+        self.backend = backend
+        self.prefix = prefix
+        self.ttl = ttl
+
+    @property
+    def enabled(self) -> bool:
+        return self.backend is not None
+
+    async def close(self) -> None:
+        if self.backend is not None:
+            await self.backend.close()
+            self.backend = None
+
+    def subscribe(self, listener: Callable[[Set[str]], None]) -> None:
+        """
+        Registers a callback that receives every set of keys invalidated after
+        a commit, so process-local caches can drop their copies too.
+        """
+        self.listeners.append(listener)
+
+    def make_key(self, model: Type[Any], field: str, value: Any) -> str:
+        return f"{self.prefix}:{model.__tablename__}:{field}:{value}"
+
+    def keys_for(self, instance: Any, fields: Iterable[str]) -> Set[str]:
+        """
+        Returns the cache keys under which the instance may currently be stored.
+        """
+        model = type(instance)
+        return {
+            self.make_key(model, field, getattr(instance, field))
+            for field in fields
+            if getattr(instance, field, None) is not None
+        }
+
+    async def get(self, key: str) -> Optional[Dict[str, Any]]:
+        if self.backend is None:
+            return None
+        try:
+            value = await self.backend.get(key)
+            return orjson.loads(value) if value is not None else None
+        except Exception as exception:
+            logger.warning("Cache get failed for %s: %s", key, exception)
+            return None
+
+    async def set(
+        self, key: str, value: Dict[str, Any], ttl: Optional[int] = None
+    ) -> None:
+        if self.backend is None:
+            return
+        try:
+            await self.backend.set(key, orjson.dumps(value), ttl or self.ttl)
+        except Exception as exception:
+            logger.warning("Cache set failed for %s: %s", key, exception)
+
+    async def delete(self, keys: Iterable[str]) -> None:
+        if self.backend is None:
+            return
+        try:
+            await self.backend.delete(keys)
+        except Exception as exception:
+            logger.warning("Cache delete failed: %s", exception)
+
+    @staticmethod
+    def dump_instance(instance: Any, exclude: Tuple[str, ...] = ()) -> Dict[str, Any]:
+        return {
+            attribute.key: getattr(instance, attribute.key)
+            for attribute in inspect(type(instance)).column_attrs
+            if attribute.key not in exclude
+        }
+
+    @staticmethod
+    def load_instance(model: Type[Any], data: Dict[str, Any]) -> Any:
+        """
+        Rebuilds a detached, unmodified instance from cached column values.
+        Columns left out of the entry stay unloaded.
+        """
+        for key, parse in column_parsers(model).items():
+            if data.get(key) is not None:
+                data[key] = parse(data[key])
+        instance = model(**data)
+        make_transient_to_detached(instance)
+        return instance
+
+    def mark_stale(self, session: Any, keys: Iterable[str]) -> None:
+        """
+        Schedules keys for deletion once the session's transaction commits.
+        Deleting after the commit keeps a concurrent reader from re-populating
+        the entry with the pre-update row.
+        """
+        session.info.setdefault(PENDING_INVALIDATIONS, set()).update(keys)
+
+    async def invalidate_pending(self, session: Any) -> None:
+        keys = session.info.pop(PENDING_INVALIDATIONS, None)
+        if not keys:
+            return
+        for listener in self.listeners:
+            listener(keys)
+        await self.delete(keys)
+
+    def discard_pending(self, session: Any) -> None:
+        session.info.pop(PENDING_INVALIDATIONS, None)
+
+    def cached_lookup(self, ttl: Optional[int] = None):
+        """
+        Decorates a repository ``get_by(field, value)`` method.
+
+        The repository must expose ``model``, ``session``, ``cache_fields`` and
+        ``cache_exclude``; lookups on any other field go straight to the
+        database, and excluded columns are never written to the cache. Misses
+        are not cached, so existence checks never see a stale ``None``, and
+        neither are rows read from a replica.
+        """
+
+        def decorator(function):
+            @wraps(function)
+            async def wrapper(repository, field: str, value: Any, **kwargs):
+                # Projected lookups return rows, not instances, and skip the
+                # cache, as do callers asking for a fresh row
+                if (
+                    not self.enabled
+                    or kwargs.get("projection") is not None
+                    or not kwargs.get("cached", True)
+                    or field not in repository.cache_fields
+                ):
+                    return await function(repository, field, value, **kwargs)
+
+                key = self.make_key(repository.model, field, value)
+                data = await self.get(key)
+                if data is not None:
+                    instance = self.load_instance(repository.model, data)
+                    return await repository.session.merge(instance, load=False)
+
+                instance = await function(repository, field, value)
+                # A lagging replica may still return the row as it was before
+                # the commit that invalidated this key
+                if instance is not None and not repository.session.info.get(
+                    REPLICA_READ
+                ):
+                    await self.set(
+                        key,
+                        self.dump_instance(instance, repository.cache_exclude),
+                        ttl,
+                    )
+                return instance
+
+            return wrapper
+
+        return decorator
+
+
+Cache = CacheManager()
@@ -0,0 +1,69 @@
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Generic, Hashable, Optional, Tuple, TypeVar
+
+ValueType = TypeVar("ValueType")
+
+
+class LRUCache(Generic[ValueType]):
+    """
+    Bounded, process-local LRU cache with a time-to-live per entry.
+
+    Not shared between workers; anything stored here has to tolerate being up
+    to ``ttl`` seconds stale in the workers that did not perform the write.
+    """
+
+    def __init__(self, maxsize: int = 1024, ttl: Optional[float] = None) -> None:
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self._entries: OrderedDict[Hashable, Tuple[Optional[float], ValueType]] = (
+            OrderedDict()
+        )
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: Hashable) -> Optional[ValueType]:
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+
+        expires_at, value = entry
+        if expires_at is not None and expires_at <= time.monotonic():
+            del self._entries[key]
+            self.misses += 1
+            return None
+
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return value
+
+    def set(self, key: Hashable, value: ValueType, ttl: Optional[float] = None) -> None:
+        """
+        Stores a value. ``ttl`` overrides the cache-wide time-to-live.
+        """
+        ttl = ttl if ttl is not None else self.ttl
+        expires_at = time.monotonic() + ttl if ttl is not None else None
+        self._entries[key] = (expires_at, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    def delete(self, key: Hashable) -> None:
+        self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        lookups = self.hits + self.misses
+        return {
+            "size": len(self._entries),
+            "maxsize": self.maxsize,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_ratio": self.hits / lookups if lookups else 0.0,
+        }
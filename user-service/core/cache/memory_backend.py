@@ -0,0 +1,36 @@
+import time
+from typing import Dict, Iterable, Optional, Tuple
+
+from .base import BaseBackend
+
+
+class InMemoryBackend(BaseBackend):
+    """
+    Process-local backend. Used for tests and local development where running
+    Redis is not worth the trouble; entries are not shared between workers.
+    """
+
+    def __init__(self) -> None:
+        self._store: Dict[str, Tuple[Optional[float], bytes]] = {}
+
+    async def get(self, key: str) -> Optional[bytes]:
+        entry = self._store.get(key)
+        if entry is None:
+            return None
+
+        expires_at, value = entry
+        if expires_at is not None and expires_at <= time.monotonic():
+            self._store.pop(key, None)
+            return None
+        return value
+
+    async def set(self, key: str, value: bytes, ttl: Optional[int] = None) -> None:
+        expires_at = time.monotonic() + ttl if ttl else None
+        self._store[key] = (expires_at, value)
+
+    async def delete(self, keys: Iterable[str]) -> None:
+        for key in keys:
+            self._store.pop(key, None)
+
+    async def close(self) -> None:
+        self._store.clear()
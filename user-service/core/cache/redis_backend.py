@@ -0,0 +1,36 @@
+from typing import TYPE_CHECKING, Iterable, Optional
+
+from .base import BaseBackend
+
+if TYPE_CHECKING:
+    from redis.asyncio import Redis
+
+
+class RedisBackend(BaseBackend):
+    def __init__(
+        self,
+        url: str,
+        socket_timeout: Optional[float] = None,
+        socket_connect_timeout: Optional[float] = None,
+    ) -> None:
+        from redis.asyncio import Redis
+
+        self.redis: "Redis" = Redis.from_url(
+            url,
+            socket_timeout=socket_timeout,
+            socket_connect_timeout=socket_connect_timeout,
+        )
+
+    async def get(self, key: str) -> Optional[bytes]:
+        return await self.redis.get(key)
+
+    async def set(self, key: str, value: bytes, ttl: Optional[int] = None) -> None:
+        await self.redis.set(key, value, ex=ttl)
+
+    async def delete(self, keys: Iterable[str]) -> None:
+        keys = list(keys)
+        if keys:
+            await self.redis.delete(*keys)
+
+    async def close(self) -> None:
+        await self.redis.aclose()
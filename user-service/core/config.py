@@ -1,4 +1,5 @@
 from pathlib import Path
+from typing import List, Optional
 
 from pydantic_settings import BaseSettings
 
@@ -13,11 +14,95 @@ class BaseConfig(BaseSettings):
 class AppConfig(BaseConfig):
     """App-specific configuration settings."""
 
+    # Production launcher (serve.py), 0 workers means one per CPU
+    SERVER_HOST: str = "0.0.0.0"
+    SERVER_PORT: int = 8000
+    SERVER_WORKERS: int = 0
+    SERVER_LOOP: str = "uvloop"  # "auto", "asyncio" or "uvloop"
+    SERVER_HTTP: str = "httptools"  # "auto", "h11" or "httptools"
+    SERVER_BACKLOG: int = 2048
+    SERVER_KEEP_ALIVE: int = 5
+    SERVER_GRACEFUL_TIMEOUT: int = 30
+
     POSTGRES_URL: str
     TEST_POSTGRES_URL: str
+    POSTGRES_WRITER_URL: Optional[str] = None
+    POSTGRES_READER_URLS: List[str] = []
+    POSTGRES_READER_BALANCING: str = "round_robin"  # or "least_connections"
+    POSTGRES_READER_MAX_LAG_SECONDS: Optional[float] = 10.0
+    POSTGRES_READER_HEALTH_CHECK_INTERVAL: float = 5.0
+    POSTGRES_READER_HEALTH_CHECK_TIMEOUT: float = 2.0
+    POSTGRES_POOL_SIZE: int = 10
+    POSTGRES_MAX_OVERFLOW: int = 10
+    POSTGRES_POOL_TIMEOUT: float = 30.0
+    POSTGRES_POOL_RECYCLE: int = 3600
+    POSTGRES_POOL_PRE_PING: bool = True
+    POSTGRES_POOL_PREWARM: int = 5
+    POSTGRES_STATEMENT_CACHE_SIZE: int = 100
+    # Per-request query stats go to a Server-Timing header and the logs. Requests
+    # over the budget are logged, or fail in strict mode (N+1 detection)
+    DB_QUERY_BUDGET: Optional[int] = None
+    DB_QUERY_BUDGET_STRICT: bool = False
+    DB_SERVER_TIMING: bool = True
+    UUID_GENERATOR: str = "uuid7"  # or "uuid4"
+    COUNTRY_INDEX_PATH: Optional[str] = None  # defaults to .cache/countries.pickle
     JWT_SECRET_KEY: str
     JWT_ALGORITHM: str
     JWT_EXPIRE_MINUTES: int = 60 * 24
+    JWT_CACHE_SIZE: int = 10_000
+    # Directory of <kid>.pem private keys, enables asymmetric signing (ES256)
+    JWT_KEYS_DIR: Optional[str] = None
+    JWT_ACTIVE_KID: Optional[str] = None
+    JWKS_MAX_AGE: int = 300
+
+    BCRYPT_ROUNDS: int = 12
+    PASSWORD_HASH_WORKERS: int = 4
+
+    REDIS_URL: str = "redis://localhost:6379/0"
+    # Seconds before a Redis call gives up. Failed calls are logged and treated
+    # as a miss, so an unresponsive Redis slows requests by at most this much
+    REDIS_SOCKET_TIMEOUT: float = 0.5
+    REDIS_CONNECT_TIMEOUT: float = 0.5
+    CACHE_BACKEND: str = "redis"  # "redis", "memory" or "none"
+    CACHE_PREFIX: str = "user-service"
+    CACHE_TTL: int = 60
+    CURRENT_USER_CACHE_SIZE: int = 10_000
+    CURRENT_USER_CACHE_TTL: int = 10
+
+    # Revoked tokens live in Redis, shared by every worker and instance, or with
+    # "memory" in each process, where a logout is only seen by its own worker
+    REVOCATION_BACKEND: str = "redis"  # or "memory"
+    REVOCATION_REFRESH_INTERVAL: float = 5.0
+    REVOCATION_FILTER_CAPACITY: int = 100_000
+    REVOCATION_FILTER_ERROR_RATE: float = 0.001
+
+    # Sliding-window login limits, shared through Redis or with "memory" counted
+    # by each process on its own. A limit of 0 disables that check
+    RATE_LIMIT_BACKEND: str = "redis"  # or "memory"
+    LOGIN_RATE_LIMIT_WINDOW: float = 60.0
+    LOGIN_RATE_LIMIT_PER_IP: int = 20
+    LOGIN_RATE_LIMIT_PER_EMAIL: int = 5
+    RATE_LIMIT_MAX_KEYS: int = 100_000
+    # Addresses or networks of the proxies in front of the service. Requests
+    # from them are attributed to the client in X-Forwarded-For
+    TRUSTED_PROXIES: List[str] = []
+
+    # Pool, bcrypt and JWT cache gauges are sampled at this interval. The prefork
+    # launcher aggregates workers' metrics in METRICS_MULTIPROC_DIR, a temporary
+    # directory unless set
+    METRICS_REFRESH_INTERVAL: float = 5.0
+    METRICS_MULTIPROC_DIR: Optional[str] = None
+    # Database ping timeout of the readiness check
+    READINESS_TIMEOUT: float = 2.0
+
+    # Requests under these prefixes skip authentication and the database scope
+    PUBLIC_PATHS: List[str] = [
+        "/v1/monitoring",
+        "/v1/auth/.well-known",
+        "/docs",
+        "/redoc",
+        "/openapi.json",
+    ]
 
 
 config: AppConfig = AppConfig()
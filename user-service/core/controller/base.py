@@ -1,11 +1,13 @@
-from typing import Any, Dict, Generic, Type, TypeVar
+from typing import (Any, Dict, Generic, List, Optional, Sequence, Tuple, Type,
+                    TypeVar)
 from uuid import UUID
 
 from pydantic import BaseModel
 
 from core.database import Base, Propagation, Transactional
-from core.exceptions import NotFoundException
+from core.exceptions import BadRequestException, NotFoundException
 from core.repository import BaseRepository
+from core.repository.projection import Projection
 
 ModelType = TypeVar("ModelType", bound=Base)
 
@@ -17,28 +19,39 @@ class BaseController(Generic[ModelType]):
         self.model_class = model
         self.repository = repository
 
-    async def get_by_id(self, id_: int) -> ModelType:
+    async def get_by_id(
+        self, id_: int, projection: Optional[Projection] = None
+    ) -> ModelType:
         """
         Returns the model instance matching the id.
 
         :param id_: The id to match.
+        :param projection: Columns to load, returns a row instead of an instance.
         :return: The model instance.
         """
 
-        db_obj = await self.repository.get_by(field="id", value=id_)
+        db_obj = await self.repository.get_by(
+            field="id", value=id_, projection=projection
+        )
         return db_obj
 
-    async def get_by_uuid(self, uuid: UUID) -> ModelType | None:
+    async def get_by_uuid(
+        self, uuid: UUID, projection: Optional[Projection] = None
+    ) -> ModelType | None:
         """
         Returns the model instance matching the uuid.
 
         :param uuid: The uuid to match.
+        :param projection: Columns to load, returns a row instead of an instance.
         :return: The model instance.
         """
 
-        db_obj = await self.repository.get_by(field="uuid", value=uuid)
+        db_obj = await self.repository.get_by(
+            field="uuid", value=uuid, projection=projection
+        )
         return db_obj
 
+    @Transactional(propagation=Propagation.READ_ONLY)
     async def get_all(
         self, skip: int = 0, limit: int = 100, filters: Dict[str, Any] | None = None
     ) -> list[ModelType]:
@@ -54,6 +67,27 @@ class BaseController(Generic[ModelType]):
         response = await self.repository.get_all(skip, limit, filters)
         return response
 
+    @Transactional(propagation=Propagation.READ_ONLY)
+    async def get_page(
+        self,
+        limit: int = 20,
+        cursor: Optional[str] = None,
+        filters: Dict[str, Any] | None = None,
+    ) -> Tuple[Sequence[ModelType], Optional[str]]:
+        """
+        Returns a page of records using keyset pagination ordered by id.
+
+        :param limit: The number of records to return.
+        :param cursor: The cursor returned with the previous page.
+        :param filters: The filters to apply to the query.
+        :return: The records and the cursor of the next page, if any.
+        """
+
+        try:
+            return await self.repository.get_page(limit, cursor, filters)
+        except ValueError as exception:
+            raise BadRequestException("Invalid cursor") from exception
+
     @Transactional(propagation=Propagation.REQUIRED)
     async def create(self, attributes: dict[str, Any]) -> ModelType:
         """
@@ -76,3 +110,36 @@ class BaseController(Generic[ModelType]):
     ) -> ModelType:
         updated = await self.repository.update(model, attributes)
         return updated
+
+    @Transactional(propagation=Propagation.REQUIRED)
+    async def create_many(self, rows: Sequence[dict[str, Any]]) -> List[ModelType]:
+        """
+        Creates many objects in the DB with set-based inserts.
+
+        :param rows: The attributes of each object to create.
+        :return: The created objects.
+        """
+        return await self.repository.create_many(rows)
+
+    @Transactional(propagation=Propagation.REQUIRED)
+    async def update_where(
+        self, filters: Dict[str, Any], attributes: dict[str, Any]
+    ) -> int:
+        """
+        Updates every object matching the filters in set-based statements.
+
+        :param filters: The filters to match, list values become ``IN`` clauses.
+        :param attributes: The attributes to set.
+        :return: The number of updated objects.
+        """
+        return await self.repository.update_where(filters, attributes)
+
+    @Transactional(propagation=Propagation.REQUIRED)
+    async def delete_where(self, filters: Dict[str, Any]) -> int:
+        """
+        Deletes every object matching the filters in set-based statements.
+
+        :param filters: The filters to match, list values become ``IN`` clauses.
+        :return: The number of deleted objects.
+        """
+        return await self.repository.delete_where(filters)
@@ -1,5 +1,7 @@
-from .session import (Base, get_session, reset_session_context, session,
-                      set_session_context)
+from .instrumentation import (QueryStats, get_query_stats, reset_query_stats,
+                              set_query_stats)
+from .session import (Base, SessionScope, get_session, get_session_scope,
+                      reset_session_context, session, set_session_context)
 from .standalone_session import standalone_session
 from .transactional import Propagation, Transactional
 
@@ -7,9 +9,15 @@ __all__ = [
     "Base",
     "session",
     "get_session",
+    "SessionScope",
+    "get_session_scope",
     "set_session_context",
     "reset_session_context",
     "standalone_session",
+    "QueryStats",
+    "get_query_stats",
+    "set_query_stats",
+    "reset_query_stats",
     "Transactional",
     "Propagation",
 ]
@@ -0,0 +1,94 @@
+import time
+from contextvars import ContextVar, Token
+from typing import Optional
+
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from core.exceptions import QueryBudgetExceededException
+
+
+class QueryStats:
+    """
+    Queries run during one unit of work, usually one request: how many, the
+    time spent in the database and the slowest statement.
+
+    With a ``budget``, going over it is recorded in ``over_budget``. In strict
+    mode the first query over the budget raises instead of running, which makes
+    an N+1 loop fail loudly in development.
+    """
+
+    __slots__ = (
+        "count",
+        "duration",
+        "slowest_duration",
+        "slowest_statement",
+        "budget",
+        "strict",
+    )
+
+    def __init__(self, budget: Optional[int] = None, strict: bool = False) -> None:
+        self.count = 0
+        self.duration = 0.0
+        self.slowest_duration = 0.0
+        self.slowest_statement: Optional[str] = None
+        self.budget = budget
+        self.strict = strict
+
+    @property
+    def over_budget(self) -> bool:
+        return self.budget is not None and self.count > self.budget
+
+    def begin(self, statement: str) -> None:
+        self.count += 1
+        if self.strict and self.over_budget:
+            raise QueryBudgetExceededException(
+                f"Query budget of {self.budget} exceeded by: {statement[:200]}"
+            )
+
+    def record(self, statement: str, duration: float) -> None:
+        self.duration += duration
+        if duration > self.slowest_duration:
+            self.slowest_duration = duration
+            self.slowest_statement = statement
+
+
+query_stats: ContextVar[Optional[QueryStats]] = ContextVar("query_stats", default=None)
+
+
+def get_query_stats() -> Optional[QueryStats]:
+    return query_stats.get()
+
+
+def set_query_stats(stats: QueryStats) -> Token:
+    return query_stats.set(stats)
+
+
+def reset_query_stats(context: Token) -> None:
+    query_stats.reset(context)
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    stats = query_stats.get()
+    if stats is not None:
+        stats.begin(statement)
+    context._query_started = time.perf_counter()
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    stats = query_stats.get()
+    if stats is not None:
+        stats.record(statement, time.perf_counter() - context._query_started)
+
+
+def instrument(engine: AsyncEngine) -> None:
+    """
+    Records every statement the engine runs into the current ``QueryStats``.
+
+    The hooks run inside SQLAlchemy's greenlet, which shares the context of the
+    awaiting task, so statements land in the stats of the request that ran them.
+    Outside a request (no stats set) only the timing bookkeeping runs.
+    """
+    sync_engine = engine.sync_engine
+    event.listen(sync_engine, "before_cursor_execute", _before_cursor_execute)
+    event.listen(sync_engine, "after_cursor_execute", _after_cursor_execute)
@@ -1,9 +1,11 @@
-from typing import Optional
+from typing import Optional, Tuple
 
-from sqlalchemy import BigInteger, ForeignKey
+from sqlalchemy import BigInteger, ForeignKey, Index, text
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import Mapped, declared_attr, mapped_column
 
+AUDIT_COLUMNS = ("created_by", "updated_by", "deleted_by")
+
 
 class UserAuditMixin:
     """Mixins class to add auditing fields for created_by, updated_by, and deleted_by"""
@@ -19,3 +21,22 @@ class UserAuditMixin:
     @declared_attr
     def deleted_by(cls) -> Mapped[Optional[int]]:
         return mapped_column(BigInteger, ForeignKey("users.id"), nullable=True)
+
+    @declared_attr.directive
+    def __table_args__(cls) -> Tuple[Index, ...]:
+        return UserAuditMixin.audit_indexes(cls.__tablename__)
+
+    @staticmethod
+    def audit_indexes(tablename: str) -> Tuple[Index, ...]:
+        """
+        Partial indexes backing the audit foreign keys. Deleting or re-keying a
+        user has to find every row pointing at it, most rows leave these NULL.
+        """
+        return tuple(
+            Index(
+                f"ix_{tablename}_{column}",
+                column,
+                postgresql_where=text(f"{column} IS NOT NULL"),
+            )
+            for column in AUDIT_COLUMNS
+        )
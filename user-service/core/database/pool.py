@@ -0,0 +1,89 @@
+import asyncio
+import logging
+import time
+from typing import Any, Dict, Optional
+
+from sqlalchemy import exc, text
+from sqlalchemy.ext.asyncio import AsyncEngine
+from sqlalchemy.pool import AsyncAdaptedQueuePool
+
+logger = logging.getLogger(__name__)
+
+
+class InstrumentedQueuePool(AsyncAdaptedQueuePool):
+    """
+    Queue pool that records how long checkouts wait for a free connection.
+    """
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self.waits: int = 0
+        self.wait_time_total: float = 0.0
+        self.wait_time_max: float = 0.0
+        self.timeouts: int = 0
+
+    def _do_get(self):
+        started = time.perf_counter()
+        try:
+            return super()._do_get()
+        except exc.TimeoutError:
+            self.timeouts += 1
+            raise
+        finally:
+            elapsed = time.perf_counter() - started
+            self.waits += 1
+            self.wait_time_total += elapsed
+            self.wait_time_max = max(self.wait_time_max, elapsed)
+
+
+def pool_stats(engine: AsyncEngine) -> Dict[str, Any]:
+    pool = engine.pool
+    stats: Dict[str, Any] = {
+        "size": pool.size(),
+        "checked_in": pool.checkedin(),
+        "checked_out": pool.checkedout(),
+        "overflow": max(pool.overflow(), 0),
+    }
+    if isinstance(pool, InstrumentedQueuePool):
+        stats.update(
+            {
+                "waits": pool.waits,
+                "wait_time_avg": pool.wait_time_total / pool.waits if pool.waits else 0.0,
+                "wait_time_max": pool.wait_time_max,
+                "timeouts": pool.timeouts,
+            }
+        )
+    return stats
+
+
+async def prewarm(engine: AsyncEngine, connections: int) -> None:
+    """
+    Opens ``connections`` connections at once and hands them back to the pool,
+    so the first requests after a deploy don't pay for the connect handshake.
+    """
+    if connections <= 0:
+        return
+    opened = await asyncio.gather(
+        *(engine.connect() for _ in range(connections)), return_exceptions=True
+    )
+    for connection in opened:
+        if isinstance(connection, Exception):
+            logger.warning("Could not pre-warm pool for %s: %s", engine.url, connection)
+        else:
+            await connection.close()
+
+
+async def ping(engine: AsyncEngine, timeout: float) -> Optional[str]:
+    """
+    Runs ``SELECT 1`` on the engine, returns None when it answered in time and
+    the reason otherwise.
+    """
+    try:
+        async with asyncio.timeout(timeout):
+            async with engine.connect() as connection:
+                await connection.execute(text("SELECT 1"))
+    except TimeoutError:
+        return f"no answer within {timeout}s"
+    except Exception as exception:
+        return str(exception) or type(exception).__name__
+    return None
@@ -0,0 +1,104 @@
+import asyncio
+import itertools
+import logging
+from typing import List, Optional
+
+from sqlalchemy import event, text
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+logger = logging.getLogger(__name__)
+
+# Seconds the replica is behind the primary. A replica that has replayed
+# everything it received reports 0 even if the primary has been idle.
+REPLICATION_LAG_QUERY = text(
+    """
+    SELECT CASE
+        WHEN NOT pg_is_in_recovery() THEN 0
+        WHEN pg_last_wal_receive_lsn() = pg_last_wal_replay_lsn() THEN 0
+        ELSE COALESCE(
+            EXTRACT(EPOCH FROM now() - pg_last_xact_replay_timestamp()), 0
+        )
+    END
+    """
+)
+
+
+class ReaderPool:
+    """
+    Set of read-replica engines with load balancing and health checks.
+
+    Replicas that fail a health check, lag behind the primary by more than
+    ``max_lag`` seconds or drop a connection are ejected until the next
+    successful check.
+    """
+
+    ROUND_ROBIN = "round_robin"
+    LEAST_CONNECTIONS = "least_connections"
+
+    def __init__(
+        self,
+        engines: List[AsyncEngine],
+        balancing: str = ROUND_ROBIN,
+        max_lag: Optional[float] = None,
+        timeout: float = 2.0,
+    ) -> None:
+        if balancing not in (self.ROUND_ROBIN, self.LEAST_CONNECTIONS):
+            raise ValueError(f"Unknown reader balancing strategy: {balancing}")
+
+        self.engines = engines
+        self.healthy: List[AsyncEngine] = list(engines)
+        self.balancing = balancing
+        self.max_lag = max_lag
+        self.timeout = timeout
+        self._counter = itertools.count()
+
+        for engine in engines:
+            event.listen(engine.sync_engine, "handle_error", self._on_error(engine))
+
+    def choose(self) -> Optional[AsyncEngine]:
+        """
+        Returns a healthy replica, or None when the primary has to serve reads.
+        """
+        healthy = self.healthy
+        if not healthy:
+            return None
+        if self.balancing == self.LEAST_CONNECTIONS:
+            return min(healthy, key=lambda engine: engine.pool.checkedout())
+        return healthy[next(self._counter) % len(healthy)]
+
+    def eject(self, engine: AsyncEngine) -> None:
+        if engine in self.healthy:
+            logger.warning("Ejecting read replica %s", engine.url)
+            self.healthy = [other for other in self.healthy if other is not engine]
+
+    async def check(self, engine: AsyncEngine) -> bool:
+        try:
+            async with asyncio.timeout(self.timeout):
+                async with engine.connect() as connection:
+                    lag = await connection.scalar(REPLICATION_LAG_QUERY)
+        except Exception as exception:
+            logger.warning("Read replica %s is unavailable: %s", engine.url, exception)
+            return False
+
+        if self.max_lag is not None and lag is not None and lag > self.max_lag:
+            logger.warning("Read replica %s is %.1fs behind", engine.url, lag)
+            return False
+        return True
+
+    async def check_all(self) -> None:
+        results = await asyncio.gather(*(self.check(engine) for engine in self.engines))
+        self.healthy = [
+            engine for engine, healthy in zip(self.engines, results) if healthy
+        ]
+
+    async def run_health_checks(self, interval: float) -> None:
+        while True:
+            await self.check_all()
+            await asyncio.sleep(interval)
+
+    def _on_error(self, engine: AsyncEngine):
+        def handle_error(context) -> None:
+            if context.is_disconnect:
+                self.eject(engine)
+
+        return handle_error
@@ -1,39 +1,122 @@
 from contextvars import ContextVar, Token
-from typing import Union
+from itertools import count
+from typing import Optional, Union
 
-from sqlalchemy.ext.asyncio import (AsyncSession, async_scoped_session,
-                                    create_async_engine)
+from sqlalchemy.ext.asyncio import (AsyncEngine, AsyncSession,
+                                    async_scoped_session, create_async_engine)
 from sqlalchemy.orm import Session, declarative_base, sessionmaker
 from sqlalchemy.sql.expression import Delete, Insert, Update
 
+from core.cache.cache_manager import REPLICA_READ
 from core.config import config
 
-session_context: ContextVar[str] = ContextVar("session_context")
+from .instrumentation import instrument
+from .pool import InstrumentedQueuePool
+from .replicas import ReaderPool
 
+_scope_ids = count(1)
 
-def get_session_context() -> str:
+
+class SessionScope:
+    """
+    The unit of work a scoped session belongs to, usually one request.
+
+    The scope only takes an id, and with it a session, the first time the
+    scoped session is used, so requests that never touch the database skip
+    creating and removing one.
+    """
+
+    __slots__ = ("_id",)
+
+    def __init__(self) -> None:
+        self._id: Optional[int] = None
+
+    @property
+    def id(self) -> int:
+        if self._id is None:
+            self._id = next(_scope_ids)
+        return self._id
+
+    @property
+    def used(self) -> bool:
+        return self._id is not None
+
+
+session_context: ContextVar[SessionScope] = ContextVar("session_context")
+
+
+def get_session_context() -> int:
+    return session_context.get().id
+
+
+def get_session_scope() -> SessionScope:
     return session_context.get()
 
 
-def set_session_context(session_id: str) -> Token:
-    return session_context.set(session_id)
+def set_session_context(scope: Optional[SessionScope] = None) -> Token:
+    return session_context.set(scope or SessionScope())
 
 
 def reset_session_context(context: Token) -> None:
     session_context.reset(context)
 
 
+def make_engine(url: str) -> AsyncEngine:
+    engine = create_async_engine(
+        url,
+        poolclass=InstrumentedQueuePool,
+        pool_size=config.POSTGRES_POOL_SIZE,
+        max_overflow=config.POSTGRES_MAX_OVERFLOW,
+        pool_timeout=config.POSTGRES_POOL_TIMEOUT,
+        pool_recycle=config.POSTGRES_POOL_RECYCLE,
+        pool_pre_ping=config.POSTGRES_POOL_PRE_PING,
+        connect_args={
+            # asyncpg's own per-connection cache and SQLAlchemy's adapter cache
+            "statement_cache_size": config.POSTGRES_STATEMENT_CACHE_SIZE,
+            "prepared_statement_cache_size": config.POSTGRES_STATEMENT_CACHE_SIZE,
+        },
+    )
+    instrument(engine)
+    return engine
+
+
 engines = {
-    "writer": create_async_engine(config.POSTGRES_URL, pool_recycle=3600),
-    "reader": create_async_engine(config.POSTGRES_URL, pool_recycle=3600),
+    "writer": make_engine(config.POSTGRES_WRITER_URL or config.POSTGRES_URL),
 }
 
+readers = ReaderPool(
+    [make_engine(url) for url in config.POSTGRES_READER_URLS],
+    balancing=config.POSTGRES_READER_BALANCING,
+    max_lag=config.POSTGRES_READER_MAX_LAG_SECONDS,
+    timeout=config.POSTGRES_READER_HEALTH_CHECK_TIMEOUT,
+)
+
 
 class RoutingSession(Session):
+    """
+    Sends writes to the primary and reads to a replica. Once the session has
+    written anything, the rest of its reads stay on the primary so the request
+    sees its own writes. Each session sticks to one replica, and flags replica
+    reads so the cache is not refilled from a row that may predate the last
+    commit.
+    """
+
     def get_bind(self, mapper=None, clause=None, **kwargs):
+        self.info[REPLICA_READ] = False
         if self._flushing or isinstance(clause, (Update, Delete, Insert)):
+            self.info["use_writer"] = True
+            return engines["writer"].sync_engine
+
+        if self.info.get("use_writer"):
+            return engines["writer"].sync_engine
+
+        reader = self.info.get("reader")
+        if reader is None or reader not in readers.healthy:
+            reader = self.info["reader"] = readers.choose()
+        if reader is None:
             return engines["writer"].sync_engine
-        return engines["reader"].sync_engine
+        self.info[REPLICA_READ] = True
+        return reader.sync_engine
 
 
 async_session_factory = sessionmaker(
@@ -58,7 +141,9 @@ async def get_session():
     try:
         yield session
     finally:
-        await session.close()
+        # Closing would create the scope's session if the route never used it
+        if get_session_scope().used:
+            await session.close()
 
 
 Base = declarative_base()
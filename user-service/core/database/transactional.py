@@ -1,55 +1,77 @@
+from contextvars import ContextVar
 from enum import Enum
 from functools import wraps
+from typing import Optional
 
+from core.cache import Cache
 from core.database import session
 
 
 class Propagation(Enum):
     REQUIRED = "required"
     REQUIRED_NEW = "required_new"
+    READ_ONLY = "read_only"
+
+
+# Propagation of the outermost unit of work running in this context
+transaction_context: ContextVar[Optional[Propagation]] = ContextVar(
+    "transaction_context", default=None
+)
 
 
 class Transactional:
+    """
+    Runs the decorated coroutine as a unit of work on the scoped session.
+
+    Only the outermost unit commits, so nested decorated calls add up to a
+    single commit:
+
+    * ``REQUIRED`` joins the running unit, or starts one and commits it.
+    * ``REQUIRED_NEW`` starts a unit, or runs inside a savepoint when one is
+      already running, so its failure only rolls back its own work.
+    * ``READ_ONLY`` joins the running unit, or runs without committing. Its
+      reads go to a replica, and may lag behind other requests' writes, unless
+      the session has written before. A writing unit nested inside it commits
+      on its own.
+    """
+
     def __init__(self, propagation: Propagation = Propagation.REQUIRED):
         self.propagation = propagation
 
     def __call__(self, function):
         @wraps(function)
         async def decorator(*args, **kwargs):
-            try:
-                if self.propagation == Propagation.REQUIRED:
-                    result = await self._run_required(
-                        function=function,
-                        args=args,
-                        kwargs=kwargs,
-                    )
-                elif self.propagation == Propagation.REQUIRED_NEW:
-                    result = await self._run_required_new(
-                        function=function,
-                        args=args,
-                        kwargs=kwargs,
-                    )
-                else:
-                    result = await self._run_required(
-                        function=function,
-                        args=args,
-                        kwargs=kwargs,
-                    )
-            except Exception as exception:
-                await session.rollback()
-                raise exception
-
-            return result
+            outer = transaction_context.get()
+            if outer is None or (
+                outer == Propagation.READ_ONLY
+                and self.propagation != Propagation.READ_ONLY
+            ):
+                return await self._run_outermost(function, args, kwargs)
+
+            if self.propagation == Propagation.REQUIRED_NEW:
+                return await self._run_savepoint(function, args, kwargs)
+            return await function(*args, **kwargs)
 
         return decorator
 
-    async def _run_required(self, function, args, kwargs) -> None:
-        result = await function(*args, **kwargs)
-        await session.commit()
-        return result
+    async def _run_outermost(self, function, args, kwargs):
+        context = transaction_context.set(self.propagation)
+        try:
+            result = await function(*args, **kwargs)
+            # Read-only units have nothing to commit, their connection goes back
+            # to the pool with the session at the end of the request
+            if self.propagation != Propagation.READ_ONLY:
+                await session.commit()
+                await Cache.invalidate_pending(session)
+        except Exception as exception:
+            await session.rollback()
+            Cache.discard_pending(session)
+            raise exception
+        finally:
+            transaction_context.reset(context)
 
-    async def _run_required_new(self, function, args, kwargs) -> None:
-        session.begin()
-        result = await function(*args, **kwargs)
-        await session.commit()
         return result
+
+    async def _run_savepoint(self, function, args, kwargs):
+        async with session.begin_nested():
+            return await function(*args, **kwargs)
@@ -1,6 +1,7 @@
 from .base import (BadRequestException, CustomException,
                    DuplicateValueException, ForbiddenException,
-                   NotFoundException, UnauthorizedException,
+                   NotFoundException, QueryBudgetExceededException,
+                   TooManyRequestsException, UnauthorizedException,
                    UnprocessableException)
 
 __all__ = [
@@ -11,4 +12,6 @@ __all__ = [
     "UnauthorizedException",
     "UnprocessableException",
     "DuplicateValueException",
+    "TooManyRequestsException",
+    "QueryBudgetExceededException",
 ]
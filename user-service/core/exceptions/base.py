@@ -1,3 +1,4 @@
+import math
 from http import HTTPStatus
 
 
@@ -48,3 +49,14 @@ class UnprocessableException(HttpStatusException):
 class DuplicateValueException(HttpStatusException):
     def __init__(self, message=None):
         super().__init__(HTTPStatus.UNPROCESSABLE_ENTITY, message)
+
+
+class TooManyRequestsException(HttpStatusException):
+    def __init__(self, message=None, retry_after: float = 0):
+        super().__init__(HTTPStatus.TOO_MANY_REQUESTS, message)
+        self.headers = {"Retry-After": str(max(1, math.ceil(retry_after)))}
+
+
+class QueryBudgetExceededException(HttpStatusException):
+    def __init__(self, message=None):
+        super().__init__(HTTPStatus.INTERNAL_SERVER_ERROR, message)
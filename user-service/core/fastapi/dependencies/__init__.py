@@ -1,4 +1,5 @@
 from .authentication import AuthenticationRequired
 from .current_user import get_current_user
+from .rate_limit import login_rate_limit
 
-__all__ = ["get_current_user", "AuthenticationRequired"]
+__all__ = ["get_current_user", "AuthenticationRequired", "login_rate_limit"]
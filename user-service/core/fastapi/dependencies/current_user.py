@@ -1,11 +1,59 @@
 from fastapi import Depends, Request
 
 from app.controllers.user import UserController
+from app.models import User
+from app.schemas.extras.current_user import UserSnapshot
+from core.cache import Cache, LRUCache
+from core.config import config
+from core.exceptions import UnauthorizedException
 from core.factory import Factory
+from core.fastapi.middlewares import LazyAuthentication
+
+current_user_cache: LRUCache[UserSnapshot] = LRUCache(
+    maxsize=config.CURRENT_USER_CACHE_SIZE, ttl=config.CURRENT_USER_CACHE_TTL
+)
+
+
+def _invalidate_current_users(keys) -> None:
+    for key in keys:
+        current_user_cache.delete(key)
+
+
+Cache.subscribe(_invalidate_current_users)
 
 
 async def get_current_user(
     request: Request,
     user_controller: UserController = Depends(Factory().get_user_controller),
-):
-    return await user_controller.get_by_id(request.user.id)
+) -> UserSnapshot:
+    """
+    Returns a snapshot of the authenticated user. Raises
+    ``UnauthorizedException`` for a missing, invalid or revoked token, and for
+    a user that no longer exists.
+
+    Snapshots are kept per worker for ``CURRENT_USER_CACHE_TTL`` seconds and are
+    dropped as soon as this worker commits a change to the user. A miss selects
+    just the snapshot's columns.
+    """
+    authentication = request.scope.get("auth")
+    if isinstance(authentication, LazyAuthentication):
+        # Confirms a possibly revoked token with the revocation store
+        await authentication.resolve_async()
+
+    user_id = request.user.id
+    if user_id is None:
+        raise UnauthorizedException("Invalid or revoked token")
+
+    key = Cache.make_key(User, "id", user_id)
+    snapshot = current_user_cache.get(key)
+    if snapshot is not None:
+        return snapshot
+
+    # Load only the snapshot's columns, never the password hash
+    user = await user_controller.get_by_id(user_id, projection=UserSnapshot)
+    if user is None:
+        raise UnauthorizedException("User not found")
+
+    snapshot = UserSnapshot.from_model(user)
+    current_user_cache.set(key, snapshot)
+    return snapshot
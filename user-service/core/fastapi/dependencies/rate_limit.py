@@ -0,0 +1,59 @@
+from ipaddress import ip_address, ip_network
+
+from fastapi import Request
+
+from core.config import config
+from core.rate_limit import RateLimiter
+
+TRUSTED_PROXIES = [ip_network(proxy, strict=False) for proxy in config.TRUSTED_PROXIES]
+
+
+def is_trusted_proxy(address: str) -> bool:
+    try:
+        address = ip_address(address)
+    except ValueError:
+        return False
+    return any(address in network for network in TRUSTED_PROXIES)
+
+
+def client_ip(request: Request) -> str:
+    """
+    The address the request came from. Behind trusted proxies (load balancers,
+    ingress) that is the last ``X-Forwarded-For`` hop no trusted proxy added;
+    hops further left are set by the client and cannot be trusted.
+    """
+    host = request.client.host if request.client else "unknown"
+    if not is_trusted_proxy(host):
+        return host
+
+    forwarded = ",".join(request.headers.getlist("x-forwarded-for"))
+    hops = [hop.strip() for hop in forwarded.split(",") if hop.strip()]
+    for hop in reversed(hops):
+        if not is_trusted_proxy(hop):
+            return hop
+    return hops[0] if hops else host
+
+
+async def login_rate_limit(request: Request) -> None:
+    """
+    Limits login attempts per client IP and per email before the handler runs,
+    so rejected attempts cost neither a user lookup nor a bcrypt verify.
+    """
+    window = config.LOGIN_RATE_LIMIT_WINDOW
+    await RateLimiter.hit(
+        "login_ip", client_ip(request), config.LOGIN_RATE_LIMIT_PER_IP, window
+    )
+
+    # FastAPI has already parsed the body, this reads its cached copy
+    try:
+        body = await request.json()
+    except ValueError:
+        return
+    email = body.get("email") if isinstance(body, dict) else None
+    if isinstance(email, str):
+        await RateLimiter.hit(
+            "login_email",
+            email.strip().lower(),
+            config.LOGIN_RATE_LIMIT_PER_EMAIL,
+            window,
+        )
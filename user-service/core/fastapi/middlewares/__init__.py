@@ -1,4 +1,15 @@
-from .authentication import AuthBackend, AuthenticationMiddleware
+from .authentication import AuthBackend, LazyAuthentication, LazyUser
+from .metrics import MetricsMiddleware
+from .query_stats import QueryStatsMiddleware
+from .request_context import RequestContextMiddleware
 from .sqlalchemy import SQLAlchemyMiddleware
 
-__all__ = ["AuthBackend", "AuthenticationMiddleware", "SQLAlchemyMiddleware"]
+__all__ = [
+    "AuthBackend",
+    "LazyAuthentication",
+    "LazyUser",
+    "MetricsMiddleware",
+    "QueryStatsMiddleware",
+    "RequestContextMiddleware",
+    "SQLAlchemyMiddleware",
+]
@@ -1,47 +1,116 @@
-from typing import Optional, Tuple
+from typing import Any, Dict, Optional, Tuple
 
-from jose import JWTError, jwt
 from starlette.authentication import AuthenticationBackend
-from starlette.middleware.authentication import \
-    AuthenticationMiddleware as BaseAuthenticationMiddleware
 from starlette.requests import HTTPConnection
 
 from app.schemas.extras.current_user import CurrentUser
-from core.config import config
+from core.exceptions import UnauthorizedException
+from core.security import JWTHandler, Revocations
 
 
 class AuthBackend(AuthenticationBackend):
     async def authenticate(
         self, conn: HTTPConnection
     ) -> Tuple[bool, Optional[CurrentUser]]:
-        current_user = CurrentUser()
-        authorization: str = conn.headers.get("Authorization")
+        return await self.authenticate_header_async(conn.headers.get("Authorization"))
+
+    def authenticate_header(
+        self, authorization: Optional[str]
+    ) -> Tuple[bool, CurrentUser]:
+        """
+        Authenticates without leaving the process. A token the revocation
+        filter cannot clear is rejected, use ``authenticate_header_async`` to
+        confirm those with the revocation store.
+        """
+        claims = self.decode_header(authorization)
+        if claims is None or Revocations.maybe_revoked(claims.get("jti", "")):
+            return False, CurrentUser.model_construct()
+        return True, self._current_user(claims)
+
+    async def authenticate_header_async(
+        self, authorization: Optional[str]
+    ) -> Tuple[bool, CurrentUser]:
+        claims = self.decode_header(authorization)
+        if claims is None or await Revocations.is_revoked(claims.get("jti", "")):
+            return False, CurrentUser.model_construct()
+        return True, self._current_user(claims)
+
+    @staticmethod
+    def decode_header(authorization: Optional[str]) -> Optional[Dict[str, Any]]:
         if not authorization:
-            return False, current_user
+            return None
 
         try:
             scheme, token = authorization.split(" ")
             if scheme.lower() != "bearer":
-                return False, current_user
+                return None
         except ValueError:
-            return False, current_user
+            return None
 
         if not token:
-            return False, current_user
+            return None
 
         try:
-            payload = jwt.decode(
-                token,
-                config.JWT_SECRET_KEY,
-                algorithms=[config.JWT_ALGORITHM],
+            claims = JWTHandler.decode(token)
+        except UnauthorizedException:
+            return None
+
+        # Refresh tokens carry a user_id too, but only buy a new token pair
+        if claims.get("sub") == "refresh_token":
+            return None
+        return claims
+
+    @staticmethod
+    def _current_user(claims: Dict[str, Any]) -> CurrentUser:
+        # The claims come from our own signed token, skip re-validating them
+        return CurrentUser.model_construct(id=claims.get("user_id"))
+
+
+class LazyAuthentication:
+    """
+    Authenticates the request the first time the result is needed. Stored as
+    ``scope["auth"]``, it is truthy when the request carries a valid token.
+
+    Reading it synchronously rejects tokens the local revocation filter cannot
+    clear. Awaiting ``resolve_async`` first confirms those with the store.
+    """
+
+    __slots__ = ("_backend", "_authorization", "_result")
+
+    def __init__(self, backend: AuthBackend, authorization: Optional[str]) -> None:
+        self._backend = backend
+        self._authorization = authorization
+        self._result: Optional[Tuple[bool, CurrentUser]] = None
+
+    def resolve(self) -> Tuple[bool, CurrentUser]:
+        if self._result is None:
+            self._result = self._backend.authenticate_header(self._authorization)
+        return self._result
+
+    async def resolve_async(self) -> Tuple[bool, CurrentUser]:
+        if self._result is None:
+            self._result = await self._backend.authenticate_header_async(
+                self._authorization
             )
-            user_id = payload.get("user_id")
-        except JWTError:
-            return False, current_user
+        return self._result
+
+    def __bool__(self) -> bool:
+        return self.resolve()[0]
+
+
+class LazyUser:
+    """
+    Stands in for ``CurrentUser`` in ``scope["user"]``, the token is only
+    decoded once an attribute is read.
+    """
+
+    __slots__ = ("_authentication",)
 
-        current_user.id = user_id
-        return True, current_user
+    def __init__(self, authentication: LazyAuthentication) -> None:
+        self._authentication = authentication
 
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._authentication.resolve()[1], name)
 
-class AuthenticationMiddleware(BaseAuthenticationMiddleware):
-    pass
+    def __repr__(self) -> str:
+        return repr(self._authentication.resolve()[1])
@@ -0,0 +1,51 @@
+import time
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from core.metrics.registry import (REQUEST_DURATION, REQUEST_ERRORS,
+                                   REQUESTS_IN_PROGRESS)
+
+
+class MetricsMiddleware:
+    """
+    Records latency, in-flight requests and server errors per route.
+
+    Routes are labelled with their path template, ``/v1/address/{address_uuid}``
+    rather than each address, so the number of series stays bounded. Requests
+    that match no route share the ``unmatched`` label.
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        method = scope["method"]
+        in_progress = REQUESTS_IN_PROGRESS.labels(method)
+        in_progress.inc()
+        started = time.perf_counter()
+        status_code = 500
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            in_progress.dec()
+            # The router stores the matched route in the scope
+            route = scope.get("route")
+            labels = (
+                method,
+                route.path if route is not None else "unmatched",
+                str(status_code),
+            )
+            REQUEST_DURATION.labels(*labels).observe(time.perf_counter() - started)
+            if status_code >= 500:
+                REQUEST_ERRORS.labels(*labels).inc()
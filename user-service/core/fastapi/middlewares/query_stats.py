@@ -0,0 +1,95 @@
+import logging
+import time
+from typing import Optional
+
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from core.database.instrumentation import (QueryStats, reset_query_stats,
+                                           set_query_stats)
+
+logger = logging.getLogger(__name__)
+
+
+class QueryStatsMiddleware:
+    """
+    Collects the database queries each request runs and reports them in a
+    ``Server-Timing`` header and one log line per request.
+
+    Requests running more than ``budget`` queries are logged as a warning along
+    with their slowest statement. With ``strict``, the query going over the
+    budget raises ``QueryBudgetExceededException`` instead.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        budget: Optional[int] = None,
+        strict: bool = False,
+        server_timing: bool = True,
+    ) -> None:
+        self.app = app
+        self.budget = budget
+        self.strict = strict
+        self.server_timing = server_timing
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        stats = QueryStats(budget=self.budget, strict=self.strict)
+        context = set_query_stats(stats)
+        started = time.perf_counter()
+        status_code = 500
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+                if self.server_timing:
+                    headers = MutableHeaders(scope=message)
+                    headers.append("Server-Timing", self.header(stats))
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            reset_query_stats(context)
+            self.log(scope, status_code, stats, time.perf_counter() - started)
+
+    @staticmethod
+    def header(stats: QueryStats) -> str:
+        return (
+            f'db;dur={stats.duration * 1000:.1f};desc="{stats.count} queries", '
+            f"db-slowest;dur={stats.slowest_duration * 1000:.1f}"
+        )
+
+    @staticmethod
+    def log(scope: Scope, status_code: int, stats: QueryStats, elapsed: float) -> None:
+        if stats.over_budget:
+            logger.warning(
+                "method=%s path=%s status=%s queries=%d budget=%d db_ms=%.1f "
+                "slowest_ms=%.1f total_ms=%.1f slowest=%r",
+                scope["method"],
+                scope["path"],
+                status_code,
+                stats.count,
+                stats.budget,
+                stats.duration * 1000,
+                stats.slowest_duration * 1000,
+                elapsed * 1000,
+                stats.slowest_statement,
+            )
+        elif logger.isEnabledFor(logging.INFO):
+            logger.info(
+                "method=%s path=%s status=%s queries=%d db_ms=%.1f "
+                "slowest_ms=%.1f total_ms=%.1f",
+                scope["method"],
+                scope["path"],
+                status_code,
+                stats.count,
+                stats.duration * 1000,
+                stats.slowest_duration * 1000,
+                elapsed * 1000,
+            )
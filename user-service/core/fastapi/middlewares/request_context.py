@@ -0,0 +1,59 @@
+from typing import Iterable, Optional
+
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+from .authentication import AuthBackend, LazyAuthentication, LazyUser
+from .sqlalchemy import SQLAlchemyMiddleware
+
+
+class RequestContextMiddleware:
+    """
+    Sets up authentication and the database session scope in one pure ASGI
+    layer.
+
+    Authentication is lazy: ``request.user`` and ``request.auth`` only decode
+    the bearer token once a route reads them. Requests under ``public_paths``
+    and ``OPTIONS`` requests skip the session scope, so routes mounted there
+    must not use the scoped session.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        backend: AuthBackend,
+        public_paths: Iterable[str] = (),
+    ) -> None:
+        self.app = app
+        self.scoped_app = SQLAlchemyMiddleware(app)
+        self.backend = backend
+
+        public_paths = [path.rstrip("/") for path in public_paths]
+        self.public_paths = frozenset(public_paths)
+        self.public_prefixes = tuple(f"{path}/" for path in public_paths)
+
+    def is_public(self, path: str) -> bool:
+        return path in self.public_paths or path.startswith(self.public_prefixes)
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] not in ("http", "websocket"):
+            await self.app(scope, receive, send)
+            return
+
+        public = scope.get("method") == "OPTIONS" or self.is_public(scope["path"])
+        authorization = None if public else self._authorization(scope)
+
+        authentication = LazyAuthentication(self.backend, authorization)
+        scope["auth"] = authentication
+        scope["user"] = LazyUser(authentication)
+
+        if public:
+            await self.app(scope, receive, send)
+        else:
+            await self.scoped_app(scope, receive, send)
+
+    @staticmethod
+    def _authorization(scope: Scope) -> Optional[str]:
+        for name, value in scope["headers"]:
+            if name == b"authorization":
+                return value.decode("latin-1")
+        return None
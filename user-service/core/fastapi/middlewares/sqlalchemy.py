@@ -1,9 +1,7 @@
-from uuid import uuid4
-
 from starlette.types import ASGIApp, Receive, Scope, Send
 
-from core.database.session import (reset_session_context, session,
-                                   set_session_context)
+from core.database.session import (SessionScope, reset_session_context,
+                                   session, set_session_context)
 
 
 class SQLAlchemyMiddleware:
@@ -11,13 +9,13 @@ class SQLAlchemyMiddleware:
         self.app = app
 
     async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
-        session_id = str(uuid4())
-        context = set_session_context(session_id)
+        session_scope = SessionScope()
+        context = set_session_context(session_scope)
 
         try:
             await self.app(scope, receive, send)
-        except Exception as exception:
-            raise exception
         finally:
-            await session.remove()
+            # The session only exists if something used it during the request
+            if session_scope.used:
+                await session.remove()
             reset_session_context(context=context)
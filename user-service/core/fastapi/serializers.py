@@ -0,0 +1,35 @@
+from operator import attrgetter
+from typing import Any, Dict, Iterable, List, Type
+
+from pydantic import BaseModel
+
+
+class Serializer:
+    """
+    Dumps objects to plain dicts shaped like a response schema.
+
+    The schema's fields are read once into a single ``attrgetter``, and objects
+    are dumped without validation. Only use it for data we loaded ourselves,
+    such as ORM instances, rows or snapshots, and pair it with a response class
+    that encodes UUIDs, enums and datetimes natively, like ``ORJSONResponse``.
+    """
+
+    __slots__ = ("fields", "_getter")
+
+    def __init__(self, schema: Type[BaseModel]) -> None:
+        self.fields = tuple(
+            field.serialization_alias or field.alias or name
+            for name, field in schema.model_fields.items()
+        )
+        getter = attrgetter(*schema.model_fields)
+        if len(self.fields) == 1:
+            self._getter = lambda obj: (getter(obj),)
+        else:
+            self._getter = getter
+
+    def dump(self, obj: Any) -> Dict[str, Any]:
+        return dict(zip(self.fields, self._getter(obj)))
+
+    def dump_many(self, objs: Iterable[Any]) -> List[Dict[str, Any]]:
+        fields, getter = self.fields, self._getter
+        return [dict(zip(fields, getter(obj))) for obj in objs]
@@ -0,0 +1,363 @@
+"""
+Production entry point: a prefork supervisor around uvicorn.
+
+The supervisor imports and builds the app once, binds the listening socket
+and forks the workers, which share the preloaded code and data copy-on-write
+and accept from the same socket. Each worker runs the app's lifespan itself,
+so connection pools, Redis clients and background tasks are never shared
+across a fork.
+
+Signals sent to the supervisor:
+
+* ``SIGTERM`` / ``SIGINT``: graceful shutdown, workers finish in-flight
+  requests for up to ``SERVER_GRACEFUL_TIMEOUT`` seconds.
+* ``SIGHUP``: rolling restart, one worker at a time is replaced once its
+  successor is ready. New workers reload the JWT signing keys, which is how
+  a key rotation is rolled out. Code changes need a full restart.
+* ``SIGTTIN`` / ``SIGTTOU``: one worker more / fewer.
+
+Workers write their Prometheus metrics to ``METRICS_MULTIPROC_DIR`` (a fresh
+temporary directory by default), so a scrape of any worker covers them all.
+"""
+
+import gc
+import logging
+import os
+import select
+import shutil
+import signal
+import socket
+import sys
+import tempfile
+import time
+from typing import Dict, List, Optional, Tuple
+
+import uvicorn
+
+logger = logging.getLogger("user-service.launcher")
+
+
+class Phases:
+    """Wall time of each named startup phase."""
+
+    def __init__(self) -> None:
+        self.timings: List[Tuple[str, float]] = []
+        self._last = time.perf_counter()
+
+    def mark(self, name: str) -> None:
+        now = time.perf_counter()
+        self.timings.append((name, now - self._last))
+        self._last = now
+
+    def __str__(self) -> str:
+        total = sum(elapsed for _, elapsed in self.timings)
+        phases = ", ".join(
+            f"{name} {elapsed * 1000:,.0f} ms" for name, elapsed in self.timings
+        )
+        return f"{phases} (total {total * 1000:,.0f} ms)"
+
+
+class WorkerServer(uvicorn.Server):
+    """
+    Tells the supervisor once its lifespan completed and it accepts. A worker
+    whose startup failed closes the pipe without a word, so a rolling restart
+    waiting on it stops.
+    """
+
+    def __init__(self, config: uvicorn.Config, ready: int, spawned_at: float) -> None:
+        super().__init__(config)
+        self.ready = ready
+        self.spawned_at = spawned_at
+
+    async def startup(self, sockets: Optional[List[socket.socket]] = None) -> None:
+        await super().startup(sockets=sockets)
+        # uvicorn returns early with should_exit set when the lifespan failed
+        if self.started and not self.should_exit:
+            elapsed = (time.perf_counter() - self.spawned_at) * 1000
+            logger.info("Worker %s ready in %.0f ms", os.getpid(), elapsed)
+            os.write(self.ready, b"1")
+        else:
+            logger.error("Worker %s failed to start", os.getpid())
+        os.close(self.ready)
+
+
+def preload() -> Tuple[object, Phases]:
+    """
+    Imports and builds the app in the supervisor, timing each phase. The split
+    follows import order: third-party libraries first, then the module that
+    creates the engines, then everything that builds the routers.
+    """
+    phases = Phases()
+
+    import fastapi  # noqa: F401
+    import jose  # noqa: F401
+    import passlib.context  # noqa: F401
+    import pydantic  # noqa: F401
+    import redis.asyncio  # noqa: F401
+    import sqlalchemy.ext.asyncio  # noqa: F401
+
+    phases.mark("imports")
+
+    import core.database.session  # noqa: F401
+
+    phases.mark("engines")
+
+    from core.server import app
+
+    phases.mark("routers")
+
+    # Data every worker needs, loaded once here and shared copy-on-write
+    from core.utils import get_country_index
+
+    get_country_index()
+    phases.mark("warmup")
+
+    return app, phases
+
+
+def prepare_metrics_dir(path: Optional[str]) -> Tuple[str, bool]:
+    """
+    Points prometheus_client at a multiprocess directory, before anything
+    imports it. Files left by a previous run would be aggregated as if they
+    were current, so the directory is emptied. Returns the directory and
+    whether it is a temporary one to remove on exit.
+    """
+    if path is None:
+        path, temporary = tempfile.mkdtemp(prefix="user-service-metrics-"), True
+    else:
+        temporary = False
+        os.makedirs(path, exist_ok=True)
+        for name in os.listdir(path):
+            if name.endswith(".db"):
+                os.remove(os.path.join(path, name))
+
+    os.environ["PROMETHEUS_MULTIPROC_DIR"] = path
+    return path, temporary
+
+
+def bind(host: str, port: int, backlog: int) -> socket.socket:
+    sock = socket.socket(socket.AF_INET6 if ":" in host else socket.AF_INET)
+    sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+    sock.bind((host, port))
+    sock.listen(backlog)
+    sock.set_inheritable(True)
+    return sock
+
+
+class Supervisor:
+    def __init__(self, app: object, sock: socket.socket, workers: int) -> None:
+        from core.config import config
+
+        self.app = app
+        self.sock = sock
+        self.workers = workers
+        self.config = config
+
+        # pid -> (read end of the readiness pipe, spawn time)
+        self.children: Dict[int, Tuple[int, float]] = {}
+        self.signals: List[int] = []
+        self.stopping = False
+
+    # Supervisor side
+
+    def run(self) -> None:
+        wakeup_read, wakeup_write = os.pipe()
+        os.set_blocking(wakeup_write, False)
+        signal.set_wakeup_fd(wakeup_write)
+        for signum in (
+            signal.SIGTERM,
+            signal.SIGINT,
+            signal.SIGHUP,
+            signal.SIGCHLD,
+            signal.SIGTTIN,
+            signal.SIGTTOU,
+        ):
+            signal.signal(signum, self.on_signal)
+
+        # Gauges created while preloading belong to no worker, only workers
+        # serve and report
+        from prometheus_client import multiprocess
+
+        multiprocess.mark_process_dead(os.getpid())
+
+        # Objects created so far are never freed, keep the collector from
+        # touching, and so copying, their pages in every worker
+        gc.freeze()
+
+        for _ in range(self.workers):
+            self.spawn()
+
+        while not self.stopping:
+            select.select([wakeup_read], [], [], 1.0)
+            try:
+                os.read(wakeup_read, 1024)
+            except BlockingIOError:
+                pass
+            self.reap()
+            self.handle_signals()
+
+        self.shutdown()
+
+    def on_signal(self, signum: int, frame) -> None:
+        self.signals.append(signum)
+
+    def handle_signals(self) -> None:
+        while self.signals:
+            signum = self.signals.pop(0)
+            if signum in (signal.SIGTERM, signal.SIGINT):
+                self.stopping = True
+                return
+            if signum == signal.SIGHUP:
+                self.rolling_restart()
+            elif signum == signal.SIGTTIN:
+                self.workers += 1
+                self.spawn()
+            elif signum == signal.SIGTTOU and self.workers > 1:
+                self.workers -= 1
+                self.stop(next(iter(self.children)))
+
+    def reap(self) -> None:
+        from prometheus_client import multiprocess
+
+        while True:
+            try:
+                pid, status = os.waitpid(-1, os.WNOHANG)
+            except ChildProcessError:
+                break
+            if pid == 0:
+                break
+
+            ready, spawned_at = self.children.pop(pid, (None, time.monotonic()))
+            # Drops the exited worker's in-flight and pool gauges
+            multiprocess.mark_process_dead(pid)
+            if ready is not None:
+                os.close(ready)
+            if self.stopping or len(self.children) >= self.workers:
+                continue
+
+            logger.warning("Worker %s exited (status %s), replacing it", pid, status)
+            # Do not spin when workers crash while booting
+            if time.monotonic() - spawned_at < 1:
+                time.sleep(1)
+            self.spawn()
+
+    def rolling_restart(self) -> None:
+        logger.info("Rolling restart of %s workers", len(self.children))
+        for pid in list(self.children):
+            successor = self.spawn()
+            if not self.wait_ready(successor):
+                logger.error("Worker %s did not start, keeping %s", successor, pid)
+                self.stop(successor)
+                return
+            self.stop(pid)
+
+    def wait_ready(self, pid: int) -> bool:
+        ready, _ = self.children[pid]
+        readable, _, _ = select.select(
+            [ready], [], [], self.config.SERVER_GRACEFUL_TIMEOUT
+        )
+        return bool(readable) and os.read(ready, 1) == b"1"
+
+    def stop(self, pid: int) -> None:
+        try:
+            os.kill(pid, signal.SIGTERM)
+        except ProcessLookupError:
+            pass
+
+    def shutdown(self) -> None:
+        logger.info("Stopping %s workers", len(self.children))
+        for pid in list(self.children):
+            self.stop(pid)
+
+        deadline = time.monotonic() + self.config.SERVER_GRACEFUL_TIMEOUT
+        while self.children and time.monotonic() < deadline:
+            self.reap()
+            time.sleep(0.1)
+        for pid in list(self.children):
+            logger.warning("Worker %s did not stop in time, killing it", pid)
+            os.kill(pid, signal.SIGKILL)
+        self.sock.close()
+
+    def spawn(self) -> int:
+        ready_read, ready_write = os.pipe()
+        pid = os.fork()
+        if pid == 0:
+            os.close(ready_read)
+            status = 1
+            try:
+                if self.run_worker(ready_write):
+                    status = 0
+            finally:
+                os._exit(status)
+
+        os.close(ready_write)
+        self.children[pid] = (ready_read, time.monotonic())
+        return pid
+
+    # Worker side
+
+    def run_worker(self, ready: int) -> bool:
+        """Serves until told to stop, returns whether the worker started."""
+        from core.database.session import engines, readers
+        from core.security import JWTHandler
+
+        spawned_at = time.perf_counter()
+        for sibling_ready, _ in self.children.values():
+            os.close(sibling_ready)
+        self.children = {}
+        signal.set_wakeup_fd(-1)
+        for signum in (signal.SIGTERM, signal.SIGINT, signal.SIGCHLD):
+            signal.signal(signum, signal.SIG_DFL)
+        for signum in (signal.SIGHUP, signal.SIGTTIN, signal.SIGTTOU):
+            signal.signal(signum, signal.SIG_IGN)
+
+        # Pools inherited from the supervisor must not be reused, see
+        # "Using Connection Pools with Multiprocessing" in the SQLAlchemy docs
+        for engine in [engines["writer"], *readers.engines]:
+            engine.sync_engine.dispose(close=False)
+        JWTHandler.load_keys()
+
+        server = WorkerServer(
+            uvicorn.Config(
+                self.app,
+                loop=self.config.SERVER_LOOP,
+                http=self.config.SERVER_HTTP,
+                backlog=self.config.SERVER_BACKLOG,
+                timeout_keep_alive=self.config.SERVER_KEEP_ALIVE,
+                timeout_graceful_shutdown=self.config.SERVER_GRACEFUL_TIMEOUT,
+                lifespan="on",
+                access_log=False,
+            ),
+            ready=ready,
+            spawned_at=spawned_at,
+        )
+        server.run(sockets=[self.sock])
+        return server.started
+
+
+def main() -> None:
+    logging.basicConfig(format="%(asctime)s %(name)s %(message)s")
+    logger.setLevel(logging.INFO)
+
+    from core.config import config
+
+    metrics_dir, temporary = prepare_metrics_dir(config.METRICS_MULTIPROC_DIR)
+    app, phases = preload()
+    logger.info("App preloaded: %s", phases)
+
+    workers = config.SERVER_WORKERS or os.cpu_count() or 1
+    sock = bind(config.SERVER_HOST, config.SERVER_PORT, config.SERVER_BACKLOG)
+    logger.info(
+        "Listening on %s:%s with %s workers (%s loop, %s parser)",
+        config.SERVER_HOST,
+        config.SERVER_PORT,
+        workers,
+        config.SERVER_LOOP,
+        config.SERVER_HTTP,
+    )
+    try:
+        Supervisor(app, sock, workers).run()
+    finally:
+        if temporary:
+            shutil.rmtree(metrics_dir, ignore_errors=True)
+    sys.exit(0)
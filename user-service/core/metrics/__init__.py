@@ -0,0 +1,3 @@
+from .metrics_manager import Metrics, MetricsManager
+
+__all__ = ["Metrics", "MetricsManager"]
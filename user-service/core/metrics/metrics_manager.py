@@ -0,0 +1,103 @@
+import asyncio
+import logging
+import os
+from typing import Any, Dict, Tuple
+
+from prometheus_client import (CONTENT_TYPE_LATEST, REGISTRY, CollectorRegistry,
+                               generate_latest, multiprocess)
+
+from core.database.pool import pool_stats
+from core.database.session import engines, readers
+from core.rate_limit import RateLimiter
+from core.security import JWTHandler, PasswordHandler
+
+from . import registry
+
+logger = logging.getLogger(__name__)
+
+
+class MetricsManager:
+    """
+    Exposes the service's metrics in the Prometheus text format.
+
+    Request metrics are recorded as requests are served. Pool, bcrypt, rate
+    limit and JWT cache figures are sampled from the stats the components already keep,
+    every ``interval`` seconds and on each scrape.
+
+    With ``PROMETHEUS_MULTIPROC_DIR`` set, which the prefork launcher does, each
+    worker writes its values to files in that directory and a scrape of any
+    worker aggregates all of them.
+    """
+
+    def __init__(self) -> None:
+        # Last sampled value of each cumulative stat, by the counter it feeds
+        self._totals: Dict[Any, float] = {}
+
+    @property
+    def multiprocess(self) -> bool:
+        return "PROMETHEUS_MULTIPROC_DIR" in os.environ
+
+    def render(self) -> Tuple[bytes, str]:
+        self.refresh()
+        if not self.multiprocess:
+            return generate_latest(REGISTRY), CONTENT_TYPE_LATEST
+
+        collector_registry = CollectorRegistry()
+        multiprocess.MultiProcessCollector(collector_registry)
+        return generate_latest(collector_registry), CONTENT_TYPE_LATEST
+
+    def refresh(self) -> None:
+        named_engines = {"writer": engines["writer"]}
+        for index, engine in enumerate(readers.engines):
+            named_engines[f"reader-{index}"] = engine
+
+        for name, engine in named_engines.items():
+            stats = pool_stats(engine)
+            registry.DB_POOL_SIZE.labels(name).set(stats["size"])
+            for state in ("checked_in", "checked_out", "overflow"):
+                registry.DB_POOL_CONNECTIONS.labels(name, state).set(stats[state])
+            if "waits" in stats:
+                waits = stats["waits"]
+                self._advance(registry.DB_POOL_CHECKOUTS.labels(name), waits)
+                self._advance(
+                    registry.DB_POOL_CHECKOUT_WAIT.labels(name),
+                    stats["wait_time_avg"] * waits,
+                )
+                self._advance(registry.DB_POOL_TIMEOUTS.labels(name), stats["timeouts"])
+
+        password = PasswordHandler.stats()
+        registry.PASSWORD_HASH_WORKERS.set(password["workers"])
+        registry.PASSWORD_HASH_TASKS.labels("queued").set(password["queued"])
+        registry.PASSWORD_HASH_TASKS.labels("running").set(password["running"])
+        self._advance(registry.PASSWORD_HASH_COMPLETED, password["completed"])
+
+        for name, total in RateLimiter.stats().items():
+            if name == "errors":
+                self._advance(registry.RATE_LIMIT_ERRORS, total)
+            else:
+                # Counted as "<limit>_allowed" and "<limit>_rejected"
+                limit, result = name.rsplit("_", 1)
+                self._advance(registry.RATE_LIMIT_CHECKS.labels(limit, result), total)
+
+        jwt_cache = JWTHandler.cache_stats()
+        self._advance(registry.JWT_CACHE_LOOKUPS.labels("hit"), jwt_cache["hits"])
+        self._advance(registry.JWT_CACHE_LOOKUPS.labels("miss"), jwt_cache["misses"])
+        registry.JWT_CACHE_HIT_RATIO.set(jwt_cache["hit_ratio"])
+
+    async def run_refresh(self, interval: float) -> None:
+        while True:
+            try:
+                self.refresh()
+            except Exception as exception:
+                logger.warning("Metrics refresh failed: %s", exception)
+            await asyncio.sleep(interval)
+
+    def _advance(self, counter: Any, total: float) -> None:
+        """Increments a counter up to a cumulative total kept elsewhere."""
+        delta = total - self._totals.get(counter, 0)
+        if delta > 0:
+            counter.inc(delta)
+        self._totals[counter] = total
+
+
+Metrics = MetricsManager()
@@ -0,0 +1,78 @@
+from prometheus_client import Counter, Gauge, Histogram
+
+# Gauges are summed over the live workers in multiprocess mode unless noted,
+# counters and histograms keep the values of workers that have exited
+
+# HTTP, recorded by MetricsMiddleware
+REQUEST_DURATION = Histogram(
+    "http_request_duration_seconds",
+    "Request latency by route template",
+    ["method", "route", "status"],
+)
+REQUESTS_IN_PROGRESS = Gauge(
+    "http_requests_in_progress",
+    "Requests being served",
+    ["method"],
+    multiprocess_mode="livesum",
+)
+REQUEST_ERRORS = Counter(
+    "http_request_errors_total",
+    "Requests that failed with a server error or an unhandled exception",
+    ["method", "route", "status"],
+)
+
+# Connection pools, sampled by MetricsManager.refresh
+DB_POOL_SIZE = Gauge(
+    "db_pool_size", "Configured pool size", ["engine"], multiprocess_mode="livesum"
+)
+DB_POOL_CONNECTIONS = Gauge(
+    "db_pool_connections",
+    "Pooled connections by state",
+    ["engine", "state"],
+    multiprocess_mode="livesum",
+)
+DB_POOL_CHECKOUTS = Counter(
+    "db_pool_checkouts_total", "Connections checked out of the pool", ["engine"]
+)
+DB_POOL_CHECKOUT_WAIT = Counter(
+    "db_pool_checkout_wait_seconds_total",
+    "Time spent waiting for a pooled connection",
+    ["engine"],
+)
+DB_POOL_TIMEOUTS = Counter(
+    "db_pool_timeouts_total", "Checkouts that timed out", ["engine"]
+)
+
+# bcrypt thread pool
+PASSWORD_HASH_WORKERS = Gauge(
+    "password_hash_workers", "bcrypt pool threads", multiprocess_mode="livesum"
+)
+PASSWORD_HASH_TASKS = Gauge(
+    "password_hash_tasks",
+    "bcrypt tasks queued for or running on the pool",
+    ["state"],
+    multiprocess_mode="livesum",
+)
+PASSWORD_HASH_COMPLETED = Counter(
+    "password_hash_completed_total", "bcrypt tasks completed"
+)
+
+# Login rate limits
+RATE_LIMIT_CHECKS = Counter(
+    "rate_limit_checks_total",
+    "Rate limit checks by limit and outcome",
+    ["limit", "result"],
+)
+RATE_LIMIT_ERRORS = Counter(
+    "rate_limit_errors_total", "Checks let through because the backend failed"
+)
+
+# Verified JWT claims cache
+JWT_CACHE_LOOKUPS = Counter(
+    "jwt_claims_cache_lookups_total", "Claims cache lookups", ["result"]
+)
+JWT_CACHE_HIT_RATIO = Gauge(
+    "jwt_claims_cache_hit_ratio",
+    "Claims cache hit ratio since the worker started, one series per worker",
+    multiprocess_mode="liveall",
+)
@@ -0,0 +1,12 @@
+from .base import BaseRateLimitBackend
+from .memory_backend import InMemoryRateLimitBackend
+from .rate_limit_manager import RateLimiter, RateLimitManager
+from .redis_backend import RedisRateLimitBackend
+
+__all__ = [
+    "BaseRateLimitBackend",
+    "InMemoryRateLimitBackend",
+    "RateLimiter",
+    "RateLimitManager",
+    "RedisRateLimitBackend",
+]
@@ -0,0 +1,16 @@
+from abc import ABC, abstractmethod
+
+
+class BaseRateLimitBackend(ABC):
+    """Interface every rate limit backend has to implement."""
+
+    @abstractmethod
+    async def hit(self, key: str, limit: int, window: float) -> float:
+        """
+        Records a hit on the key unless it already had ``limit`` hits in the
+        last ``window`` seconds. Returns ``0`` when the hit is allowed, or the
+        seconds until it would be.
+        """
+
+    @abstractmethod
+    async def close(self) -> None: ...
@@ -0,0 +1,38 @@
+import time
+from collections import OrderedDict, deque
+from typing import Deque
+
+from .base import BaseRateLimitBackend
+
+
+class InMemoryRateLimitBackend(BaseRateLimitBackend):
+    """
+    Process-local sliding window log, each worker counts on its own. The least
+    recently used keys are dropped beyond ``max_keys``, so a flood of distinct
+    keys cannot grow it without bound.
+    """
+
+    def __init__(self, max_keys: int = 100_000) -> None:
+        self.max_keys = max_keys
+        self._windows: OrderedDict[str, Deque[float]] = OrderedDict()
+
+    async def hit(self, key: str, limit: int, window: float) -> float:
+        now = time.monotonic()
+        hits = self._windows.get(key)
+        if hits is None:
+            hits = self._windows[key] = deque()
+            if len(self._windows) > self.max_keys:
+                self._windows.popitem(last=False)
+        else:
+            self._windows.move_to_end(key)
+
+        while hits and hits[0] <= now - window:
+            hits.popleft()
+
+        if len(hits) >= limit:
+            return hits[0] + window - now
+        hits.append(now)
+        return 0.0
+
+    async def close(self) -> None:
+        self._windows.clear()
@@ -0,0 +1,59 @@
+import logging
+from collections import Counter
+from typing import Dict
+
+from core.exceptions import TooManyRequestsException
+
+from .base import BaseRateLimitBackend
+from .memory_backend import InMemoryRateLimitBackend
+
+logger = logging.getLogger(__name__)
+
+
+class RateLimitManager:
+    """
+    Named sliding-window limits over a shared backend.
+
+    Backend errors are logged and let the request through, a broken limiter
+    must not lock everyone out.
+    """
+
+    def __init__(self) -> None:
+        self.backend: BaseRateLimitBackend = InMemoryRateLimitBackend()
+        self.counters: Counter = Counter()
+
+    def init(self, backend: BaseRateLimitBackend) -> None:
+        self.backend = backend
+
+    async def close(self) -> None:
+        await self.backend.close()
+        self.backend = InMemoryRateLimitBackend()
+
+    async def hit(self, name: str, key: str, limit: int, window: float) -> None:
+        """
+        Counts a hit against the ``name`` limit for the key, raising
+        ``TooManyRequestsException`` once it is over ``limit`` per ``window``
+        seconds. A limit of 0 or less disables the check.
+        """
+        if limit <= 0:
+            return
+
+        try:
+            retry_after = await self.backend.hit(f"{name}:{key}", limit, window)
+        except Exception as exception:
+            logger.warning("Rate limit check %s failed: %s", name, exception)
+            self.counters["errors"] += 1
+            return
+
+        if retry_after > 0:
+            self.counters[f"{name}_rejected"] += 1
+            raise TooManyRequestsException(
+                "Too many attempts, try again later", retry_after=retry_after
+            )
+        self.counters[f"{name}_allowed"] += 1
+
+    def stats(self) -> Dict[str, int]:
+        return dict(self.counters)
+
+
+RateLimiter = RateLimitManager()
@@ -0,0 +1,57 @@
+import secrets
+import time
+from typing import TYPE_CHECKING, Optional
+
+from .base import BaseRateLimitBackend
+
+if TYPE_CHECKING:
+    from redis.asyncio import Redis
+
+# Trims the window, then either rejects with the seconds until the oldest hit
+# leaves it or records the hit, in one round trip
+SLIDING_WINDOW = """
+local now, window, limit = tonumber(ARGV[1]), tonumber(ARGV[2]), tonumber(ARGV[3])
+redis.call('ZREMRANGEBYSCORE', KEYS[1], '-inf', now - window)
+if redis.call('ZCARD', KEYS[1]) >= limit then
+    local oldest = redis.call('ZRANGE', KEYS[1], 0, 0, 'WITHSCORES')
+    return tostring(tonumber(oldest[2]) + window - now)
+end
+redis.call('ZADD', KEYS[1], now, ARGV[4])
+redis.call('PEXPIRE', KEYS[1], math.ceil(window * 1000))
+return '0'
+"""
+
+
+class RedisRateLimitBackend(BaseRateLimitBackend):
+    """
+    Sliding window log shared by every worker, one sorted set of hit times per
+    key under ``<prefix>:ratelimit:<key>``.
+    """
+
+    def __init__(
+        self,
+        url: str,
+        prefix: str,
+        socket_timeout: Optional[float] = None,
+        socket_connect_timeout: Optional[float] = None,
+    ) -> None:
+        from redis.asyncio import Redis
+
+        self.redis: "Redis" = Redis.from_url(
+            url,
+            socket_timeout=socket_timeout,
+            socket_connect_timeout=socket_connect_timeout,
+        )
+        self.prefix = f"{prefix}:ratelimit"
+        self.script = self.redis.register_script(SLIDING_WINDOW)
+
+    async def hit(self, key: str, limit: int, window: float) -> float:
+        now = time.time()
+        retry_after = await self.script(
+            keys=[f"{self.prefix}:{key}"],
+            args=[now, window, limit, f"{now}:{secrets.token_hex(4)}"],
+        )
+        return float(retry_after)
+
+    async def close(self) -> None:
+        await self.redis.aclose()
@@ -1,12 +1,19 @@
-from typing import Any, Dict, Generic, Optional, Sequence, Type, TypeVar
+from typing import (Any, Dict, Generic, Iterator, List, Optional, Sequence, Set,
+                    Tuple, Type, TypeVar)
 from uuid import UUID
 
+from sqlalchemy.engine import Row
 from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.sql import select
+from sqlalchemy.sql import delete, insert, select, tuple_, update
 
+from core.cache import Cache
 from core.database import Base
 
+from .pagination import decode_cursor, encode_cursor
+from .projection import Projection, projection_columns
+from .statements import lookup_statement
+
 # Generic type for SQLAlchemy models
 ModelType = TypeVar("ModelType", bound=Base)
 
@@ -19,8 +26,16 @@ class BaseRepository(Generic[ModelType]):
     This class provides common CRUD operations that can be inherited or instantiated
     for any SQLAlchemy model. All database operations are performed using an asynchronous
     session for non-blocking database access.
+
+    Lookups through ``get_by`` on any of ``cache_fields`` are served from the
+    read-through cache when one is configured. Columns in ``cache_exclude`` are
+    never cached, instances served from the cache leave them unloaded.
     """
 
+    cache_fields: Tuple[str, ...] = ("id", "uuid")
+    cache_exclude: Tuple[str, ...] = ()
+    bulk_chunk_size: int = 1000
+
     def __init__(self, model: Type[ModelType], db_session: AsyncSession) -> None:
         """
         Initialize the BaseRepository instance.
@@ -32,12 +47,16 @@ class BaseRepository(Generic[ModelType]):
         self.session = db_session
         self.model = model
 
-    async def create(self, attributes: Optional[Dict[str, Any]] = None) -> ModelType:
+    async def create(
+        self, attributes: Optional[Dict[str, Any]] = None, flush: bool = False
+    ) -> ModelType:
         """
         Create a new record in the database.
 
         Args:
             attributes (Optional[Dict[str, Any]]): A dictionary of attributes to set on the new record.
+            flush (bool): Emit the INSERT right away, so constraint violations are
+                raised here instead of at commit.
 
         Returns:
             ModelType: The created record instance.
@@ -46,11 +65,17 @@ class BaseRepository(Generic[ModelType]):
             attributes = {}
         new_record = self.model(**attributes)
         self.session.add(new_record)
+        if flush:
+            await self.session.flush()
         return new_record
 
     async def get_all(
-        self, skip: int = 0, limit: int = 20, filters: Optional[Dict[str, Any]] = None
-    ) -> Sequence[ModelType]:
+        self,
+        skip: int = 0,
+        limit: int = 20,
+        filters: Optional[Dict[str, Any]] = None,
+        projection: Optional[Projection] = None,
+    ) -> Sequence[ModelType] | Sequence[Row]:
         """
         Retrieve a list of records with optional pagination and filtering.
 
@@ -58,30 +83,95 @@ class BaseRepository(Generic[ModelType]):
             skip (int): Number of records to skip for pagination.
             limit (int): Maximum number of records to retrieve.
             filters (Optional[Dict[str, Any]]): Dictionary of field-value pairs to filter by.
+            projection (Optional[Projection]): Column names, or a Pydantic model or
+                dataclass whose fields name them. Only those columns are loaded.
+
+        Returns:
+            Sequence[ModelType] | Sequence[Row]: A list of model instances, or of
+            lightweight rows when a projection is given.
+        """
+        if projection is None:
+            query = select(self.model)
+        else:
+            query = select(*projection_columns(self.model, projection))
+        query = query.offset(skip).limit(limit)
+        if filters:
+            query = query.filter_by(**filters)
+        result = await self.session.execute(query)
+
+        return result.scalars().all() if projection is None else result.all()
+
+    async def get_page(
+        self,
+        limit: int = 20,
+        cursor: Optional[str] = None,
+        filters: Optional[Dict[str, Any]] = None,
+        order_by: Tuple[str, ...] = ("id",),
+    ) -> Tuple[Sequence[ModelType], Optional[str]]:
+        """
+        Retrieve a page of records using keyset (cursor) pagination.
+
+        Unlike ``get_all`` the database never scans the rows of earlier pages, the
+        cursor seeks straight past the last row that was returned. ``order_by``
+        must be unique, so end it with the primary key (e.g. ``("created_at", "id")``).
+
+        Args:
+            limit (int): Maximum number of records to retrieve.
+            cursor (Optional[str]): Token returned with the previous page.
+            filters (Optional[Dict[str, Any]]): Dictionary of field-value pairs to filter by.
+            order_by (Tuple[str, ...]): Ascending sort columns the cursor is keyed on.
 
         Returns:
-            Sequence[ModelType]: A list of model instances.
+            Tuple[Sequence[ModelType], Optional[str]]: The records, and the cursor of
+            the next page or None on the last page.
+
+        Raises:
+            ValueError: If the cursor is malformed.
         """
-        query = select(self.model).offset(skip).limit(limit)
+        columns = [getattr(self.model, field) for field in order_by]
+        query = select(self.model)
         if filters:
             query = query.filter_by(**filters)
+        if cursor:
+            values = decode_cursor(cursor, columns)
+            query = query.where(tuple_(*columns) > tuple_(*values))
+        query = query.order_by(*columns).limit(limit + 1)
+
         result = await self.session.execute(query)
+        records = result.scalars().all()
 
-        return result.scalars().all()
+        if len(records) <= limit:
+            return records, None
+        records = records[:limit]
+        return records, encode_cursor([getattr(records[-1], f) for f in order_by])
 
-    async def get_by(self, field: str, value: Any) -> Optional[ModelType]:
+    @Cache.cached_lookup()
+    async def get_by(
+        self,
+        field: str,
+        value: Any,
+        projection: Optional[Projection] = None,
+        cached: bool = True,
+    ) -> Optional[ModelType] | Optional[Row]:
         """
         Retrieve a single record by a specific field and value.
 
         Args:
             field (str): The field name to filter by.
             value (Any): The value to filter on.
+            projection (Optional[Projection]): Column names, or a Pydantic model or
+                dataclass whose fields name them. Only those columns are loaded.
+            cached (bool): Set to False to bypass the cache, e.g. to read columns
+                listed in ``cache_exclude``.
 
         Returns:
-            Optional[ModelType]: The first model instance matching the criteria, or None.
+            Optional[ModelType] | Optional[Row]: The first model instance matching the
+            criteria, a lightweight row when a projection is given, or None.
         """
-        query = select(self.model).where(getattr(self.model, field) == value)
-        result = await self.session.execute(query)
+        query = lookup_statement(self.model, field, projection)
+        result = await self.session.execute(query, {"value": value})
+        if projection is not None:
+            return result.first()
         return result.scalars().first()
 
     async def update(
@@ -97,10 +187,13 @@ class BaseRepository(Generic[ModelType]):
         Returns:
             Optional[ModelType]: The updated model instance, or None if update failed.
         """
+        stale_keys = Cache.keys_for(model, self.cache_fields)
         for key, value in attributes.items():
             setattr(model, key, value)
+        stale_keys |= Cache.keys_for(model, self.cache_fields)
         try:
             await self.session.flush()
+            Cache.mark_stale(self.session, stale_keys)
             return model
         except SQLAlchemyError:
             await self.session.rollback()
@@ -118,7 +211,133 @@ class BaseRepository(Generic[ModelType]):
         """
         try:
             await self.session.delete(model)
+            Cache.mark_stale(self.session, Cache.keys_for(model, self.cache_fields))
             return True
         except SQLAlchemyError:
             await self.session.rollback()
             return False
+
+    async def create_many(
+        self, rows: Sequence[Dict[str, Any]], chunk_size: Optional[int] = None
+    ) -> List[ModelType]:
+        """
+        Insert many records with set-based ``INSERT ... RETURNING`` statements,
+        one per chunk of rows.
+
+        Args:
+            rows (Sequence[Dict[str, Any]]): The attributes of each new record.
+            chunk_size (Optional[int]): Rows per statement, defaults to ``bulk_chunk_size``.
+
+        Returns:
+            List[ModelType]: The created record instances.
+        """
+        created: List[ModelType] = []
+        for chunk in self._chunks(rows, chunk_size):
+            result = await self.session.scalars(
+                insert(self.model).returning(self.model), chunk
+            )
+            created.extend(result.all())
+        return created
+
+    async def update_where(
+        self,
+        filters: Dict[str, Any],
+        attributes: Dict[str, Any],
+        chunk_size: Optional[int] = None,
+    ) -> int:
+        """
+        Update every record matching the filters with a set-based ``UPDATE``.
+
+        A filter whose value is a list, tuple or set becomes an ``IN`` clause;
+        that list is split into chunks of ``chunk_size`` values, one statement each.
+
+        Args:
+            filters (Dict[str, Any]): Dictionary of field-value pairs to filter by.
+            attributes (Dict[str, Any]): A dictionary of attributes to update.
+            chunk_size (Optional[int]): Values per ``IN`` clause, defaults to ``bulk_chunk_size``.
+
+        Returns:
+            int: The number of updated records.
+        """
+        updated = 0
+        returning = [getattr(self.model, field) for field in self.cache_fields]
+        for where in self._where_chunks(filters, chunk_size):
+            stale_keys: Set[str] = set()
+            # Lookup keys that are about to change have to be collected up front
+            if set(attributes) & set(self.cache_fields):
+                result = await self.session.execute(select(*returning).where(*where))
+                stale_keys |= self._keys_for_rows(result.all())
+
+            result = await self.session.execute(
+                update(self.model).where(*where).values(**attributes).returning(*returning)
+            )
+            rows = result.all()
+            stale_keys |= self._keys_for_rows(rows)
+            Cache.mark_stale(self.session, stale_keys)
+            updated += len(rows)
+        return updated
+
+    async def delete_where(
+        self, filters: Dict[str, Any], chunk_size: Optional[int] = None
+    ) -> int:
+        """
+        Delete every record matching the filters with a set-based ``DELETE``.
+        Filters are handled as in ``update_where``.
+
+        Args:
+            filters (Dict[str, Any]): Dictionary of field-value pairs to filter by.
+            chunk_size (Optional[int]): Values per ``IN`` clause, defaults to ``bulk_chunk_size``.
+
+        Returns:
+            int: The number of deleted records.
+        """
+        deleted = 0
+        returning = [getattr(self.model, field) for field in self.cache_fields]
+        for where in self._where_chunks(filters, chunk_size):
+            result = await self.session.execute(
+                delete(self.model).where(*where).returning(*returning)
+            )
+            rows = result.all()
+            Cache.mark_stale(self.session, self._keys_for_rows(rows))
+            deleted += len(rows)
+        return deleted
+
+    def _chunks(
+        self, values: Sequence[Any], chunk_size: Optional[int] = None
+    ) -> Iterator[Sequence[Any]]:
+        size = chunk_size or self.bulk_chunk_size
+        for start in range(0, len(values), size):
+            yield values[start : start + size]
+
+    def _where_chunks(
+        self, filters: Dict[str, Any], chunk_size: Optional[int] = None
+    ) -> Iterator[List[Any]]:
+        if not filters:
+            # An unfiltered bulk statement would touch the whole table
+            raise ValueError("Bulk updates and deletes require at least one filter")
+
+        where = []
+        chunked_field, chunked_values = None, None
+        for field, value in filters.items():
+            if isinstance(value, (list, tuple, set, frozenset)):
+                if chunked_field is not None:
+                    raise ValueError("Only one filter may hold a list of values")
+                chunked_field, chunked_values = field, list(value)
+            else:
+                where.append(getattr(self.model, field) == value)
+
+        if chunked_field is None:
+            yield where
+            return
+
+        column = getattr(self.model, chunked_field)
+        for chunk in self._chunks(chunked_values, chunk_size):
+            yield [*where, column.in_(chunk)]
+
+    def _keys_for_rows(self, rows: Sequence[Any]) -> Set[str]:
+        return {
+            Cache.make_key(self.model, field, value)
+            for row in rows
+            for field, value in zip(self.cache_fields, row)
+            if value is not None
+        }
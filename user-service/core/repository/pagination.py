@@ -0,0 +1,49 @@
+import base64
+import json
+from datetime import date, datetime
+from typing import Any, List, Sequence
+
+from sqlalchemy.orm import InstrumentedAttribute
+
+
+def encode_cursor(values: Sequence[Any]) -> str:
+    """
+    Encodes the ordering values of the last row of a page as an opaque token.
+    """
+    payload = json.dumps(
+        [value.isoformat() if isinstance(value, date) else value for value in values],
+        default=str,
+        separators=(",", ":"),
+    )
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str, columns: Sequence[InstrumentedAttribute]) -> List[Any]:
+    """
+    Decodes a token produced by ``encode_cursor`` back into values typed after
+    ``columns``. Raises ``ValueError`` when the token is malformed.
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        values = json.loads(base64.urlsafe_b64decode(padded.encode()))
+    except (ValueError, TypeError) as exception:
+        raise ValueError("Malformed cursor") from exception
+
+    if not isinstance(values, list) or len(values) != len(columns):
+        raise ValueError("Malformed cursor")
+
+    decoded = []
+    try:
+        for column, value in zip(columns, values):
+            python_type = column.type.python_type
+            # Ordering columns are never NULL, and None would compare as NULL
+            if value is None or isinstance(value, (list, dict)):
+                raise ValueError("Malformed cursor")
+            if python_type is datetime:
+                value = datetime.fromisoformat(value)
+            elif not isinstance(value, python_type):
+                value = python_type(value)
+            decoded.append(value)
+    except (ValueError, TypeError, OverflowError) as exception:
+        raise ValueError("Malformed cursor") from exception
+    return decoded
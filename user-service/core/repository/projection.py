@@ -0,0 +1,36 @@
+import dataclasses
+from functools import lru_cache
+from typing import Any, Sequence, Tuple, Type, Union
+
+from pydantic import BaseModel
+from sqlalchemy import inspect
+
+# Either explicit column names, or a Pydantic model / dataclass whose fields
+# name the columns to load
+Projection = Union[Sequence[str], Type[Any]]
+
+
+@lru_cache(maxsize=256)
+def _columns_for(model: Type[Any], projection: Any) -> Tuple[str, ...]:
+    if isinstance(projection, type) and issubclass(projection, BaseModel):
+        names = projection.model_fields.keys()
+    elif isinstance(projection, type) and dataclasses.is_dataclass(projection):
+        names = [field.name for field in dataclasses.fields(projection)]
+    else:
+        names = projection
+
+    columns = inspect(model).column_attrs.keys()
+    selected = tuple(name for name in names if name in columns)
+    if not selected:
+        raise ValueError(f"Projection selects no columns of {model.__name__}")
+    return selected
+
+
+def projection_columns(model: Type[Any], projection: Projection) -> list:
+    """
+    Returns the model's column attributes named by the projection. Fields that
+    are not columns of the model (computed or nested values) are skipped.
+    """
+    if not isinstance(projection, type):
+        projection = tuple(projection)
+    return [getattr(model, name) for name in _columns_for(model, projection)]
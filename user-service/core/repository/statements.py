@@ -0,0 +1,33 @@
+from functools import lru_cache
+from typing import Any, Optional, Type
+
+from sqlalchemy import Select, bindparam, select
+
+from .projection import Projection, projection_columns
+
+
+@lru_cache(maxsize=512)
+def _lookup_statement(
+    model: Type[Any], field: str, projection: Optional[Any]
+) -> Select:
+    if projection is None:
+        query = select(model)
+    else:
+        query = select(*projection_columns(model, projection))
+    return query.where(getattr(model, field) == bindparam("value"))
+
+
+def lookup_statement(
+    model: Type[Any], field: str, projection: Optional[Projection] = None
+) -> Select:
+    """
+    Returns the ``SELECT ... WHERE <field> = :value`` statement for the model.
+
+    The statement is built once per (model, field, projection) and reused, so
+    SQLAlchemy computes its cache key once and every call hits the compiled
+    cache. The SQL text is identical across calls, which also keeps asyncpg's
+    prepared statement cache warm. Execute it with ``{"value": ...}``.
+    """
+    if projection is not None and not isinstance(projection, type):
+        projection = tuple(projection)
+    return _lookup_statement(model, field, projection)
@@ -1,4 +1,5 @@
 from .jwt import JWTHandler
 from .password import PasswordHandler
+from .revocation import Revocations
 
-__all__ = ["JWTHandler", "PasswordHandler"]
+__all__ = ["JWTHandler", "PasswordHandler", "Revocations"]
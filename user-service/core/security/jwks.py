@@ -0,0 +1,83 @@
+import asyncio
+import time
+from typing import Any, Dict, List, Optional
+
+import httpx
+from jose import ExpiredSignatureError, JWTError, jwk, jwt
+from jose.backends.base import Key
+
+from .jwt import JWTDecodeError, JWTExpiredError
+
+
+class JWKSVerifier:
+    """
+    Verifies user-service tokens locally from its published JWKS.
+
+    Meant for the other services: keys are fetched once and kept in memory,
+    so verifying a token costs no network round trip. The key set is refetched
+    after ``ttl`` seconds, or when a token names an unknown ``kid`` (at most
+    once every ``min_refresh_interval`` seconds, so forged kids cannot make us
+    hammer the endpoint).
+
+        verifier = JWKSVerifier("http://user-service/v1/auth/.well-known/jwks.json")
+        claims = await verifier.verify(token)
+    """
+
+    def __init__(
+        self,
+        url: str,
+        algorithms: Optional[List[str]] = None,
+        ttl: float = 300,
+        min_refresh_interval: float = 30,
+        timeout: float = 2,
+    ) -> None:
+        self.url = url
+        self.algorithms = algorithms or ["ES256"]
+        self.ttl = ttl
+        self.min_refresh_interval = min_refresh_interval
+        self.timeout = timeout
+
+        self.keys: Dict[str, Key] = {}
+        self.fetched_at = 0.0
+        self._lock = asyncio.Lock()
+
+    async def verify(self, token: str) -> Dict[str, Any]:
+        try:
+            kid = jwt.get_unverified_header(token).get("kid")
+        except JWTError as exception:
+            raise JWTDecodeError() from exception
+
+        age = time.monotonic() - self.fetched_at
+        if age > self.ttl or (
+            kid not in self.keys and age > self.min_refresh_interval
+        ):
+            await self.refresh()
+
+        key = self.keys.get(kid)
+        if key is None:
+            raise JWTDecodeError("Unknown signing key")
+
+        try:
+            return jwt.decode(token, key, algorithms=self.algorithms)
+        except ExpiredSignatureError as exception:
+            raise JWTExpiredError() from exception
+        except JWTError as exception:
+            raise JWTDecodeError() from exception
+
+    async def refresh(self) -> None:
+        fetched_at = self.fetched_at
+        async with self._lock:
+            # Another caller refreshed while we were waiting for the lock
+            if self.fetched_at != fetched_at:
+                return
+
+            async with httpx.AsyncClient(timeout=self.timeout) as client:
+                response = await client.get(self.url)
+                response.raise_for_status()
+
+            self.keys = {
+                key["kid"]: jwk.construct(key, key.get("alg", self.algorithms[0]))
+                for key in response.json()["keys"]
+                if key.get("kid")
+            }
+            self.fetched_at = time.monotonic()
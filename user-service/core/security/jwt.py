@@ -1,11 +1,20 @@
+import hashlib
+import time
 from datetime import datetime, timedelta, timezone
-from typing import Any, Dict
-
-from jose import ExpiredSignatureError, JWTError, jwt
+from typing import TYPE_CHECKING, Any, Dict, Optional
+from uuid import uuid4
 
+from core.cache import LRUCache
 from core.config import config
 from core.exceptions import UnauthorizedException
 
+from .keys import KeySet
+
+# python-jose and its crypto backend are imported on first use, they account
+# for a good share of the service's import time
+if TYPE_CHECKING:
+    from jose.backends.base import Key
+
 
 class JWTDecodeError(UnauthorizedException):
     def __init__(self, message="Invalid token"):
@@ -22,24 +31,83 @@ class JWTHandler:
     ALGORITHM: str = config.JWT_ALGORITHM
     expire_minutes: int = config.JWT_EXPIRE_MINUTES
 
+    # Signing keys when JWT_KEYS_DIR is set, otherwise tokens use the secret
+    keys: Optional[KeySet] = None
+
+    # Verified claims keyed by the token's SHA-256 digest, each entry expiring
+    # together with the token itself
+    claims_cache: LRUCache[Dict[str, Any]] = LRUCache(maxsize=config.JWT_CACHE_SIZE)
+
+    @staticmethod
+    def load_keys() -> None:
+        """
+        (Re)loads the signing keys from JWT_KEYS_DIR. Cached claims are dropped,
+        since they may have been verified with a key that is gone now.
+        """
+        if config.JWT_KEYS_DIR:
+            JWTHandler.keys = KeySet.from_directory(
+                config.JWT_KEYS_DIR,
+                algorithm=JWTHandler.ALGORITHM,
+                active_kid=config.JWT_ACTIVE_KID,
+            )
+        JWTHandler.claims_cache.clear()
+
+    @staticmethod
+    def jwks() -> Dict[str, Any]:
+        return JWTHandler.keys.jwks if JWTHandler.keys else {"keys": []}
+
     @staticmethod
     def encode(payload: Dict[str, Any]) -> str:
         expire = datetime.now(timezone.utc) + timedelta(
             minutes=JWTHandler.expire_minutes
         )
         payload.update({"exp": expire})
+        # Lets a single token be revoked, see core.security.revocation
+        payload.setdefault("jti", uuid4().hex)
+        from jose import jwt
+
+        if JWTHandler.keys is None:
+            return jwt.encode(
+                payload,
+                JWTHandler.SECRET_KEY,
+                algorithm=JWTHandler.ALGORITHM,
+            )
+
+        kid, key = JWTHandler.keys.signing_key()
         return jwt.encode(
-            payload,
-            JWTHandler.SECRET_KEY,
-            algorithm=JWTHandler.ALGORITHM,
+            payload, key, algorithm=JWTHandler.ALGORITHM, headers={"kid": kid}
         )
 
+    @staticmethod
+    def _verification_key(token: str) -> "str | Key":
+        if JWTHandler.keys is None:
+            return JWTHandler.SECRET_KEY
+
+        from jose import JWTError, jwt
+
+        try:
+            kid = jwt.get_unverified_header(token).get("kid")
+        except JWTError as exception:
+            raise JWTDecodeError() from exception
+
+        key = JWTHandler.keys.verification_key(kid)
+        if key is None:
+            raise JWTDecodeError("Unknown signing key")
+        return key
+
     @staticmethod
     def decode(token: str) -> Dict[str, Any]:
+        digest = hashlib.sha256(token.encode()).digest()
+        claims = JWTHandler.claims_cache.get(digest)
+        if claims is not None:
+            return dict(claims)
+
+        from jose import ExpiredSignatureError, JWTError, jwt
+
         try:
-            return jwt.decode(
+            claims = jwt.decode(
                 token,
-                JWTHandler.SECRET_KEY,
+                JWTHandler._verification_key(token),
                 algorithms=[JWTHandler.ALGORITHM],
             )
         except ExpiredSignatureError as exception:
@@ -47,14 +115,29 @@ class JWTHandler:
         except JWTError as exception:
             raise JWTDecodeError() from exception
 
+        # Tokens without an expiry are never cached
+        expires_in = claims.get("exp", 0) - time.time()
+        if expires_in > 0:
+            JWTHandler.claims_cache.set(digest, claims, ttl=expires_in)
+        return dict(claims)
+
+    @staticmethod
+    def cache_stats() -> Dict[str, Any]:
+        return JWTHandler.claims_cache.stats()
+
     @staticmethod
     def decode_expire(token: str) -> Dict[str, Any]:
+        from jose import JWTError, jwt
+
         try:
             return jwt.decode(
                 token,
-                JWTHandler.SECRET_KEY,
+                JWTHandler._verification_key(token),
                 algorithms=[JWTHandler.ALGORITHM],
                 options={"verify_exp": False},
             )
         except JWTError as exception:
             raise JWTDecodeError() from exception
+
+
+JWTHandler.load_keys()
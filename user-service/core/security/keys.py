@@ -0,0 +1,57 @@
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Dict, Optional, Tuple
+
+if TYPE_CHECKING:
+    from jose.backends.base import Key
+
+
+class KeySet:
+    """
+    Asymmetric signing keys loaded from a directory of PEM private keys.
+
+    Each ``<kid>.pem`` file becomes one key, its file name being the key id.
+    Tokens are signed with the active key and verified with whichever key their
+    ``kid`` header names, so rotating is a matter of adding a new key, making it
+    active and removing the old one once every token it signed has expired.
+    """
+
+    def __init__(
+        self, keys: Dict[str, "Key"], active_kid: str, algorithm: str
+    ) -> None:
+        if active_kid not in keys:
+            raise ValueError(f"Active key {active_kid!r} is not in the key set")
+
+        self.algorithm = algorithm
+        self.active_kid = active_kid
+        self.private_keys = keys
+        self.public_keys = {kid: key.public_key() for kid, key in keys.items()}
+        self.jwks: Dict[str, Any] = {
+            "keys": [
+                {**key.to_dict(), "kid": kid, "use": "sig"}
+                for kid, key in self.public_keys.items()
+            ]
+        }
+
+    @classmethod
+    def from_directory(
+        cls, path: str, algorithm: str, active_kid: Optional[str] = None
+    ) -> "KeySet":
+        """
+        Loads every ``*.pem`` file in the directory. Without an explicit active
+        key id, the last one in sort order signs, so date-prefixed ids rotate by
+        just dropping in a newer file.
+        """
+        files = sorted(Path(path).glob("*.pem"))
+        if not files:
+            raise ValueError(f"No signing keys found in {path}")
+
+        from jose import jwk
+
+        keys = {file.stem: jwk.construct(file.read_text(), algorithm) for file in files}
+        return cls(keys, active_kid or files[-1].stem, algorithm)
+
+    def signing_key(self) -> Tuple[str, "Key"]:
+        return self.active_kid, self.private_keys[self.active_kid]
+
+    def verification_key(self, kid: Optional[str]) -> Optional["Key"]:
+        return self.public_keys.get(kid)
@@ -1,16 +1,116 @@
-from passlib.context import CryptContext
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from typing import TYPE_CHECKING, Any, Callable, Dict, Optional, Tuple
+
+from core.config import config
+
+if TYPE_CHECKING:
+    from passlib.context import CryptContext
 
 
 class PasswordHandler:
-    pwd_context: CryptContext = CryptContext(
-        schemes=["bcrypt"],
-        deprecated="auto",
+    """
+    bcrypt hashing and verification.
+
+    The ``*_async`` variants run on a dedicated thread pool (bcrypt releases the
+    GIL), so a login burst no longer blocks the event loop. The pool size caps
+    how many hashes run at once; anything above it waits in the pool's queue.
+    """
+
+    executor: ThreadPoolExecutor = ThreadPoolExecutor(
+        max_workers=config.PASSWORD_HASH_WORKERS,
+        thread_name_prefix="password-hash",
     )
 
+    _lock = threading.Lock()
+    _queued: int = 0
+    _running: int = 0
+    _completed: int = 0
+
+    # Built on first use, importing passlib is not needed to serve most requests
+    _context: Optional["CryptContext"] = None
+
+    @staticmethod
+    def context() -> "CryptContext":
+        if PasswordHandler._context is None:
+            with PasswordHandler._lock:
+                if PasswordHandler._context is None:
+                    from passlib.context import CryptContext
+
+                    PasswordHandler._context = CryptContext(
+                        schemes=["bcrypt"],
+                        deprecated="auto",
+                        bcrypt__default_rounds=config.BCRYPT_ROUNDS,
+                        bcrypt__min_rounds=config.BCRYPT_ROUNDS,
+                        bcrypt__max_rounds=config.BCRYPT_ROUNDS,
+                    )
+        return PasswordHandler._context
+
     @staticmethod
     def hash(password: str) -> str:
-        return PasswordHandler.pwd_context.hash(password)
+        return PasswordHandler.context().hash(password)
 
     @staticmethod
     def verify(hashed_password: str, password: str) -> bool:
-        return PasswordHandler.pwd_context.verify(password, hashed_password)
+        return PasswordHandler.context().verify(password, hashed_password)
+
+    @staticmethod
+    def verify_and_update(
+        hashed_password: str, password: str
+    ) -> Tuple[bool, Optional[str]]:
+        """
+        Verifies the password and, when the stored hash was made with a different
+        cost factor, returns a replacement hash as well.
+        """
+        return PasswordHandler.context().verify_and_update(password, hashed_password)
+
+    @staticmethod
+    async def hash_async(password: str) -> str:
+        return await PasswordHandler._run(PasswordHandler.hash, password)
+
+    @staticmethod
+    async def verify_async(hashed_password: str, password: str) -> bool:
+        return await PasswordHandler._run(
+            PasswordHandler.verify, hashed_password, password
+        )
+
+    @staticmethod
+    async def verify_and_update_async(
+        hashed_password: str, password: str
+    ) -> Tuple[bool, Optional[str]]:
+        return await PasswordHandler._run(
+            PasswordHandler.verify_and_update, hashed_password, password
+        )
+
+    @staticmethod
+    def stats() -> Dict[str, int]:
+        return {
+            "workers": PasswordHandler.executor._max_workers,
+            "queued": PasswordHandler._queued,
+            "running": PasswordHandler._running,
+            "completed": PasswordHandler._completed,
+        }
+
+    @staticmethod
+    async def _run(function: Callable[..., Any], *args: Any) -> Any:
+        with PasswordHandler._lock:
+            PasswordHandler._queued += 1
+
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            PasswordHandler.executor, partial(PasswordHandler._track, function, *args)
+        )
+
+    @staticmethod
+    def _track(function: Callable[..., Any], *args: Any) -> Any:
+        with PasswordHandler._lock:
+            PasswordHandler._queued -= 1
+            PasswordHandler._running += 1
+        try:
+            return function(*args)
+        finally:
+            with PasswordHandler._lock:
+                PasswordHandler._running -= 1
+                PasswordHandler._completed += 1
@@ -0,0 +1,14 @@
+from .base import BaseRevocationStore
+from .bloom import BloomFilter
+from .memory_store import InMemoryRevocationStore
+from .redis_store import RedisRevocationStore
+from .revocation_manager import RevocationManager, Revocations
+
+__all__ = [
+    "BaseRevocationStore",
+    "BloomFilter",
+    "InMemoryRevocationStore",
+    "RedisRevocationStore",
+    "RevocationManager",
+    "Revocations",
+]
@@ -0,0 +1,27 @@
+from abc import ABC, abstractmethod
+from typing import List
+
+
+class BaseRevocationStore(ABC):
+    """Interface every revocation store has to implement."""
+
+    @abstractmethod
+    async def revoke(self, jti: str, expires_at: float) -> None:
+        """Records the token id as revoked until its ``exp`` (a unix timestamp)."""
+
+    @abstractmethod
+    async def claim(self, jti: str, expires_at: float) -> bool:
+        """
+        Revokes the token id unless it already is, atomically. Returns whether
+        this call revoked it, which makes a token usable exactly once.
+        """
+
+    @abstractmethod
+    async def is_revoked(self, jti: str) -> bool: ...
+
+    @abstractmethod
+    async def revoked(self) -> List[str]:
+        """Returns every token id revoked and not yet expired."""
+
+    @abstractmethod
+    async def close(self) -> None: ...
@@ -0,0 +1,50 @@
+import hashlib
+import math
+from typing import Iterable
+
+
+class BloomFilter:
+    """
+    Fixed-size Bloom filter over strings. ``in`` never gives a false negative,
+    and gives a false positive for roughly ``error_rate`` of the strings never
+    added while it holds at most ``capacity`` of them.
+    """
+
+    __slots__ = ("size", "hashes", "bits", "count")
+
+    def __init__(self, capacity: int, error_rate: float = 0.001) -> None:
+        capacity = max(capacity, 1)
+        bits = -capacity * math.log(error_rate) / math.log(2) ** 2
+        self.size = max(8, math.ceil(bits))
+        self.hashes = max(1, round(self.size / capacity * math.log(2)))
+        self.bits = bytearray((self.size + 7) // 8)
+        self.count = 0
+
+    @classmethod
+    def from_items(
+        cls, items: Iterable[str], capacity: int, error_rate: float = 0.001
+    ) -> "BloomFilter":
+        items = list(items)
+        bloom = cls(max(capacity, len(items) * 2), error_rate)
+        for item in items:
+            bloom.add(item)
+        return bloom
+
+    def _positions(self, item: str) -> Iterable[int]:
+        # Double hashing, two 64-bit halves of one digest give every position
+        digest = hashlib.blake2b(item.encode(), digest_size=16).digest()
+        first = int.from_bytes(digest[:8], "little")
+        second = int.from_bytes(digest[8:], "little") | 1
+        return ((first + index * second) % self.size for index in range(self.hashes))
+
+    def add(self, item: str) -> None:
+        for position in self._positions(item):
+            self.bits[position >> 3] |= 1 << (position & 7)
+        self.count += 1
+
+    def __contains__(self, item: str) -> bool:
+        bits = self.bits
+        return all(
+            bits[position >> 3] & (1 << (position & 7))
+            for position in self._positions(item)
+        )
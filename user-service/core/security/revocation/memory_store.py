@@ -0,0 +1,45 @@
+import time
+from typing import Dict, List
+
+from .base import BaseRevocationStore
+
+
+class InMemoryRevocationStore(BaseRevocationStore):
+    """
+    Process-local store. Used for tests and local development, revocations are
+    not shared between workers.
+    """
+
+    def __init__(self) -> None:
+        self._store: Dict[str, float] = {}
+
+    async def revoke(self, jti: str, expires_at: float) -> None:
+        self._store[jti] = expires_at
+
+    async def claim(self, jti: str, expires_at: float) -> bool:
+        # Nothing awaits between the check and the write
+        if await self.is_revoked(jti):
+            return False
+        self._store[jti] = expires_at
+        return True
+
+    async def is_revoked(self, jti: str) -> bool:
+        expires_at = self._store.get(jti)
+        if expires_at is None:
+            return False
+        if expires_at <= time.time():
+            self._store.pop(jti, None)
+            return False
+        return True
+
+    async def revoked(self) -> List[str]:
+        now = time.time()
+        self._store = {
+            jti: expires_at
+            for jti, expires_at in self._store.items()
+            if expires_at > now
+        }
+        return list(self._store)
+
+    async def close(self) -> None:
+        self._store.clear()
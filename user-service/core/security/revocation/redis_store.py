@@ -0,0 +1,62 @@
+import math
+import time
+from typing import TYPE_CHECKING, List, Optional
+
+from .base import BaseRevocationStore
+
+if TYPE_CHECKING:
+    from redis.asyncio import Redis
+
+
+class RedisRevocationStore(BaseRevocationStore):
+    """
+    Keeps each revoked token id twice: as ``<prefix>:revoked:<jti>``, expiring
+    with the token, for point lookups, and in the ``<prefix>:revoked`` sorted
+    set, scored by expiry, so workers can list everything still revoked.
+    """
+
+    def __init__(
+        self,
+        url: str,
+        prefix: str,
+        socket_timeout: Optional[float] = None,
+        socket_connect_timeout: Optional[float] = None,
+    ) -> None:
+        from redis.asyncio import Redis
+
+        self.redis: "Redis" = Redis.from_url(
+            url,
+            socket_timeout=socket_timeout,
+            socket_connect_timeout=socket_connect_timeout,
+        )
+        self.index = f"{prefix}:revoked"
+
+    def key(self, jti: str) -> str:
+        return f"{self.index}:{jti}"
+
+    async def revoke(self, jti: str, expires_at: float) -> None:
+        async with self.redis.pipeline(transaction=False) as pipeline:
+            pipeline.set(self.key(jti), 1, exat=math.ceil(expires_at))
+            pipeline.zadd(self.index, {jti: expires_at})
+            await pipeline.execute()
+
+    async def claim(self, jti: str, expires_at: float) -> bool:
+        claimed = await self.redis.set(
+            self.key(jti), 1, exat=math.ceil(expires_at), nx=True
+        )
+        if claimed:
+            await self.redis.zadd(self.index, {jti: expires_at})
+        return bool(claimed)
+
+    async def is_revoked(self, jti: str) -> bool:
+        return bool(await self.redis.exists(self.key(jti)))
+
+    async def revoked(self) -> List[str]:
+        async with self.redis.pipeline(transaction=False) as pipeline:
+            pipeline.zremrangebyscore(self.index, "-inf", time.time())
+            pipeline.zrange(self.index, 0, -1)
+            _, members = await pipeline.execute()
+        return [member.decode() for member in members]
+
+    async def close(self) -> None:
+        await self.redis.aclose()
@@ -0,0 +1,125 @@
+import asyncio
+import logging
+import time
+from typing import Any, Dict, List
+
+from .base import BaseRevocationStore
+from .bloom import BloomFilter
+from .memory_store import InMemoryRevocationStore
+
+logger = logging.getLogger(__name__)
+
+
+class RevocationManager:
+    """
+    Tracks revoked tokens by their ``jti``.
+
+    The store is the source of truth. Every worker keeps a Bloom filter of the
+    revoked ids, rebuilt from the store every ``refresh_interval`` seconds, so
+    the common case, a token that was never revoked, is answered locally. Only
+    filter hits go to the store. Ids revoked by this worker enter its filter at
+    once, other workers pick them up with their next refresh.
+    """
+
+    def __init__(self) -> None:
+        self.store: BaseRevocationStore = InMemoryRevocationStore()
+        self.capacity = 100_000
+        self.error_rate = 0.001
+        self.bloom = BloomFilter(self.capacity, self.error_rate)
+        self.refreshed_at = 0.0
+        # Ids revoked by this worker since the current refresh started
+        self.recent: List[str] = []
+        self.counters = {"local_negatives": 0, "store_lookups": 0, "revoked": 0}
+
+    def init(
+        self,
+        store: BaseRevocationStore,
+        capacity: int = 100_000,
+        error_rate: float = 0.001,
+    ) -> None:
+        self.store = store
+        self.capacity = capacity
+        self.error_rate = error_rate
+        self.bloom = BloomFilter(capacity, error_rate)
+
+    async def close(self) -> None:
+        await self.store.close()
+        self.store = InMemoryRevocationStore()
+
+    async def revoke(self, jti: str, expires_at: float) -> None:
+        if expires_at <= time.time():
+            return
+        await self.store.revoke(jti, expires_at)
+        self.bloom.add(jti)
+        self.recent.append(jti)
+
+    async def claim(self, jti: str, expires_at: float) -> bool:
+        """
+        Revokes a single-use token, returns False when it was already revoked,
+        by this worker or any other. Goes to the store, never to the filter.
+        """
+        if expires_at <= time.time():
+            return False
+        claimed = await self.store.claim(jti, expires_at)
+        self.bloom.add(jti)
+        self.recent.append(jti)
+        return claimed
+
+    def maybe_revoked(self, jti: str) -> bool:
+        """
+        Local check, ``False`` means the token is certainly not revoked.
+        """
+        if jti in self.bloom:
+            return True
+        self.counters["local_negatives"] += 1
+        return False
+
+    async def is_revoked(self, jti: str, use_filter: bool = True) -> bool:
+        """
+        With ``use_filter``, tokens the local filter clears are not looked up.
+        Without it the store is asked, so revocations by other workers count
+        before the next refresh.
+        """
+        if use_filter and not self.maybe_revoked(jti):
+            return False
+
+        self.counters["store_lookups"] += 1
+        try:
+            revoked = await self.store.is_revoked(jti)
+        except Exception as exception:
+            # Fail closed, only tokens that hit the filter get here
+            logger.warning("Revocation lookup failed for %s: %s", jti, exception)
+            return True
+
+        if revoked:
+            self.counters["revoked"] += 1
+        return revoked
+
+    async def refresh(self) -> None:
+        # Anything revoked before this point is already in the store, anything
+        # revoked while it is being read ends up in the fresh list
+        self.recent = []
+        revoked = await self.store.revoked()
+        self.bloom = BloomFilter.from_items(
+            [*revoked, *self.recent], self.capacity, self.error_rate
+        )
+        self.refreshed_at = time.time()
+
+    async def run_refresh(self, interval: float) -> None:
+        while True:
+            try:
+                await self.refresh()
+            except Exception as exception:
+                # Keep serving from the previous filter until the store is back
+                logger.warning("Revocation filter refresh failed: %s", exception)
+            await asyncio.sleep(interval)
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            **self.counters,
+            "filter_size": self.bloom.count,
+            "refreshed_at": self.refreshed_at,
+        }
+
+
+Revocations = RevocationManager()
@@ -1,3 +1,6 @@
+import asyncio
+import logging
+from contextlib import asynccontextmanager
 from typing import List
 
 from fastapi import FastAPI, Request
@@ -6,20 +9,21 @@ from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import JSONResponse
 
 from api import router
+from core.cache import Cache, InMemoryBackend, RedisBackend
+from core.config import config
+from core.database.pool import prewarm
+from core.database.session import engines, readers
 from core.exceptions import CustomException
-from core.fastapi.middlewares import (AuthBackend, AuthenticationMiddleware,
-                                      SQLAlchemyMiddleware)
-
-
-def on_auth_error(request: Request, exc: Exception):
-    status_code, error_code, message = 401, None, str(exc)
-    if isinstance(exc, CustomException):
-        status_code = int(exc.code)
-        error_code = exc.error_code
-        message = exc.message
-    return JSONResponse(
-        status_code=status_code, content={"error_code": error_code, "message": message}
-    )
+from core.fastapi.middlewares import (AuthBackend, MetricsMiddleware,
+                                     QueryStatsMiddleware,
+                                     RequestContextMiddleware)
+from core.metrics import Metrics
+from core.rate_limit import (InMemoryRateLimitBackend, RateLimiter,
+                             RedisRateLimitBackend)
+from core.security.revocation import (InMemoryRevocationStore,
+                                      RedisRevocationStore, Revocations)
+
+logger = logging.getLogger(__name__)
 
 
 def init_routers(app_: FastAPI) -> None:
@@ -32,7 +36,60 @@ def init_listeners(app_: FastAPI) -> None:
         return JSONResponse(
             status_code=exc.code,
             content={"error_code": exc.error_code, "message": exc.message},
+            headers=getattr(exc, "headers", None),
+        )
+
+
+def init_cache() -> None:
+    if config.CACHE_BACKEND == "redis":
+        backend = RedisBackend(
+            config.REDIS_URL,
+            socket_timeout=config.REDIS_SOCKET_TIMEOUT,
+            socket_connect_timeout=config.REDIS_CONNECT_TIMEOUT,
+        )
+    elif config.CACHE_BACKEND == "memory":
+        backend = InMemoryBackend()
+    else:
+        return
+    Cache.init(backend=backend, prefix=config.CACHE_PREFIX, ttl=config.CACHE_TTL)
+
+
+def init_revocations() -> None:
+    if config.REVOCATION_BACKEND == "redis":
+        store = RedisRevocationStore(
+            config.REDIS_URL,
+            prefix=config.CACHE_PREFIX,
+            socket_timeout=config.REDIS_SOCKET_TIMEOUT,
+            socket_connect_timeout=config.REDIS_CONNECT_TIMEOUT,
+        )
+    else:
+        logger.warning(
+            "Revoked tokens are kept per process, other workers and instances "
+            "accept them until they expire"
+        )
+        store = InMemoryRevocationStore()
+    Revocations.init(
+        store=store,
+        capacity=config.REVOCATION_FILTER_CAPACITY,
+        error_rate=config.REVOCATION_FILTER_ERROR_RATE,
+    )
+
+
+def init_rate_limiter() -> None:
+    if config.RATE_LIMIT_BACKEND == "redis":
+        backend = RedisRateLimitBackend(
+            config.REDIS_URL,
+            prefix=config.CACHE_PREFIX,
+            socket_timeout=config.REDIS_SOCKET_TIMEOUT,
+            socket_connect_timeout=config.REDIS_CONNECT_TIMEOUT,
+        )
+    else:
+        logger.warning(
+            "Login attempts are counted per process, each worker and instance "
+            "allows the full limit"
         )
+        backend = InMemoryRateLimitBackend(max_keys=config.RATE_LIMIT_MAX_KEYS)
+    RateLimiter.init(backend)
 
 
 def make_middleware() -> List[Middleware]:
@@ -44,22 +101,66 @@ def make_middleware() -> List[Middleware]:
             allow_methods=["*"],
             allow_headers=["*"],
         ),
+        Middleware(MetricsMiddleware),
         Middleware(
-            AuthenticationMiddleware,
+            QueryStatsMiddleware,
+            budget=config.DB_QUERY_BUDGET,
+            strict=config.DB_QUERY_BUDGET_STRICT,
+            server_timing=config.DB_SERVER_TIMING,
+        ),
+        Middleware(
+            RequestContextMiddleware,
             backend=AuthBackend(),
-            on_error=on_auth_error,
+            public_paths=config.PUBLIC_PATHS,
         ),
-        Middleware(SQLAlchemyMiddleware),
     ]
     return middleware
 
 
+@asynccontextmanager
+async def lifespan(app_: FastAPI):
+    init_cache()
+    init_revocations()
+    init_rate_limiter()
+
+    all_engines = [engines["writer"], *readers.engines]
+    await asyncio.gather(
+        *(prewarm(engine, config.POSTGRES_POOL_PREWARM) for engine in all_engines)
+    )
+
+    revocation_refresh = asyncio.create_task(
+        Revocations.run_refresh(config.REVOCATION_REFRESH_INTERVAL)
+    )
+    metrics_refresh = asyncio.create_task(
+        Metrics.run_refresh(config.METRICS_REFRESH_INTERVAL)
+    )
+
+    health_checks = None
+    if readers.engines:
+        health_checks = asyncio.create_task(
+            readers.run_health_checks(config.POSTGRES_READER_HEALTH_CHECK_INTERVAL)
+        )
+
+    yield
+
+    if health_checks is not None:
+        health_checks.cancel()
+    revocation_refresh.cancel()
+    metrics_refresh.cancel()
+    await Cache.close()
+    await Revocations.close()
+    await RateLimiter.close()
+    for engine in all_engines:
+        await engine.dispose()
+
+
 def create_app() -> FastAPI:
     app_ = FastAPI(
         title="E-Commerce User-Service",
         description="Backend for the user service i.e Login, Register etc",
         version="1.0.1",
         middleware=make_middleware(),
+        lifespan=lifespan,
     )
     init_routers(app_)
     init_listeners(app_)
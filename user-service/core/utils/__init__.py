@@ -0,0 +1,12 @@
+from .countries import (get_country_index, normalize_country,
+                        normalize_subdivision)
+from .ids import generate_uuid, set_uuid_generator, uuid7
+
+__all__ = [
+    "generate_uuid",
+    "get_country_index",
+    "normalize_country",
+    "normalize_subdivision",
+    "set_uuid_generator",
+    "uuid7",
+]
@@ -0,0 +1,204 @@
+import logging
+import os
+import pickle
+from importlib.util import find_spec
+from pathlib import Path
+from typing import Dict, Optional, Tuple
+
+from core.config import config
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_INDEX_PATH = (
+    Path(__file__).resolve().parent.parent.parent / ".cache" / "countries.pickle"
+)
+
+# Bump when build() changes, so pickles written by older code are rebuilt
+INDEX_VERSION = 2
+
+# Names people commonly use that ISO 3166 spells differently or not at all
+COUNTRY_ALIASES: Dict[str, str] = {
+    "america": "US",
+    "britain": "GB",
+    "burma": "MM",
+    "brunei": "BN",
+    "cape verde": "CV",
+    "congo-brazzaville": "CG",
+    "congo-kinshasa": "CD",
+    "cote d'ivoire": "CI",
+    "curacao": "CW",
+    "democratic republic of the congo": "CD",
+    "dr congo": "CD",
+    "drc": "CD",
+    "east timor": "TL",
+    "england": "GB",
+    "falklands": "FK",
+    "great britain": "GB",
+    "holland": "NL",
+    "ivory coast": "CI",
+    "macau": "MO",
+    "macedonia": "MK",
+    "micronesia": "FM",
+    "north korea": "KP",
+    "northern ireland": "GB",
+    "palestine": "PS",
+    "reunion": "RE",
+    "russia": "RU",
+    "scotland": "GB",
+    "south korea": "KR",
+    "swaziland": "SZ",
+    "taiwan": "TW",
+    "the bahamas": "BS",
+    "the gambia": "GM",
+    "the netherlands": "NL",
+    "turkey": "TR",
+    "u.k.": "GB",
+    "u.s.": "US",
+    "u.s.a.": "US",
+    "uae": "AE",
+    "uk": "GB",
+    "united states of america": "US",
+    "vatican": "VA",
+    "vatican city": "VA",
+    "vietnam": "VN",
+    "wales": "GB",
+}
+
+
+class CountryIndex:
+    """
+    Country and subdivision names keyed by their case-folded spellings.
+
+    Built once from pycountry and pickled, so workers load a few plain dicts
+    instead of importing pycountry and parsing its JSON databases.
+    """
+
+    __slots__ = ("source", "countries", "names", "subdivisions")
+
+    def __init__(
+        self,
+        source: Tuple[str, int, int],
+        countries: Dict[str, str],
+        names: Dict[str, str],
+        subdivisions: Dict[str, Dict[str, str]],
+    ) -> None:
+        # pycountry's database directory, its mtime and INDEX_VERSION, to spot
+        # upgrades
+        self.source = source
+        # any spelling -> alpha-2 code
+        self.countries = countries
+        # alpha-2 code -> canonical name
+        self.names = names
+        # alpha-2 code -> any spelling -> canonical subdivision name
+        self.subdivisions = subdivisions
+
+    @classmethod
+    def build(cls) -> "CountryIndex":
+        import pycountry
+
+        countries: Dict[str, str] = {}
+        names: Dict[str, str] = {}
+        for country in pycountry.countries:
+            names[country.alpha_2] = country.name
+            for spelling in (
+                country.alpha_2,
+                country.alpha_3,
+                country.name,
+                getattr(country, "official_name", None),
+                getattr(country, "common_name", None),
+            ):
+                if not spelling:
+                    continue
+                countries[spelling.casefold()] = country.alpha_2
+                # "Holy See (Vatican City State)" is also found as either part
+                if " (" in spelling:
+                    outer, inner = spelling.rstrip(")").split(" (", 1)
+                    countries.setdefault(outer.casefold(), country.alpha_2)
+                    countries.setdefault(inner.casefold(), country.alpha_2)
+
+        for alias, code in COUNTRY_ALIASES.items():
+            if code in names:
+                countries.setdefault(alias, code)
+
+        subdivisions: Dict[str, Dict[str, str]] = {}
+        for subdivision in pycountry.subdivisions:
+            spellings = subdivisions.setdefault(subdivision.country_code, {})
+            suffix = subdivision.code.split("-", 1)[-1]
+            for spelling in (subdivision.code, suffix, subdivision.name):
+                spellings[spelling.casefold()] = subdivision.name
+
+        return cls(_source(), countries, names, subdivisions)
+
+    def country(self, value: str) -> Optional[str]:
+        """Returns the canonical name of the country, or None."""
+        code = self.countries.get(value.strip().casefold())
+        return self.names[code] if code else None
+
+    def subdivision(self, country: str, value: str) -> Optional[str]:
+        """
+        Returns the canonical name of the country's subdivision, or None. For a
+        country without known subdivisions the value is kept as given.
+        """
+        code = self.countries.get(country.strip().casefold())
+        spellings = self.subdivisions.get(code)
+        if not spellings:
+            return value.strip()
+        return spellings.get(value.strip().casefold())
+
+
+def _source() -> Tuple[str, int, int]:
+    # find_spec locates pycountry without importing it
+    spec = find_spec("pycountry")
+    databases = Path(spec.origin).parent / "databases"
+    return str(databases), databases.stat().st_mtime_ns, INDEX_VERSION
+
+
+def load_country_index(path: Optional[Path] = None) -> CountryIndex:
+    """
+    Loads the pickled index, rebuilding it when it is missing or pycountry or
+    the index format has changed since it was written.
+    """
+    path = Path(path or config.COUNTRY_INDEX_PATH or DEFAULT_INDEX_PATH)
+    try:
+        with path.open("rb") as file:
+            index = pickle.load(file)
+        if isinstance(index, CountryIndex) and index.source == _source():
+            return index
+    except (OSError, pickle.UnpicklingError, EOFError, AttributeError):
+        pass
+
+    index = CountryIndex.build()
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        # Workers may build at the same time, each replaces the file atomically
+        temporary = path.with_suffix(f".{os.getpid()}.tmp")
+        with temporary.open("wb") as file:
+            pickle.dump(index, file, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(temporary, path)
+    except OSError as exception:
+        logger.warning("Could not write the country index to %s: %s", path, exception)
+    return index
+
+
+_index: Optional[CountryIndex] = None
+
+
+def get_country_index() -> CountryIndex:
+    global _index
+    if _index is None:
+        _index = load_country_index()
+    return _index
+
+
+def normalize_country(value: str) -> str:
+    name = get_country_index().country(value)
+    if name is None:
+        raise ValueError(f"Unknown country: {value}")
+    return name
+
+
+def normalize_subdivision(country: str, value: str) -> str:
+    name = get_country_index().subdivision(country, value)
+    if name is None:
+        raise ValueError(f"Unknown state or province for {country}: {value}")
+    return name
@@ -0,0 +1,44 @@
+import os
+import time
+from typing import Callable, Dict
+from uuid import UUID, uuid4
+
+from core.config import config
+
+
+def uuid7() -> UUID:
+    """
+    Time-ordered UUID (RFC 9562, version 7): a 48-bit Unix timestamp in
+    milliseconds followed by 74 random bits. Consecutive inserts land next to
+    each other in a B-tree index instead of on a random leaf page.
+    """
+    timestamp_ms = time.time_ns() // 1_000_000
+    random_bits = int.from_bytes(os.urandom(10), "big")
+
+    value = (timestamp_ms & 0xFFFF_FFFF_FFFF) << 80
+    value |= 0x7 << 76  # version
+    value |= ((random_bits >> 62) & 0xFFF) << 64  # rand_a
+    value |= 0b10 << 62  # variant
+    value |= random_bits & 0x3FFF_FFFF_FFFF_FFFF  # rand_b
+    return UUID(int=value)
+
+
+UUID_GENERATORS: Dict[str, Callable[[], UUID]] = {
+    "uuid4": uuid4,
+    "uuid7": uuid7,
+}
+
+_generator: Callable[[], UUID] = UUID_GENERATORS[config.UUID_GENERATOR]
+
+
+def set_uuid_generator(generator: Callable[[], UUID]) -> None:
+    global _generator
+    _generator = generator
+
+
+def generate_uuid() -> UUID:
+    """
+    Column default for public ``uuid`` keys. Both versions share the same
+    column type, so rows created before a switch keep their values.
+    """
+    return _generator()
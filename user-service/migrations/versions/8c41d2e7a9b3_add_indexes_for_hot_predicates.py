@@ -0,0 +1,60 @@
+"""Add indexes for hot predicates
+
+Revision ID: 8c41d2e7a9b3
+Revises: 2f879f119575
+Create Date: 2026-10-18 10:12:36.118042
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '8c41d2e7a9b3'
+down_revision: Union[str, None] = '2f879f119575'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+AUDIT_COLUMNS = ("created_by", "updated_by", "deleted_by")
+
+
+def upgrade() -> None:
+    # CREATE INDEX CONCURRENTLY cannot run inside a transaction block
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_address_user_id_id",
+            "address",
+            ["user_id", "id"],
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        for table in ("users", "address"):
+            for column in AUDIT_COLUMNS:
+                op.create_index(
+                    f"ix_{table}_{column}",
+                    table,
+                    [column],
+                    postgresql_where=sa.text(f"{column} IS NOT NULL"),
+                    postgresql_concurrently=True,
+                    if_not_exists=True,
+                )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        for table in ("address", "users"):
+            for column in reversed(AUDIT_COLUMNS):
+                op.drop_index(
+                    f"ix_{table}_{column}",
+                    table_name=table,
+                    postgresql_concurrently=True,
+                    if_exists=True,
+                )
+        op.drop_index(
+            "ix_address_user_id_id",
+            table_name="address",
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
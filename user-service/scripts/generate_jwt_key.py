@@ -0,0 +1,45 @@
+"""
+Generates a new ES256 signing key for JWT_KEYS_DIR.
+
+The key id defaults to the current UTC timestamp, so with JWT_ACTIVE_KID unset
+the newest key signs as soon as the workers reload their keys. Keep the old
+key file until every token it signed has expired, then delete it.
+
+    python -m scripts.generate_jwt_key --dir keys
+"""
+
+import argparse
+import sys
+from datetime import datetime, timezone
+from pathlib import Path
+
+from cryptography.hazmat.primitives import serialization
+from cryptography.hazmat.primitives.asymmetric import ec
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--dir", default="keys")
+    parser.add_argument(
+        "--kid", default=datetime.now(timezone.utc).strftime("%Y%m%dT%H%M%SZ")
+    )
+    args = parser.parse_args()
+
+    path = Path(args.dir) / f"{args.kid}.pem"
+    if path.exists():
+        sys.exit(f"{path} already exists")
+
+    key = ec.generate_private_key(ec.SECP256R1())
+    pem = key.private_bytes(
+        serialization.Encoding.PEM,
+        serialization.PrivateFormat.PKCS8,
+        serialization.NoEncryption(),
+    )
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_bytes(pem)
+    path.chmod(0o600)
+    print(path)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,117 @@
+"""
+Import-time profile and cold start budget for the service.
+
+Imports the module in a fresh interpreter under ``-X importtime`` and reports
+the total along with the slowest modules, by cumulative and by self time, and
+the time spent per top-level package. With a budget, the script exits non-zero
+when the fastest of the runs is over it, so CI fails on a cold start regression.
+
+    python -m scripts.import_time --budget-ms 1500
+
+``tests/core/test_import_time.py`` runs the same check under pytest, against
+``IMPORT_TIME_BUDGET_MS``.
+"""
+
+import argparse
+import re
+import subprocess
+import sys
+from collections import defaultdict
+from typing import Dict, List, NamedTuple
+
+LINE = re.compile(r"^import time:\s+(\d+) \|\s+(\d+) \|( *)(\S+)$")
+
+
+class ImportRecord(NamedTuple):
+    module: str
+    self_us: int
+    cumulative_us: int
+    depth: int
+
+
+def profile(module: str) -> List[ImportRecord]:
+    """
+    Imports the module in a new interpreter, so nothing is cached in
+    ``sys.modules``, and parses the ``-X importtime`` report from its stderr.
+    """
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        text=True,
+    )
+    if result.returncode != 0:
+        sys.stderr.write(result.stderr)
+        raise SystemExit(f"Importing {module} failed")
+
+    records = []
+    for line in result.stderr.splitlines():
+        match = LINE.match(line)
+        if match:
+            self_us, cumulative_us, indent, name = match.groups()
+            records.append(
+                ImportRecord(name, int(self_us), int(cumulative_us), len(indent) // 2)
+            )
+    return records
+
+
+def total_us(records: List[ImportRecord]) -> int:
+    # Top-level imports are the ones at depth 0, their cumulative times add up
+    # to the whole import
+    return sum(record.cumulative_us for record in records if record.depth == 0)
+
+
+def by_package(records: List[ImportRecord]) -> Dict[str, int]:
+    packages: Dict[str, int] = defaultdict(int)
+    for record in records:
+        packages[record.module.split(".")[0]] += record.self_us
+    return packages
+
+
+def report(records: List[ImportRecord], top: int) -> None:
+    print(f"{'cumulative':>12} {'self':>10}  module")
+    slowest = sorted(records, key=lambda record: record.cumulative_us, reverse=True)
+    for record in slowest[:top]:
+        print(
+            f"{record.cumulative_us / 1000:>10.1f}ms "
+            f"{record.self_us / 1000:>8.1f}ms  {record.module}"
+        )
+
+    print(f"\n{'self':>12}  module")
+    slowest = sorted(records, key=lambda record: record.self_us, reverse=True)
+    for record in slowest[:top]:
+        print(f"{record.self_us / 1000:>10.1f}ms  {record.module}")
+
+    print(f"\n{'self':>12}  package")
+    packages = sorted(by_package(records).items(), key=lambda item: -item[1])
+    for package, self_us in packages[:top]:
+        print(f"{self_us / 1000:>10.1f}ms  {package}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--module", default="core.server")
+    parser.add_argument("--runs", type=int, default=3)
+    parser.add_argument("--top", type=int, default=20)
+    parser.add_argument(
+        "--budget-ms", type=float, help="Exit non-zero above this total import time"
+    )
+    args = parser.parse_args()
+
+    # The fastest run is the least disturbed by the rest of the machine
+    runs = [profile(args.module) for _ in range(max(args.runs, 1))]
+    records = min(runs, key=total_us)
+    total_ms = total_us(records) / 1000
+
+    report(records, args.top)
+    print(f"\nimport {args.module}: {total_ms:.1f}ms (best of {len(runs)})")
+
+    if args.budget_ms is not None and total_ms > args.budget_ms:
+        print(
+            f"Import time {total_ms:.1f}ms is over the {args.budget_ms:.0f}ms budget",
+            file=sys.stderr,
+        )
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,4 @@
+from core.launcher import main
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,39 @@
+import pytest
+from pydantic import ValidationError
+
+from app.schemas.requests.address import (AddressPartialUpdateRequest,
+                                          AddressRequest)
+
+
+def make_request(**fields):
+    return AddressRequest(street_address="1 Main Street", city="City", **fields)
+
+
+@pytest.mark.parametrize(
+    "country, state",
+    [
+        ("Germany", "Bavaria"),
+        ("UK", "Greater London"),
+        ("United Kingdom", "London"),
+        ("Pakistan", "Sindh"),
+        ("South Korea", None),
+        ("Ivory Coast", "Abidjan"),
+    ],
+)
+def test_location_is_stored_as_sent(country, state):
+    request = make_request(country=country, state=state)
+
+    assert request.country == country
+    assert request.state == state
+
+
+@pytest.mark.parametrize("country", ["Narnia", "", "XX"])
+def test_unknown_country_is_rejected(country):
+    with pytest.raises(ValidationError, match="Unknown country"):
+        make_request(country=country)
+
+
+def test_partial_update_checks_only_the_fields_sent():
+    assert AddressPartialUpdateRequest(state="Bavaria").state == "Bavaria"
+    with pytest.raises(ValidationError):
+        AddressPartialUpdateRequest(country="Narnia")
@@ -0,0 +1,161 @@
+import pytest
+from sqlalchemy.exc import IntegrityError
+
+from app.controllers import AuthController
+from core.exceptions import BadRequestException, UnauthorizedException
+from core.fastapi.middlewares import AuthBackend
+from core.security import JWTHandler, PasswordHandler, Revocations
+from core.security.revocation import InMemoryRevocationStore
+
+
+class UniqueViolationError(Exception):
+    """Stands in for asyncpg's error, which names the violated constraint."""
+
+    def __init__(self, constraint_name):
+        super().__init__("duplicate key value violates unique constraint")
+        self.constraint_name = constraint_name
+
+
+def driver_error(constraint_name):
+    # SQLAlchemy's asyncpg adapter raises its own DBAPI error from asyncpg's
+    error = Exception("duplicate key")
+    error.__cause__ = UniqueViolationError(constraint_name)
+    return IntegrityError("INSERT INTO users ...", {}, error)
+
+
+class StubUserRepository:
+    def __init__(self, error=None):
+        self.error = error
+        self.created = []
+
+    async def create(self, attributes, flush=False):
+        if self.error is not None:
+            raise self.error
+        self.created.append(attributes)
+        return attributes
+
+
+@pytest.fixture
+def fast_hashing(monkeypatch):
+    async def hash_async(password):
+        return f"hashed:{password}"
+
+    monkeypatch.setattr(PasswordHandler, "hash_async", staticmethod(hash_async))
+
+
+@pytest.fixture
+async def revocations():
+    Revocations.init(InMemoryRevocationStore(), capacity=1000)
+    yield Revocations
+    await Revocations.close()
+
+
+def controller():
+    return AuthController(StubUserRepository())
+
+
+async def authenticates(access_token):
+    authenticated, _ = await AuthBackend().authenticate_header_async(
+        f"Bearer {access_token}"
+    )
+    return authenticated
+
+
+@pytest.mark.parametrize(
+    "error, message",
+    [
+        (driver_error("users_email_key"), "User already exists with this email"),
+        (driver_error("users_username_key"), "User already exists with this username"),
+        (driver_error(None), "User already exists"),
+        (
+            IntegrityError("", {}, Exception("UNIQUE constraint failed: users.email")),
+            "User already exists with this email",
+        ),
+        (IntegrityError("", {}, Exception("NOT NULL")), "User already exists"),
+    ],
+    ids=["email", "username", "unnamed", "message only", "unrelated"],
+)
+def test_unique_violations_name_the_taken_field(error, message):
+    assert AuthController._unique_violation_message(error) == message
+
+
+async def test_register_hashes_and_inserts_once(writer, fast_hashing):
+    repository = StubUserRepository()
+
+    await AuthController(repository).register("john@example.com", "secret", "john")
+
+    assert repository.created == [
+        {"email": "john@example.com", "password": "hashed:secret", "username": "john"}
+    ]
+
+
+async def test_register_turns_a_violation_into_a_bad_request(writer, fast_hashing):
+    repository = StubUserRepository(driver_error("users_username_key"))
+
+    with pytest.raises(BadRequestException, match="with this username"):
+        await AuthController(repository).register("john@example.com", "secret", "john")
+
+
+async def test_refresh_replaces_the_token_pair(revocations):
+    tokens = AuthController._issue_tokens(1)
+
+    refreshed = await controller().refresh_token(
+        tokens.access_token, tokens.refresh_token
+    )
+
+    assert JWTHandler.decode(refreshed.access_token)["user_id"] == 1
+    assert await authenticates(refreshed.access_token)
+    assert not await authenticates(tokens.access_token)
+
+
+async def test_a_refresh_token_is_single_use(revocations):
+    tokens = AuthController._issue_tokens(1)
+    refreshed = await controller().refresh_token(
+        tokens.access_token, tokens.refresh_token
+    )
+
+    with pytest.raises(UnauthorizedException, match="Refresh token revoked"):
+        await controller().refresh_token(
+            refreshed.access_token, tokens.refresh_token
+        )
+
+
+@pytest.mark.parametrize(
+    "swap, message",
+    [
+        (lambda access, refresh, other: (refresh, refresh), "Invalid access token"),
+        (lambda access, refresh, other: (access, access), "Invalid refresh token"),
+        (lambda access, refresh, other: (access, other), "Invalid refresh token"),
+    ],
+    ids=["refresh as access", "access as refresh", "another user's"],
+)
+async def test_refresh_rejects_mismatched_tokens(revocations, swap, message):
+    tokens = AuthController._issue_tokens(1)
+    other = AuthController._issue_tokens(2).refresh_token
+    access_token, refresh_token = swap(
+        tokens.access_token, tokens.refresh_token, other
+    )
+
+    with pytest.raises(UnauthorizedException, match=message):
+        await controller().refresh_token(access_token, refresh_token)
+
+
+async def test_logout_revokes_both_tokens(revocations):
+    tokens = AuthController._issue_tokens(1)
+
+    await controller().logout(tokens.access_token, tokens.refresh_token)
+
+    assert not await authenticates(tokens.access_token)
+    assert await revocations.is_revoked(JWTHandler.decode(tokens.refresh_token)["jti"])
+    with pytest.raises(UnauthorizedException, match="Access token revoked"):
+        await controller().refresh_token(tokens.access_token, tokens.refresh_token)
+
+
+async def test_refresh_sees_a_logout_handled_by_another_worker(revocations):
+    tokens = AuthController._issue_tokens(1)
+    claims = JWTHandler.decode(tokens.access_token)
+    # Recorded in the shared store, this worker's filter has not caught up
+    await revocations.store.revoke(claims["jti"], claims["exp"])
+
+    with pytest.raises(UnauthorizedException, match="Access token revoked"):
+        await controller().refresh_token(tokens.access_token, tokens.refresh_token)
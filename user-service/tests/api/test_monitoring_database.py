@@ -0,0 +1,16 @@
+from api.v1.monitoring.database import database
+from core.config import config
+from core.database.session import engines
+
+
+async def test_pools_are_labelled_without_connection_details():
+    status = await database()
+    body = status.model_dump_json()
+
+    assert status.writer.name == "writer"
+    assert [reader.name for reader in status.readers] == [
+        f"reader-{index}" for index in range(len(config.POSTGRES_READER_URLS))
+    ]
+    assert "url" not in status.model_dump()["writer"]
+    assert engines["writer"].url.host not in body
+    assert engines["writer"].url.database not in body
@@ -0,0 +1,18 @@
+import pytest
+
+from core.database import reset_session_context, session, set_session_context
+from core.database.session import engines, readers
+from tests.utils.database import sqlite_engine
+
+
+@pytest.fixture
+async def writer(tmp_path, monkeypatch):
+    """An SQLite database standing in for the writer, with no replicas."""
+    engine = await sqlite_engine(tmp_path / "writer.db")
+    monkeypatch.setitem(engines, "writer", engine)
+    monkeypatch.setattr(readers, "healthy", [])
+    context = set_session_context()
+    yield engine
+    await session.remove()
+    reset_session_context(context)
+    await engine.dispose()
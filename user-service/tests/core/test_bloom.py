@@ -0,0 +1,33 @@
+from core.security.revocation import BloomFilter
+
+
+def test_added_items_are_always_found():
+    bloom = BloomFilter(1000)
+    items = [f"jti-{index}" for index in range(1000)]
+    for item in items:
+        bloom.add(item)
+
+    assert all(item in bloom for item in items)
+    assert bloom.count == 1000
+
+
+def test_false_positive_rate_stays_near_the_error_rate():
+    bloom = BloomFilter(10_000, error_rate=0.01)
+    for index in range(10_000):
+        bloom.add(f"added-{index}")
+
+    false_positives = sum(f"absent-{index}" in bloom for index in range(10_000))
+    assert false_positives / 10_000 < 0.02
+
+
+def test_empty_filter_contains_nothing():
+    bloom = BloomFilter(100)
+    assert "anything" not in bloom
+
+
+def test_from_items_leaves_room_to_grow():
+    items = [f"jti-{index}" for index in range(100)]
+    bloom = BloomFilter.from_items(items, capacity=10)
+
+    assert all(item in bloom for item in items)
+    assert bloom.size >= BloomFilter(200).size
@@ -0,0 +1,100 @@
+import pytest
+from sqlalchemy import event, select
+
+from core.cache import Cache, InMemoryBackend
+from core.cache.cache_manager import PENDING_INVALIDATIONS
+from core.database import session
+from core.repository import BaseRepository
+from tests.utils.database import Item
+
+
+class ItemRepository(BaseRepository[Item]):
+    cache_fields = ("id", "name")
+
+
+@pytest.fixture
+async def repository(writer, monkeypatch):
+    monkeypatch.setattr(Cache, "listeners", [])
+    Cache.init(InMemoryBackend(), prefix="test")
+    repository = ItemRepository(Item, session)
+    await repository.create_many(
+        [{"id": index, "name": f"item-{index}"} for index in range(1, 6)]
+    )
+    yield repository
+    await session.rollback()
+    await Cache.close()
+
+
+def pending():
+    return session.info.get(PENDING_INVALIDATIONS, set())
+
+
+async def names():
+    result = await session.execute(select(Item.name).order_by(Item.id))
+    return list(result.scalars())
+
+
+async def test_create_many_returns_instances_in_chunks(repository):
+    created = await repository.create_many(
+        [{"id": index, "name": f"new-{index}"} for index in range(6, 11)],
+        chunk_size=2,
+    )
+
+    assert [item.id for item in created] == [6, 7, 8, 9, 10]
+    assert len(await names()) == 10
+
+
+async def test_update_where_marks_the_old_and_new_keys_stale(repository):
+    updated = await repository.update_where({"id": [1, 2, 3]}, {"name": "x"}, 2)
+
+    assert updated == 3
+    assert await names() == ["x", "x", "x", "item-4", "item-5"]
+    assert pending() == {
+        *(f"test:items:id:{index}" for index in (1, 2, 3)),
+        *(f"test:items:name:item-{index}" for index in (1, 2, 3)),
+        "test:items:name:x",
+    }
+
+
+async def test_update_where_on_other_columns_skips_the_lookup(
+    repository, writer, monkeypatch
+):
+    monkeypatch.setattr(ItemRepository, "cache_fields", ("id",))
+    statements = []
+    event.listen(
+        writer.sync_engine,
+        "before_cursor_execute",
+        lambda *args: statements.append(args[2]),
+    )
+
+    assert await repository.update_where({"name": "item-1"}, {"name": "x"}) == 1
+    assert len(statements) == 1
+    assert pending() == {"test:items:id:1"}
+
+
+async def test_delete_where_marks_the_deleted_keys_stale(repository):
+    deleted = await repository.delete_where({"name": ["item-4", "item-5", "none"]})
+
+    assert deleted == 2
+    assert await names() == ["item-1", "item-2", "item-3"]
+    assert pending() == {
+        "test:items:id:4",
+        "test:items:id:5",
+        "test:items:name:item-4",
+        "test:items:name:item-5",
+    }
+
+
+async def test_matching_nothing_marks_nothing(repository):
+    assert await repository.delete_where({"id": 42}) == 0
+    assert pending() == set()
+
+
+@pytest.mark.parametrize(
+    "filters", [{}, {"id": [1], "name": ["item-1"]}], ids=["empty", "two lists"]
+)
+async def test_unsafe_filters_are_rejected(repository, filters):
+    with pytest.raises(ValueError):
+        await repository.update_where(filters, {"name": "x"})
+    with pytest.raises(ValueError):
+        await repository.delete_where(filters)
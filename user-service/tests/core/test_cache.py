@@ -0,0 +1,119 @@
+from datetime import datetime, timezone
+from uuid import uuid4
+
+import pytest
+
+from app.models import User
+from core.cache import Cache, CacheManager, InMemoryBackend
+from core.cache.cache_manager import PENDING_INVALIDATIONS
+from core.database import Transactional, session
+from core.repository import BaseRepository
+from tests.utils.database import Item
+
+
+class ItemRepository(BaseRepository[Item]):
+    cache_fields = ("id", "name")
+
+
+@pytest.fixture
+async def cache(monkeypatch):
+    monkeypatch.setattr(Cache, "listeners", [])
+    Cache.init(InMemoryBackend(), prefix="test")
+    yield Cache
+    await Cache.close()
+
+
+@pytest.fixture
+async def item(writer):
+    async with writer.begin() as connection:
+        await connection.execute(Item.__table__.insert().values(id=1, name="a"))
+
+
+def repository():
+    return ItemRepository(Item, session)
+
+
+async def test_lookups_are_served_from_the_cache(cache, item, writer):
+    assert (await repository().get_by("id", 1)).name == "a"
+    await session.remove()
+    async with writer.begin() as connection:
+        await connection.execute(Item.__table__.update().values(name="b"))
+
+    assert (await repository().get_by("id", 1)).name == "a"
+    await session.remove()
+    assert (await repository().get_by("id", 1, cached=False)).name == "b"
+
+
+async def test_update_invalidates_old_and_new_keys_after_commit(cache, item):
+    invalidated = []
+    cache.subscribe(invalidated.append)
+    await repository().get_by("id", 1)
+    await repository().get_by("name", "a")
+    await cache.set("test:items:name:b", {"id": 2, "name": "b"})
+
+    @Transactional()
+    async def update():
+        item = await repository().get_by("id", 1)
+        await repository().update(item, {"name": "b"})
+        # A concurrent reader could re-populate the key before the commit
+        assert await cache.get("test:items:id:1") is not None
+
+    await update()
+
+    keys = {"test:items:id:1", "test:items:name:a", "test:items:name:b"}
+    assert invalidated == [keys]
+    for key in keys:
+        assert await cache.get(key) is None
+    assert PENDING_INVALIDATIONS not in session.info
+
+
+async def test_delete_invalidates_after_commit(cache, item):
+    await repository().get_by("id", 1)
+
+    @Transactional()
+    async def delete():
+        await repository().delete(await repository().get_by("id", 1))
+
+    await delete()
+
+    assert await cache.get("test:items:id:1") is None
+    assert await repository().get_by("id", 1) is None
+
+
+async def test_rollback_keeps_entries_and_drops_pending_keys(cache, item):
+    invalidated = []
+    cache.subscribe(invalidated.append)
+    await repository().get_by("id", 1)
+
+    @Transactional()
+    async def update():
+        item = await repository().get_by("id", 1)
+        await repository().update(item, {"name": "b"})
+        raise RuntimeError("fail")
+
+    with pytest.raises(RuntimeError):
+        await update()
+
+    assert await cache.get("test:items:id:1") == {"id": 1, "name": "a"}
+    assert PENDING_INVALIDATIONS not in session.info
+    assert invalidated == []
+
+
+async def test_excluded_columns_are_never_cached(cache, item, monkeypatch):
+    monkeypatch.setattr(ItemRepository, "cache_exclude", ("name",))
+
+    await repository().get_by("id", 1)
+
+    assert await cache.get("test:items:id:1") == {"id": 1}
+
+
+def test_loaded_instances_get_their_column_types_back():
+    created_at = datetime(2024, 11, 20, 8, 30, tzinfo=timezone.utc)
+    uuid = uuid4()
+
+    user = CacheManager.load_instance(
+        User, {"id": 1, "uuid": str(uuid), "created_at": created_at.isoformat()}
+    )
+
+    assert user.uuid == uuid
+    assert user.created_at == created_at
@@ -0,0 +1,100 @@
+import pickle
+
+import pytest
+
+from core.utils import countries
+from core.utils.countries import (COUNTRY_ALIASES, CountryIndex,
+                                  load_country_index)
+
+
+@pytest.fixture(scope="module")
+def index():
+    return CountryIndex.build()
+
+
+@pytest.mark.parametrize(
+    "value", ["PK", "pak", "Pakistan", "Islamic Republic of Pakistan", " pakistan "]
+)
+def test_country_by_code_name_or_official_name(index, value):
+    assert index.country(value) == "Pakistan"
+
+
+@pytest.mark.parametrize("value", ["Holy See", "Vatican City State", "vatican"])
+def test_country_by_either_part_of_a_parenthesized_name(index, value):
+    assert index.country(value) == "Holy See (Vatican City State)"
+
+
+@pytest.mark.parametrize(
+    "value, code",
+    [
+        ("UK", "GB"),
+        ("Great Britain", "GB"),
+        ("Russia", "RU"),
+        ("Turkey", "TR"),
+        ("Ivory Coast", "CI"),
+        ("South Korea", "KR"),
+        ("Taiwan", "TW"),
+        ("USA", "US"),
+    ],
+)
+def test_country_by_common_name(index, value, code):
+    assert index.country(value) == index.names[code]
+
+
+def test_every_alias_names_a_known_country(index):
+    assert set(COUNTRY_ALIASES.values()) <= set(index.names)
+
+
+def test_unknown_country(index):
+    assert index.country("Narnia") is None
+
+
+@pytest.mark.parametrize("value", ["PK-SD", "SD", "sindh"])
+def test_subdivision_by_code_suffix_or_name(index, value):
+    assert index.subdivision("Pakistan", value) == "Sindh"
+
+
+def test_subdivision_of_another_country_is_unknown(index):
+    assert index.subdivision("UK", "Sindh") is None
+
+
+def test_subdivision_of_a_country_without_any_is_kept(index):
+    assert index.subdivision("Aruba", " Oranjestad ") == "Oranjestad"
+
+
+def test_normalize_rejects_unknown_values(monkeypatch, index):
+    monkeypatch.setattr(countries, "_index", index)
+
+    assert countries.normalize_country("UK") == "United Kingdom"
+    assert countries.normalize_subdivision("UK", "ENG") == "England"
+    with pytest.raises(ValueError, match="Unknown country"):
+        countries.normalize_country("Narnia")
+    with pytest.raises(ValueError, match="Unknown state"):
+        countries.normalize_subdivision("Pakistan", "California")
+
+
+def test_load_writes_the_index_and_reads_it_back(tmp_path):
+    path = tmp_path / "countries.pickle"
+    built = load_country_index(path)
+    loaded = load_country_index(path)
+
+    assert path.exists()
+    assert loaded.source == built.source
+    assert loaded.countries == built.countries
+
+
+def test_load_rebuilds_a_stale_index(tmp_path, index):
+    path = tmp_path / "countries.pickle"
+    stale = CountryIndex(("elsewhere", 0, 0), {}, {}, {})
+    path.write_bytes(pickle.dumps(stale))
+
+    loaded = load_country_index(path)
+    assert loaded.source == index.source
+    assert loaded.country("pk") == "Pakistan"
+
+
+def test_load_rebuilds_a_corrupt_index(tmp_path):
+    path = tmp_path / "countries.pickle"
+    path.write_bytes(b"not a pickle")
+
+    assert load_country_index(path).country("pk") == "Pakistan"
@@ -0,0 +1,61 @@
+from types import SimpleNamespace
+from uuid import uuid4
+
+import pytest
+
+from app.schemas.extras.current_user import UserSnapshot
+from core.exceptions import UnauthorizedException
+from core.fastapi.dependencies.current_user import (current_user_cache,
+                                                    get_current_user)
+
+
+class StubUserController:
+    def __init__(self, user=None):
+        self.user = user
+        self.calls = 0
+
+    async def get_by_id(self, user_id, projection=None):
+        self.calls += 1
+        return self.user
+
+
+def make_request(user_id):
+    return SimpleNamespace(scope={}, user=SimpleNamespace(id=user_id))
+
+
+@pytest.fixture(autouse=True)
+def empty_cache():
+    current_user_cache.clear()
+    yield
+    current_user_cache.clear()
+
+
+async def test_unauthenticated_request_is_rejected():
+    with pytest.raises(UnauthorizedException):
+        await get_current_user(make_request(None), StubUserController())
+
+
+async def test_missing_user_is_rejected():
+    with pytest.raises(UnauthorizedException):
+        await get_current_user(make_request(1), StubUserController(user=None))
+
+
+async def test_snapshot_is_loaded_once_then_cached():
+    user = SimpleNamespace(
+        id=1,
+        uuid=uuid4(),
+        email="john@example.com",
+        username="john",
+        is_admin=False,
+        is_active=True,
+        email_verified=False,
+        profile_image_url=None,
+        phone_number=None,
+    )
+    controller = StubUserController(user)
+
+    first = await get_current_user(make_request(1), controller)
+    second = await get_current_user(make_request(1), controller)
+
+    assert first == second == UserSnapshot.from_model(user)
+    assert controller.calls == 1
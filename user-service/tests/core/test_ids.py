@@ -0,0 +1,41 @@
+from uuid import RFC_4122
+
+import pytest
+
+from core.utils import ids
+from core.utils.ids import uuid7
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    now = [1_700_000_000_123_456_789]
+    monkeypatch.setattr(ids.time, "time_ns", lambda: now[0])
+    return now
+
+
+def test_version_and_variant_bits():
+    value = uuid7()
+
+    assert value.version == 7
+    assert value.variant == RFC_4122
+    assert (value.int >> 76) & 0xF == 0x7
+    assert (value.int >> 62) & 0b11 == 0b10
+
+
+def test_leading_48_bits_are_the_unix_time_in_milliseconds(clock):
+    value = uuid7()
+    assert value.int >> 80 == 1_700_000_000_123
+
+
+def test_later_milliseconds_sort_after_earlier_ones(clock):
+    values = []
+    for _ in range(100):
+        values.append(uuid7())
+        clock[0] += 1_000_000
+
+    assert values == sorted(values)
+    assert [value.int for value in values] == sorted(value.int for value in values)
+
+
+def test_values_in_the_same_millisecond_are_unique(clock):
+    assert len({uuid7() for _ in range(1000)}) == 1000
@@ -0,0 +1,22 @@
+import os
+
+from scripts.import_time import profile, total_us
+
+# Cold start budget for importing the app, in milliseconds. -X importtime adds
+# its own overhead, so this is above the plain import time; tighten it on
+# machines with steadier timings
+BUDGET_MS = float(os.environ.get("IMPORT_TIME_BUDGET_MS", 2500))
+RUNS = 3
+
+
+def test_app_import_is_within_budget():
+    # The fastest run is the least disturbed by the rest of the machine
+    records = min((profile("core.server") for _ in range(RUNS)), key=total_us)
+    total_ms = total_us(records) / 1000
+
+    slowest = sorted(records, key=lambda record: record.self_us, reverse=True)[:5]
+    assert total_ms <= BUDGET_MS, (
+        f"import core.server took {total_ms:.1f}ms, over the {BUDGET_MS:.0f}ms "
+        f"budget. Slowest modules: "
+        + ", ".join(f"{r.module} {r.self_us / 1000:.1f}ms" for r in slowest)
+    )
@@ -0,0 +1,73 @@
+import pytest
+
+from core.cache import lru
+from core.cache.lru import LRUCache
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(lru.time, "monotonic", lambda: now[0])
+    return now
+
+
+def test_evicts_the_least_recently_used_entry():
+    cache = LRUCache(maxsize=2)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.get("a")
+    cache.set("c", 3)
+
+    assert cache.get("a") == 1
+    assert cache.get("b") is None
+    assert cache.get("c") == 3
+    assert len(cache) == 2
+
+
+def test_entries_expire_after_the_ttl(clock):
+    cache = LRUCache(ttl=10)
+    cache.set("a", 1)
+
+    clock[0] += 9.9
+    assert cache.get("a") == 1
+    clock[0] += 0.1
+    assert cache.get("a") is None
+    assert len(cache) == 0
+
+
+def test_ttl_per_entry_overrides_the_default(clock):
+    cache = LRUCache(ttl=10)
+    cache.set("short", 1, ttl=1)
+    cache.set("forever", 2)
+
+    clock[0] += 5
+    assert cache.get("short") is None
+    assert cache.get("forever") == 2
+
+
+def test_delete_and_clear():
+    cache = LRUCache()
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.delete("a")
+    cache.delete("missing")
+
+    assert cache.get("a") is None
+    cache.clear()
+    assert len(cache) == 0
+
+
+def test_stats_count_hits_and_misses():
+    cache = LRUCache(maxsize=8)
+    cache.set("a", 1)
+    cache.get("a")
+    cache.get("a")
+    cache.get("b")
+
+    assert cache.stats() == {
+        "size": 1,
+        "maxsize": 8,
+        "hits": 2,
+        "misses": 1,
+        "hit_ratio": 2 / 3,
+    }
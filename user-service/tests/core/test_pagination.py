@@ -0,0 +1,50 @@
+import base64
+from datetime import datetime, timezone
+
+import pytest
+
+from app.models import User
+from core.repository.pagination import decode_cursor, encode_cursor
+
+COLUMNS = [User.created_at, User.id]
+
+
+def raw_cursor(payload: str) -> str:
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+
+def test_round_trip_restores_the_column_types():
+    created_at = datetime(2024, 11, 20, 8, 30, 15, 123456, tzinfo=timezone.utc)
+    cursor = encode_cursor([created_at, 42])
+
+    assert "=" not in cursor
+    assert decode_cursor(cursor, COLUMNS) == [created_at, 42]
+
+
+def test_numeric_strings_are_converted():
+    cursor = raw_cursor('["2024-11-20T08:30:15", "42"]')
+    assert decode_cursor(cursor, COLUMNS) == [datetime(2024, 11, 20, 8, 30, 15), 42]
+
+
+@pytest.mark.parametrize(
+    "cursor",
+    [
+        "",
+        "!!!",
+        raw_cursor("not json"),
+        raw_cursor('{"id": 1}'),
+        raw_cursor("[1]"),
+        raw_cursor('["2024-11-20", 1, 2]'),
+        raw_cursor('["yesterday", 1]'),
+        raw_cursor('["2024-11-20", "abc"]'),
+        raw_cursor('["2024-11-20", null]'),
+        raw_cursor('[null, 1]'),
+        raw_cursor('["2024-11-20", [1]]'),
+        raw_cursor('["2024-11-20", {"a": 1}]'),
+        raw_cursor('["2024-11-20", 1e400]'),
+        raw_cursor('[1, 1]'),
+    ],
+)
+def test_malformed_cursors_raise_value_error(cursor):
+    with pytest.raises(ValueError, match="Malformed cursor"):
+        decode_cursor(cursor, COLUMNS)
@@ -0,0 +1,103 @@
+"""
+Query-plan regression check for the repository hot paths.
+
+Runs each hot repository call against the test database, captures the SQL it
+emits and EXPLAINs it with sequential scans disabled. A query that still plans
+a ``Seq Scan`` has no usable index and fails the test.
+
+Apply the migrations to the test database first (``alembic upgrade head``).
+Skipped when ``TEST_POSTGRES_URL`` cannot be reached.
+"""
+
+import asyncio
+import json
+from typing import Any, Dict, List, Tuple
+from uuid import uuid4
+
+import pytest
+from sqlalchemy import event
+from sqlalchemy.engine import make_url
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+
+from app.models import Address, User
+from app.repositories import AddressRepository, UserRepository
+from core.config import config
+
+CONNECT_TIMEOUT = 2
+
+HOT_PATHS = {
+    "users.get_by(id)": lambda users, addresses: users.get_by("id", 1),
+    "users.get_by(uuid)": lambda users, addresses: users.get_by("uuid", uuid4()),
+    "users.get_by_email": lambda users, addresses: (
+        users.get_by_email("john.doe@example.com")
+    ),
+    "users.get_by_username": lambda users, addresses: (
+        users.get_by_username("john.doe")
+    ),
+    "address.get_by(uuid)": lambda users, addresses: (
+        addresses.get_by("uuid", uuid4())
+    ),
+    "address.get_by_user_address": lambda users, addresses: (
+        addresses.get_by_user_address(1)
+    ),
+    "address.get_by_user_address_page": lambda users, addresses: (
+        addresses.get_by_user_address_page(1, cursor="WzEwMF0")
+    ),
+}
+
+
+def sequential_scans(plan: Dict[str, Any]) -> List[str]:
+    found = []
+    if plan.get("Node Type") == "Seq Scan":
+        found.append(plan.get("Relation Name", "?"))
+    for child in plan.get("Plans", []):
+        found.extend(sequential_scans(child))
+    return found
+
+
+@pytest.fixture
+async def connection():
+    engine = create_async_engine(
+        make_url(config.TEST_POSTGRES_URL).set(drivername="postgresql+asyncpg"),
+        connect_args={"timeout": CONNECT_TIMEOUT},
+    )
+    try:
+        connection = await engine.connect()
+    except (OSError, asyncio.TimeoutError, SQLAlchemyError) as exception:
+        await engine.dispose()
+        pytest.skip(f"TEST_POSTGRES_URL is unreachable: {exception}")
+
+    # With seq scans priced out, the planner only picks one when no index fits
+    await connection.exec_driver_sql("SET enable_seqscan = off")
+    yield connection
+    await connection.close()
+    await engine.dispose()
+
+
+@pytest.mark.parametrize("name", HOT_PATHS)
+async def test_hot_path_uses_an_index(connection, name):
+    session = AsyncSession(bind=connection)
+    call = HOT_PATHS[name](
+        UserRepository(User, session), AddressRepository(Address, session)
+    )
+    captured: List[Tuple[str, Any]] = []
+
+    def capture(conn, cursor, statement, parameters, context, executemany):
+        captured.append((statement, parameters))
+
+    event.listen(connection.sync_engine, "before_cursor_execute", capture)
+    try:
+        await call
+    finally:
+        event.remove(connection.sync_engine, "before_cursor_execute", capture)
+        await session.close()
+
+    assert captured
+    for statement, parameters in captured:
+        result = await connection.exec_driver_sql(
+            f"EXPLAIN (FORMAT JSON) {statement}", parameters
+        )
+        plan = result.scalar()
+        plan = json.loads(plan) if isinstance(plan, str) else plan
+        assert sequential_scans(plan[0]["Plan"]) == [], statement
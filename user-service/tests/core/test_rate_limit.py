@@ -0,0 +1,118 @@
+from ipaddress import ip_network
+
+import pytest
+from starlette.requests import Request
+
+from core.exceptions import TooManyRequestsException
+from core.fastapi.dependencies import rate_limit
+from core.rate_limit import RateLimitManager, memory_backend
+from core.rate_limit.memory_backend import InMemoryRateLimitBackend
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(memory_backend.time, "monotonic", lambda: now[0])
+    return now
+
+
+async def test_allows_up_to_the_limit_then_returns_the_wait(clock):
+    backend = InMemoryRateLimitBackend()
+    for _ in range(3):
+        assert await backend.hit("ip:1", limit=3, window=60) == 0.0
+        clock[0] += 10
+
+    # The oldest hit, at 1000, leaves the window at 1060
+    assert await backend.hit("ip:1", limit=3, window=60) == pytest.approx(30)
+
+
+async def test_window_slides_one_hit_at_a_time(clock):
+    backend = InMemoryRateLimitBackend()
+    for _ in range(3):
+        await backend.hit("ip:1", limit=3, window=60)
+        clock[0] += 10
+
+    clock[0] = 1060
+    assert await backend.hit("ip:1", limit=3, window=60) == 0.0
+    # Hits at 1010, 1020 and 1060 remain, the next slot opens at 1070
+    assert await backend.hit("ip:1", limit=3, window=60) == pytest.approx(10)
+
+
+async def test_rejected_hits_are_not_recorded(clock):
+    backend = InMemoryRateLimitBackend()
+    await backend.hit("ip:1", limit=1, window=60)
+    for _ in range(5):
+        clock[0] += 10
+        await backend.hit("ip:1", limit=1, window=60)
+
+    clock[0] = 1060
+    assert await backend.hit("ip:1", limit=1, window=60) == 0.0
+
+
+async def test_keys_are_counted_separately(clock):
+    backend = InMemoryRateLimitBackend()
+    assert await backend.hit("ip:1", limit=1, window=60) == 0.0
+    assert await backend.hit("ip:2", limit=1, window=60) == 0.0
+    assert await backend.hit("ip:1", limit=1, window=60) > 0
+
+
+async def test_least_recently_used_keys_are_dropped(clock):
+    backend = InMemoryRateLimitBackend(max_keys=2)
+    await backend.hit("a", limit=1, window=60)
+    await backend.hit("b", limit=1, window=60)
+    await backend.hit("a", limit=1, window=60)
+    await backend.hit("c", limit=1, window=60)
+
+    # "a" was used more recently than "b" and kept, "b" was dropped with its hit
+    assert await backend.hit("a", limit=1, window=60) > 0
+    assert await backend.hit("b", limit=1, window=60) == 0.0
+
+
+@pytest.fixture
+def trusted_proxies(monkeypatch):
+    monkeypatch.setattr(rate_limit, "TRUSTED_PROXIES", [ip_network("10.0.0.0/8")])
+
+
+def make_request(host, *forwarded):
+    headers = [(b"x-forwarded-for", hops.encode()) for hops in forwarded]
+    return Request({"type": "http", "client": (host, 1234), "headers": headers})
+
+
+@pytest.mark.parametrize(
+    "host, forwarded, expected",
+    [
+        ("203.0.113.7", ["198.51.100.1"], "203.0.113.7"),
+        ("10.0.0.1", ["203.0.113.7"], "203.0.113.7"),
+        ("10.0.0.1", ["198.51.100.1, 203.0.113.7, 10.0.0.2"], "203.0.113.7"),
+        ("10.0.0.1", ["198.51.100.1", "203.0.113.7"], "203.0.113.7"),
+        ("10.0.0.1", ["10.0.0.3, 10.0.0.2"], "10.0.0.3"),
+        ("10.0.0.1", [], "10.0.0.1"),
+    ],
+    ids=[
+        "untrusted peer",
+        "one proxy",
+        "spoofed hops",
+        "repeated header",
+        "only proxies",
+        "no header",
+    ],
+)
+def test_client_ip_skips_only_trusted_hops(trusted_proxies, host, forwarded, expected):
+    assert rate_limit.client_ip(make_request(host, *forwarded)) == expected
+
+
+async def test_manager_rejects_over_the_limit(clock):
+    limiter = RateLimitManager()
+    await limiter.hit("login_ip", "a", limit=1, window=60)
+
+    with pytest.raises(TooManyRequestsException):
+        await limiter.hit("login_ip", "a", limit=1, window=60)
+    assert limiter.stats() == {"login_ip_allowed": 1, "login_ip_rejected": 1}
+
+
+async def test_a_limit_of_zero_disables_the_check(clock):
+    limiter = RateLimitManager()
+    for _ in range(3):
+        await limiter.hit("login_ip", "a", limit=0, window=60)
+
+    assert limiter.stats() == {}
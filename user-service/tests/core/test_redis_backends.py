@@ -0,0 +1,81 @@
+import asyncio
+import time
+
+import pytest
+from redis.exceptions import RedisError
+
+from core.cache import CacheManager, RedisBackend
+from core.rate_limit import RateLimitManager, RedisRateLimitBackend
+from core.security.revocation import RedisRevocationStore, RevocationManager
+
+TIMEOUT = 0.2
+
+
+@pytest.fixture
+async def silent_redis():
+    """A server that accepts connections and never answers, like a hung Redis."""
+    writers = []
+
+    async def accept(reader, writer):
+        writers.append(writer)
+
+    server = await asyncio.start_server(accept, "127.0.0.1", 0)
+    port = server.sockets[0].getsockname()[1]
+    yield f"redis://127.0.0.1:{port}/0"
+    for writer in writers:
+        writer.close()
+    server.close()
+    await server.wait_closed()
+
+
+async def test_cache_treats_an_unresponsive_redis_as_a_miss(silent_redis):
+    cache = CacheManager()
+    cache.init(
+        RedisBackend(
+            silent_redis, socket_timeout=TIMEOUT, socket_connect_timeout=TIMEOUT
+        )
+    )
+
+    started = time.perf_counter()
+    assert await cache.get("key") is None
+    await cache.set("key", {"a": 1})
+    assert time.perf_counter() - started < TIMEOUT * 10
+    await cache.close()
+
+
+async def test_rate_limiter_lets_logins_through_an_unresponsive_redis(silent_redis):
+    limiter = RateLimitManager()
+    limiter.init(
+        RedisRateLimitBackend(
+            silent_redis,
+            prefix="test",
+            socket_timeout=TIMEOUT,
+            socket_connect_timeout=TIMEOUT,
+        )
+    )
+
+    started = time.perf_counter()
+    await limiter.hit("login_ip", "127.0.0.1", limit=1, window=60)
+    assert time.perf_counter() - started < TIMEOUT * 10
+    assert limiter.stats() == {"errors": 1}
+    await limiter.close()
+
+
+async def test_revocation_fails_closed_on_an_unresponsive_redis(silent_redis):
+    revocations = RevocationManager()
+    revocations.init(
+        RedisRevocationStore(
+            silent_redis,
+            prefix="test",
+            socket_timeout=TIMEOUT,
+            socket_connect_timeout=TIMEOUT,
+        )
+    )
+    revocations.bloom.add("jti")
+
+    started = time.perf_counter()
+    assert await revocations.is_revoked("jti") is True
+    with pytest.raises(RedisError):
+        await revocations.refresh()
+    assert time.perf_counter() - started < TIMEOUT * 10
+    await revocations.close()
@@ -0,0 +1,81 @@
+import time
+
+import pytest
+
+from core.security.revocation import InMemoryRevocationStore, RevocationManager
+
+
+@pytest.fixture
+def revocations():
+    manager = RevocationManager()
+    manager.init(InMemoryRevocationStore(), capacity=1000)
+    return manager
+
+
+def expires_in(seconds):
+    return time.time() + seconds
+
+
+async def test_revoked_ids_are_found_locally_and_in_the_store(revocations):
+    await revocations.revoke("jti", expires_in(60))
+
+    assert revocations.maybe_revoked("jti")
+    assert await revocations.is_revoked("jti")
+    assert await revocations.is_revoked("jti", use_filter=False)
+
+
+async def test_ids_the_filter_clears_are_not_looked_up(revocations):
+    assert not await revocations.is_revoked("other")
+
+    assert revocations.stats()["local_negatives"] == 1
+    assert revocations.stats()["store_lookups"] == 0
+
+
+async def test_revocations_by_another_worker_need_the_store(revocations):
+    # Recorded by another worker, this one's filter has not been refreshed
+    await revocations.store.revoke("jti", expires_in(60))
+
+    assert not await revocations.is_revoked("jti")
+    assert await revocations.is_revoked("jti", use_filter=False)
+
+    await revocations.refresh()
+    assert await revocations.is_revoked("jti")
+
+
+async def test_a_token_can_be_claimed_once(revocations):
+    assert await revocations.claim("jti", expires_in(60))
+    assert not await revocations.claim("jti", expires_in(60))
+    assert await revocations.is_revoked("jti")
+
+
+async def test_a_revoked_token_cannot_be_claimed(revocations):
+    await revocations.revoke("jti", expires_in(60))
+
+    assert not await revocations.claim("jti", expires_in(60))
+
+
+async def test_expired_tokens_are_neither_recorded_nor_claimed(revocations):
+    await revocations.revoke("expired", expires_in(-1))
+
+    assert not await revocations.claim("expired", expires_in(-1))
+    assert await revocations.store.revoked() == []
+
+
+async def test_entries_are_dropped_once_their_token_expires(revocations):
+    await revocations.store.revoke("jti", expires_in(-1))
+
+    assert not await revocations.is_revoked("jti", use_filter=False)
+
+
+async def test_refresh_keeps_ids_revoked_while_it_reads_the_store(revocations):
+    revoked = revocations.store.revoked
+
+    async def revoke_while_reading():
+        ids = await revoked()
+        await revocations.revoke("concurrent", expires_in(60))
+        return ids
+
+    revocations.store.revoked = revoke_while_reading
+    await revocations.refresh()
+
+    assert revocations.maybe_revoked("concurrent")
@@ -0,0 +1,53 @@
+from types import SimpleNamespace
+from uuid import uuid4
+
+from pydantic import BaseModel, Field
+
+from core.fastapi.serializers import Serializer
+
+
+class UserSchema(BaseModel):
+    uuid: object
+    email: str
+    username: str = Field(..., serialization_alias="name")
+
+
+class IdSchema(BaseModel):
+    uuid: object
+
+
+def make_user(**overrides):
+    fields = {"uuid": uuid4(), "email": "john@example.com", "username": "john"}
+    fields.update(overrides)
+    # Attributes outside the schema, like the password, are never read
+    return SimpleNamespace(password="hash", **fields)
+
+
+def test_dump_uses_the_schema_fields_and_aliases():
+    user = make_user()
+    assert Serializer(UserSchema).dump(user) == {
+        "uuid": user.uuid,
+        "email": "john@example.com",
+        "name": "john",
+    }
+
+
+def test_dump_with_a_single_field():
+    user = make_user()
+    assert Serializer(IdSchema).dump(user) == {"uuid": user.uuid}
+
+
+def test_dump_many_keeps_the_order():
+    users = [make_user(username=f"user-{index}") for index in range(3)]
+    dumped = Serializer(UserSchema).dump_many(users)
+
+    assert [item["name"] for item in dumped] == ["user-0", "user-1", "user-2"]
+    assert Serializer(UserSchema).dump_many([]) == []
+
+
+def test_dump_matches_the_validated_schema():
+    user = make_user()
+    expected = UserSchema.model_validate(user, from_attributes=True).model_dump(
+        by_alias=True
+    )
+    assert Serializer(UserSchema).dump(user) == expected
@@ -0,0 +1,155 @@
+import pytest
+from sqlalchemy import select
+
+from core.database import Propagation, Transactional, session
+from core.database.session import readers
+from tests.utils.database import Item, sqlite_engine
+
+
+@pytest.fixture
+async def reader(tmp_path, monkeypatch, writer):
+    """A replica that never catches up with the writer."""
+    engine = await sqlite_engine(tmp_path / "reader.db")
+    monkeypatch.setattr(readers, "healthy", [engine])
+    yield engine
+    await engine.dispose()
+
+
+@pytest.fixture
+def commits(monkeypatch):
+    count = [0]
+    commit = session.commit
+
+    async def counting_commit():
+        count[0] += 1
+        await commit()
+
+    monkeypatch.setattr(session, "commit", counting_commit)
+    return count
+
+
+async def stored(engine):
+    """Names committed so far, read on a connection of its own."""
+    async with engine.connect() as connection:
+        result = await connection.execute(select(Item.name).order_by(Item.id))
+        return list(result.scalars())
+
+
+def create(propagation=Propagation.REQUIRED):
+    @Transactional(propagation=propagation)
+    async def create_item(name):
+        session.add(Item(name=name))
+        await session.flush()
+
+    return create_item
+
+
+async def test_required_commits_the_outermost_unit(writer, commits):
+    await create()("a")
+
+    assert await stored(writer) == ["a"]
+    assert commits[0] == 1
+
+
+async def test_nested_required_units_commit_once(writer, commits):
+    @Transactional()
+    async def outer():
+        await create()("a")
+        assert await stored(writer) == []
+        await create()("b")
+
+    await outer()
+
+    assert await stored(writer) == ["a", "b"]
+    assert commits[0] == 1
+
+
+async def test_failure_rolls_back_the_whole_unit(writer):
+    @Transactional()
+    async def outer():
+        await create()("a")
+        raise RuntimeError("fail")
+
+    with pytest.raises(RuntimeError):
+        await outer()
+
+    assert await stored(writer) == []
+
+
+async def test_required_new_outermost_commits(writer, commits):
+    await create(Propagation.REQUIRED_NEW)("a")
+
+    assert await stored(writer) == ["a"]
+    assert commits[0] == 1
+
+
+async def test_nested_required_new_rolls_back_only_its_savepoint(writer, commits):
+    @Transactional(propagation=Propagation.REQUIRED_NEW)
+    async def failing():
+        await create()("inner")
+        raise RuntimeError("fail")
+
+    @Transactional()
+    async def outer():
+        await create()("before")
+        with pytest.raises(RuntimeError):
+            await failing()
+        await create()("after")
+
+    await outer()
+
+    assert await stored(writer) == ["before", "after"]
+    assert commits[0] == 1
+
+
+async def test_read_only_does_not_commit(writer, commits):
+    await create(Propagation.READ_ONLY)("a")
+
+    assert commits[0] == 0
+    await session.rollback()
+    assert await stored(writer) == []
+
+
+async def test_read_only_joins_a_running_unit(writer, commits):
+    @Transactional()
+    async def outer():
+        await create(Propagation.READ_ONLY)("a")
+
+    await outer()
+
+    assert await stored(writer) == ["a"]
+    assert commits[0] == 1
+
+
+async def test_writing_unit_inside_read_only_commits_on_its_own(writer, commits):
+    @Transactional(propagation=Propagation.READ_ONLY)
+    async def outer():
+        await create()("a")
+        assert await stored(writer) == ["a"]
+
+    await outer()
+
+    assert commits[0] == 1
+
+
+async def test_read_only_reads_from_a_replica(writer, reader):
+    @Transactional(propagation=Propagation.READ_ONLY)
+    async def read():
+        result = await session.execute(select(Item.name))
+        return list(result.scalars())
+
+    async with writer.begin() as connection:
+        await connection.execute(Item.__table__.insert().values(name="a"))
+
+    assert await read() == []
+
+
+async def test_read_only_stays_on_the_writer_after_a_write(writer, reader):
+    @Transactional(propagation=Propagation.READ_ONLY)
+    async def read():
+        result = await session.execute(select(Item.name))
+        return list(result.scalars())
+
+    await create()("a")
+
+    assert await read() == ["a"]